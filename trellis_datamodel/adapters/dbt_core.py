@@ -5,6 +5,7 @@ Handles parsing dbt manifest.json/catalog.json and generating dbt schema YAML fi
 """
 
 import copy
+import functools
 import json
 import os
 import re
@@ -24,6 +25,61 @@ from .base import (
 )
 
 
+def _file_signature(path: str) -> tuple[int, int]:
+    """
+    Return (st_mtime_ns, st_size) of a file.
+
+    Raises:
+        OSError: If the file does not exist.
+    """
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_model_dirs(
+    project_path: str, model_paths: tuple[str, ...], cwd: str
+) -> tuple[str, ...]:
+    """
+    Normalize configured model paths to absolute directories.
+
+    Cached because the result only depends on config, while the adapter is
+    rebuilt and asks for it on every request. ``cwd`` is part of the key
+    since relative project paths resolve against it.
+    """
+    # Resolve the models root once; abspath() would call getcwd per entry.
+    models_root = os.path.normpath(os.path.join(cwd, project_path, "models"))
+
+    def _normalize(subdir: str) -> str:
+        # Absolute path - return as-is
+        if os.path.isabs(subdir):
+            return os.path.normpath(subdir).rstrip(os.sep)
+
+        # Remove leading "./"
+        while subdir.startswith("./"):
+            subdir = subdir[2:]
+
+        # Strip an optional leading "models/" so we don't double-prepend
+        prefix = f"models{os.sep}"
+        if subdir.startswith(prefix):
+            subdir = subdir[len(prefix) :]
+
+        return os.path.normpath(os.path.join(models_root, subdir)).rstrip(os.sep)
+
+    if model_paths:
+        # Remove duplicates while preserving order
+        seen = set()
+        normalized = []
+        for path in model_paths:
+            norm = _normalize(path)
+            if norm not in seen:
+                seen.add(norm)
+                normalized.append(norm)
+        return tuple(normalized)
+
+    return (models_root.rstrip(os.sep),)
+
+
 class DbtCoreAdapter:
     """Adapter for dbt-core transformation framework."""
 
@@ -76,39 +132,11 @@ class DbtCoreAdapter:
         Users may configure entries like "3_core", "models/3_entity", or absolute
         paths. We normalize these to real directories so downstream scans work.
         """
-
-        def _normalize(subdir: str) -> str:
-            # Absolute path - return as-is
-            if os.path.isabs(subdir):
-                return os.path.abspath(subdir).rstrip(os.sep)
-
-            # Remove leading "./"
-            while subdir.startswith("./"):
-                subdir = subdir[2:]
-
-            # Strip an optional leading "models/" so we don't double-prepend
-            prefix = f"models{os.sep}"
-            if subdir.startswith(prefix):
-                subdir = subdir[len(prefix) :]
-
-            return os.path.abspath(
-                os.path.join(self.project_path, "models", subdir)
-            ).rstrip(os.sep)
-
-        if self.model_paths:
-            # Remove duplicates while preserving order
-            seen = set()
-            normalized = []
-            for path in self.model_paths:
-                norm = _normalize(path)
-                if norm not in seen:
-                    seen.add(norm)
-                    normalized.append(norm)
-            return normalized
-
-        return [
-            os.path.abspath(os.path.join(self.project_path, "models")).rstrip(os.sep)
-        ]
+        return list(
+            _resolve_model_dirs(
+                self.project_path, tuple(self.model_paths or ()), os.getcwd()
+            )
+        )
 
     def _entity_to_model_name(self, entity: dict[str, Any]) -> str:
         """
@@ -1222,7 +1250,7 @@ class DbtCoreAdapter:
     # Performance optimization: Cache inference results to avoid re-scanning manifest
     # when model hasn't changed (reduces overhead on repeated calls).
     _inference_cache: dict[str, str] | None = None
-    _inference_cache_key: str | None = None
+    _inference_cache_key: tuple | None = None
 
     @classmethod
     def reset_inference_cache(cls) -> None:
@@ -1254,15 +1282,28 @@ class DbtCoreAdapter:
         if not cfg.DIMENSIONAL_MODELING_CONFIG.enabled:
             return entity_types
 
-        # Check cache to avoid re-scanning manifest if unchanged
-        manifest_path = self.manifest_path
-        import os
-
-        cache_key = f"{manifest_path}:{os.path.getmtime(manifest_path)}"
+        # Check cache to avoid re-scanning manifest if unchanged. The cache lives
+        # on the class because a new adapter is built for every request. Entity
+        # IDs come from the data model and types from the prefix config, so
+        # both are part of the key along with the manifest.
+        dimensional_config = cfg.DIMENSIONAL_MODELING_CONFIG
+        cache_key = (
+            self.manifest_path,
+            _file_signature(self.manifest_path),
+            self.data_model_path,
+            (
+                _file_signature(self.data_model_path)
+                if self.data_model_path and os.path.exists(self.data_model_path)
+                else None
+            ),
+            tuple(dimensional_config.dimension_prefix),
+            tuple(dimensional_config.fact_prefix),
+        )
 
-        if self._inference_cache_key == cache_key and self._inference_cache is not None:
-            print(f"Returning cached entity type inference results")
-            return self._inference_cache
+        cls = type(self)
+        cached = cls._inference_cache
+        if cls._inference_cache_key == cache_key and cached is not None:
+            return dict(cached)
 
         # Get models from manifest
         models = self.get_models()
@@ -1291,7 +1332,7 @@ class DbtCoreAdapter:
                 entity_types[entity_id] = "unclassified"
 
         # Cache results for future calls
-        self._inference_cache = entity_types
-        self._inference_cache_key = cache_key
+        cls._inference_cache = dict(entity_types)
+        cls._inference_cache_key = cache_key
 
         return entity_types
@@ -11,7 +11,7 @@ import os
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
-import yaml
+from trellis_datamodel.utils import yaml_sidecar
 
 logger = logging.getLogger(__name__)
 
@@ -123,8 +123,7 @@ else:
 def _load_yaml_config(path: str) -> dict[str, Any]:
     """Load YAML config, returning an empty dict on error."""
     try:
-        with open(path, "r") as f:
-            return yaml.safe_load(f) or {}
+        return yaml_sidecar.load_yaml(path) or {}
     except Exception as e:
         logger.warning("Error loading config file %s: %s", path, e)
         return {}
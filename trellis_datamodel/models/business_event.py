@@ -7,6 +7,12 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
+# Annotation categories (7 Ws) in canonical order.
+ANNOTATION_TYPES = ("who", "what", "when", "where", "how", "how_many", "why")
+VALID_ANNOTATION_TYPES = frozenset(ANNOTATION_TYPES)
+_SORTED_ANNOTATION_TYPES_MSG = ", ".join(sorted(ANNOTATION_TYPES))
+
+
 class BusinessEventType(str, Enum):
     """Business event type classification (BEAM* methodology)."""
 
@@ -170,10 +176,9 @@ class EntityDimensionMetadata(BaseModel):
         if v is None:
             return v
 
-        valid_types = {"who", "what", "when", "where", "how", "how_many", "why"}
-        if v not in valid_types:
+        if v not in VALID_ANNOTATION_TYPES:
             raise ValueError(
-                f"Invalid annotation_type '{v}'. Must be one of: {', '.join(sorted(valid_types))}"
+                f"Invalid annotation_type '{v}'. Must be one of: {_SORTED_ANNOTATION_TYPES_MSG}"
             )
 
         return v
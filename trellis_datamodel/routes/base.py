@@ -0,0 +1,51 @@
+"""Shared FastAPI route class and response helpers for API routers."""
+
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from trellis_datamodel.utils import json_utils
+
+
+class JSONRequest(Request):
+    """Request that decodes JSON bodies with orjson when it is installed."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            self._json = json_utils.loads(body)
+        return self._json
+
+
+class TrellisRoute(APIRoute):
+    """
+    APIRoute that hands handlers a JSONRequest.
+
+    Request bodies are still validated by the Pydantic request models; only
+    the bytes-to-dict decoding step is swapped for the faster decoder.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(
+                JSONRequest(request.scope, request.receive)
+            )
+
+        return route_handler
+
+
+def json_response(payload: Any, status_code: int = 200) -> Response:
+    """
+    Encode a JSON-compatible payload directly into a response.
+
+    Skips FastAPI's jsonable_encoder pass and encodes with orjson when it is
+    installed. Only use for payloads made of plain JSON types.
+    """
+    return Response(
+        content=json_utils.dumps(payload),
+        media_type="application/json",
+        status_code=status_code,
+    )
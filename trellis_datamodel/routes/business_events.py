@@ -1,17 +1,21 @@
 """Routes for business events operations."""
 
-from fastapi import APIRouter, HTTPException, Body
+import functools
+from typing import Any, Callable
+
+from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 from trellis_datamodel import config as cfg
 from trellis_datamodel.exceptions import (
-    ConfigurationError,
-    FileOperationError,
+    DomainError,
     ValidationError,
     NotFoundError,
     FeatureDisabledError,
 )
 from trellis_datamodel.models.business_event import (
+    VALID_ANNOTATION_TYPES,
     BusinessEvent,
     BusinessEventType,
     GeneratedEntitiesResult,
@@ -20,26 +24,46 @@ from trellis_datamodel.models.business_event import (
 )
 from trellis_datamodel.services.business_events_service import (
     load_business_events,
+    load_business_events_json,
+    load_processes_json,
+    get_unique_domains_json,
+    get_event_by_id,
+    get_events_by_ids,
     create_event,
     update_event,
     delete_event,
-    get_unique_domains,
     add_annotation_entry,
     remove_annotation_entry,
     update_annotation_entry,
-    load_processes,
+    get_process_by_id,
     create_process,
     update_process,
     resolve_process,
     attach_events_to_process,
     detach_events_from_process,
 )
+from trellis_datamodel.routes.base import TrellisRoute
+from trellis_datamodel.utils import json_utils
 from trellis_datamodel.services.entity_generator import (
     generate_entities_from_event,
     generate_entities_from_process,
 )
 
-router = APIRouter(prefix="/api", tags=["business-events"])
+
+def _check_feature_enabled():
+    """Check if business events feature is enabled."""
+    if not cfg.BUSINESS_EVENTS_ENABLED:
+        raise FeatureDisabledError("Business events feature is disabled")
+
+
+# The feature check runs once per request as a router dependency, before
+# request bodies are validated or any handler runs.
+router = APIRouter(
+    prefix="/api",
+    tags=["business-events"],
+    route_class=TrellisRoute,
+    dependencies=[Depends(_check_feature_enabled)],
+)
 
 
 class CreateEventRequest(BaseModel):
@@ -117,14 +141,80 @@ class DetachEventsRequest(BaseModel):
     event_ids: list[str]
 
 
-def _check_feature_enabled():
-    """Check if business events feature is enabled."""
-    if not cfg.BUSINESS_EVENTS_ENABLED:
-        raise FeatureDisabledError("Business events feature is disabled")
+class GenerateEntitiesBatchRequest(BaseModel):
+    """Request model for generating entities from several business events."""
+
+    event_ids: list[str]
+
+
+# Listed in the order this endpoint has always reported them
+_VALID_ANNOTATION_TYPES_MSG = ", ".join(
+    ("who", "what", "when", "where", "how", "why", "how_many")
+)
+
+
+def _model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize a service-layer model straight into a JSON response.
+
+    Service functions already return validated models, so this skips FastAPI's
+    response_model re-validation. The return annotations on the handlers still
+    document the response schema in OpenAPI.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+def _json_bytes_response(content: bytes) -> Response:
+    """Wrap already-encoded JSON in a response, bypassing response_model."""
+    return Response(content=content, media_type="application/json")
+
+
+def _translate_errors(action: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Translate exceptions raised by a handler into HTTP errors.
+
+    NotFoundError becomes a 404 and ValidationError a 400. HTTPExceptions and
+    other DomainErrors pass through unchanged so the app-level exception
+    handlers in server.py can map them. Anything else becomes a 500 whose
+    detail is prefixed with ``Error <action>``.
+
+    Args:
+        action: Description of the operation used in 500 error details
+
+    Returns:
+        Decorator for synchronous route handlers
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except NotFoundError as e:
+                raise HTTPException(status_code=404, detail=str(e))
+            except ValidationError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except DomainError:
+                raise
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500, detail=f"Error {action}: {str(e)}"
+                )
+
+        return wrapper
+
+    return decorator
 
 
 @router.get("/business-events/domains", response_model=list[str])
-async def get_business_event_domains():
+@_translate_errors("loading business event domains")
+def get_business_event_domains():
     """
     Return unique domain values from all business events for autocomplete.
 
@@ -135,24 +225,17 @@ async def get_business_event_domains():
         FeatureDisabledError: If business events feature is disabled
         FileOperationError: If file cannot be read
     """
-    _check_feature_enabled()
-
-    try:
-        domains = get_unique_domains()
-        return domains
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error loading business event domains: {str(e)}"
-        )
+    return _json_bytes_response(get_unique_domains_json())
 
 
 @router.get("/business-events", response_model=list[BusinessEvent])
-async def get_business_events():
+@_translate_errors("loading business events")
+def get_business_events():
     """
     Return all business events from business_events.yml.
 
+    The JSON body is encoded once per version of the file and reused.
+
     Returns:
         List of BusinessEvent objects
 
@@ -161,23 +244,14 @@ async def get_business_events():
         ConfigurationError: If path is not configured
         FileOperationError: If file cannot be read
     """
-    _check_feature_enabled()
-
-    try:
-        events = load_business_events()
-        return events
-    except ConfigurationError:
-        raise
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error loading business events: {str(e)}"
-        )
+    return _json_bytes_response(load_business_events_json())
 
 
-@router.post("/business-events", response_model=BusinessEvent, status_code=201)
-async def create_business_event(request: CreateEventRequest = Body(...)):
+@router.post("/business-events", status_code=201)
+@_translate_errors("creating business event")
+def create_business_event(
+    request: CreateEventRequest = Body(...),
+) -> BusinessEvent:
     """
     Create a new business event.
 
@@ -192,39 +266,29 @@ async def create_business_event(request: CreateEventRequest = Body(...)):
         ValidationError: If input is invalid
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
+    # Validate event type
     try:
-        # Validate event type
-        try:
-            event_type = BusinessEventType(request.type)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid event type: {request.type}. Must be one of: discrete, evolving, recurring",
-            )
-
-        event = create_event(request.text, event_type, domain=request.domain)
-
-        # If annotations provided, update the event with it
-        if request.annotations is not None:
-            event = update_event(
-                event.id, {"annotations": request.annotations.model_dump()}
-            )
-
-        return event
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
+        event_type = BusinessEventType(request.type)
+    except ValueError:
         raise HTTPException(
-            status_code=500, detail=f"Error creating business event: {str(e)}"
+            status_code=400,
+            detail=f"Invalid event type: {request.type}. Must be one of: discrete, evolving, recurring",
         )
 
+    event = create_event(
+        request.text,
+        event_type,
+        domain=request.domain,
+        annotations=request.annotations,
+    )
+    return _model_response(event, status_code=201)
+
 
-@router.put("/business-events/{event_id}", response_model=BusinessEvent)
-async def update_business_event(event_id: str, request: UpdateEventRequest = Body(...)):
+@router.put("/business-events/{event_id}")
+@_translate_errors("updating business event")
+def update_business_event(
+    event_id: str, request: UpdateEventRequest = Body(...)
+) -> BusinessEvent:
     """
     Update an existing business event.
 
@@ -241,41 +305,20 @@ async def update_business_event(event_id: str, request: UpdateEventRequest = Bod
         ValidationError: If updates are invalid
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
+    # Only fields the client sent are included; explicit nulls are skipped.
+    updates = {
+        field: value
+        for field, value in request.model_dump(exclude_unset=True).items()
+        if value is not None
+    }
 
-    try:
-        updates = {}
-        if request.text is not None:
-            updates["text"] = request.text
-        if request.type is not None:
-            updates["type"] = request.type
-        if request.domain is not None:
-            updates["domain"] = request.domain
-        if request.derived_entities is not None:
-            updates["derived_entities"] = request.derived_entities
-        if request.annotations is not None:
-            # Convert to dict if it's a BusinessEventAnnotations object
-            if isinstance(request.annotations, BusinessEventAnnotations):
-                updates["annotations"] = request.annotations.model_dump()
-            else:
-                updates["annotations"] = request.annotations
-
-        event = update_event(event_id, updates)
-        return event
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error updating business event: {str(e)}"
-        )
+    event = update_event(event_id, updates)
+    return _model_response(event)
 
 
 @router.delete("/business-events/{event_id}", status_code=204)
-async def delete_business_event(event_id: str):
+@_translate_errors("deleting business event")
+def delete_business_event(event_id: str):
     """
     Delete a business event.
 
@@ -288,27 +331,14 @@ async def delete_business_event(event_id: str):
         ValidationError: If event doesn't have required 7 Ws data
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
-    try:
-        delete_event(event_id)
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error deleting business event: {str(e)}"
-        )
+    delete_event(event_id)
 
 
-@router.post(
-    "/business-events/{event_id}/annotations",
-    response_model=BusinessEvent,
-)
-async def add_event_annotation_entry(
+@router.post("/business-events/{event_id}/annotations")
+@_translate_errors("adding annotation entry")
+def add_event_annotation_entry(
     event_id: str, request: AddAnnotationEntryRequest = Body(...)
-):
+) -> BusinessEvent:
     """
     Add a new entry to an annotation category in a business event.
 
@@ -325,43 +355,29 @@ async def add_event_annotation_entry(
         ValidationError: If annotation_type is invalid or text is empty
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
     # Validate annotation_type
-    valid_types = ["who", "what", "when", "where", "how", "why", "how_many"]
-    if request.annotation_type not in valid_types:
+    if request.annotation_type not in VALID_ANNOTATION_TYPES:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid annotation_type: '{request.annotation_type}'. Must be one of: {', '.join(valid_types)}",
+            detail=f"Invalid annotation_type: '{request.annotation_type}'. Must be one of: {_VALID_ANNOTATION_TYPES_MSG}",
         )
 
-    try:
-        event = add_annotation_entry(
-            event_id,
-            request.annotation_type,
-            request.text,
-            dimension_id=request.dimension_id,
-            description=request.description,
-            attributes=request.attributes,
-        )
-        return event
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error adding annotation entry: {str(e)}"
-        )
+    event = add_annotation_entry(
+        event_id,
+        request.annotation_type,
+        request.text,
+        dimension_id=request.dimension_id,
+        description=request.description,
+        attributes=request.attributes,
+    )
+    return _model_response(event)
 
 
-@router.delete(
-    "/business-events/{event_id}/annotations/{entry_id}",
-    response_model=BusinessEvent,
-)
-async def remove_event_annotation_entry(event_id: str, entry_id: str):
+@router.delete("/business-events/{event_id}/annotations/{entry_id}")
+@_translate_errors("removing annotation entry")
+def remove_event_annotation_entry(
+    event_id: str, entry_id: str
+) -> BusinessEvent:
     """
     Remove an annotation entry from a business event.
 
@@ -377,28 +393,15 @@ async def remove_event_annotation_entry(event_id: str, entry_id: str):
         NotFoundError: If event or entry not found
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
-    try:
-        event = remove_annotation_entry(event_id, entry_id)
-        return event
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error removing annotation entry: {str(e)}"
-        )
+    event = remove_annotation_entry(event_id, entry_id)
+    return _model_response(event)
 
 
-@router.put(
-    "/business-events/{event_id}/annotations/{entry_id}",
-    response_model=BusinessEvent,
-)
-async def update_event_annotation_entry(
+@router.put("/business-events/{event_id}/annotations/{entry_id}")
+@_translate_errors("updating annotation entry")
+def update_event_annotation_entry(
     event_id: str, entry_id: str, request: UpdateAnnotationEntryRequest = Body(...)
-):
+) -> BusinessEvent:
     """
     Update an existing annotation entry in a business event.
 
@@ -416,35 +419,22 @@ async def update_event_annotation_entry(
         ValidationError: If text is invalid
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
-    try:
-        event = update_annotation_entry(
-            event_id,
-            entry_id,
-            text=request.text,
-            dimension_id=request.dimension_id,
-            description=request.description,
-            attributes=request.attributes,
-        )
-        return event
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error updating annotation entry: {str(e)}"
-        )
+    event = update_annotation_entry(
+        event_id,
+        entry_id,
+        text=request.text,
+        dimension_id=request.dimension_id,
+        description=request.description,
+        attributes=request.attributes,
+    )
+    return _model_response(event)
 
 
-@router.post(
-    "/business-events/{event_id}/generate-entities",
-    response_model=GeneratedEntitiesResult,
-)
-async def generate_entities_from_business_event(event_id: str):
+@router.post("/business-events/{event_id}/generate-entities")
+@_translate_errors("generating entities")
+def generate_entities_from_business_event(
+    event_id: str,
+) -> GeneratedEntitiesResult:
     """
     Generate dimensional entities from a business event with annotations.
 
@@ -460,40 +450,67 @@ async def generate_entities_from_business_event(event_id: str):
         ValidationError: If event doesn't have required annotations
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
+    event = get_event_by_id(event_id)
+    if event is None:
+        raise HTTPException(
+            status_code=404, detail=f"Business event '{event_id}' not found"
+        )
 
-    try:
-        events = load_business_events()
-        event = None
-        for e in events:
-            if e.id == event_id:
-                event = e
-                break
+    result = generate_entities_from_event(event)
+    return _model_response(result)
 
-        if event is None:
-            raise HTTPException(
-                status_code=404, detail=f"Business event '{event_id}' not found"
-            )
 
-        result = generate_entities_from_event(event)
-        return result
-    except NotFoundError:
-        raise
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
+@router.post("/business-events/generate-entities")
+@_translate_errors("generating entities")
+def generate_entities_from_business_events(
+    request: GenerateEntitiesBatchRequest = Body(...),
+) -> list[GeneratedEntitiesResult]:
+    """
+    Generate dimensional entities from several business events at once.
+
+    All events are resolved with a single load of business_events.yml, so
+    bulk generation costs one request instead of one per event.
+
+    Args:
+        request: GenerateEntitiesBatchRequest with event_ids list
+
+    Returns:
+        One GeneratedEntitiesResult per requested event, in request order
+
+    Raises:
+        FeatureDisabledError: If business events feature is disabled
+        NotFoundError: If any event not found
+        ValidationError: If an event doesn't have required annotations
+        FileOperationError: If file operations fail
+    """
+    if not request.event_ids:
+        raise HTTPException(
+            status_code=400, detail="event_ids list cannot be empty"
+        )
+
+    events = get_events_by_ids(request.event_ids)
+    invalid_ids = [eid for eid in request.event_ids if eid not in events]
+    if invalid_ids:
         raise HTTPException(
-            status_code=500, detail=f"Error generating entities: {str(e)}"
+            status_code=404,
+            detail=f"Events not found: {', '.join(invalid_ids)}",
         )
 
+    results = [
+        generate_entities_from_event(events[event_id]).model_dump(mode="json")
+        for event_id in request.event_ids
+    ]
+    return _json_bytes_response(json_utils.dumps(results))
+
 
 @router.get("/processes", response_model=list[BusinessEventProcess])
-async def get_processes():
+@_translate_errors("loading processes")
+def get_processes():
     """
     Return all business event processes from business_events.yml.
 
+    The JSON body is encoded once per version of the file and reused.
+
     Returns:
         List of BusinessEventProcess objects
 
@@ -501,21 +518,14 @@ async def get_processes():
         FeatureDisabledError: If business events feature is disabled
         FileOperationError: If file cannot be read
     """
-    _check_feature_enabled()
-
-    try:
-        processes = load_processes()
-        return processes
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error loading processes: {str(e)}"
-        )
+    return _json_bytes_response(load_processes_json())
 
 
-@router.post("/processes", response_model=BusinessEventProcess, status_code=201)
-async def create_business_event_process(request: CreateProcessRequest = Body(...)):
+@router.post("/processes", status_code=201)
+@_translate_errors("creating process")
+def create_business_event_process(
+    request: CreateProcessRequest = Body(...),
+) -> BusinessEventProcess:
     """
     Create a new business event process.
 
@@ -531,63 +541,56 @@ async def create_business_event_process(request: CreateProcessRequest = Body(...
         NotFoundError: If any event_id doesn't exist
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
+    # Validate process type
     try:
-        # Validate process type
-        try:
-            process_type = BusinessEventType(request.type)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid process type: {request.type}. Must be one of: discrete, evolving, recurring",
-            )
+        process_type = BusinessEventType(request.type)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid process type: {request.type}. Must be one of: discrete, evolving, recurring",
+        )
 
-        # Validate event_ids if provided
-        if request.event_ids:
-            events = load_business_events()
-            existing_event_ids = {e.id for e in events}
+    # Validate event_ids if provided
+    events = None
+    if request.event_ids:
+        events = load_business_events()
+        requested_ids = frozenset(request.event_ids)
+        existing_event_ids = {e.id for e in events}
+        if not requested_ids <= existing_event_ids:
             invalid_ids = [
                 eid for eid in request.event_ids if eid not in existing_event_ids
             ]
-            if invalid_ids:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Events not found: {', '.join(invalid_ids)}",
+            )
+
+        # Check if events are already in another process
+        for event in events:
+            if event.id in requested_ids and event.process_id is not None:
                 raise HTTPException(
-                    status_code=404,
-                    detail=f"Events not found: {', '.join(invalid_ids)}",
+                    status_code=400,
+                    detail=f"Event '{event.id}' is already attached to process '{event.process_id}'",
                 )
 
-            # Check if events are already in another process
-            for event in events:
-                if event.id in request.event_ids and event.process_id is not None:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Event '{event.id}' is already attached to process '{event.process_id}'",
-                    )
-
-        if not request.domain or not request.domain.strip():
-            raise HTTPException(status_code=400, detail="Process domain is required")
-
-        process = create_process(
-            request.name,
-            process_type,
-            request.domain.strip(),
-            event_ids=request.event_ids,
-        )
-        return process
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating process: {str(e)}")
-
-
-@router.put("/processes/{process_id}", response_model=BusinessEventProcess)
-async def update_business_event_process(
+    if not request.domain or not request.domain.strip():
+        raise HTTPException(status_code=400, detail="Process domain is required")
+
+    process = create_process(
+        request.name,
+        process_type,
+        request.domain.strip(),
+        event_ids=request.event_ids,
+        events=events,
+    )
+    return _model_response(process, status_code=201)
+
+
+@router.put("/processes/{process_id}")
+@_translate_errors("updating process")
+def update_business_event_process(
     process_id: str, request: UpdateProcessRequest = Body(...)
-):
+) -> BusinessEventProcess:
     """
     Update an existing business event process.
 
@@ -604,57 +607,47 @@ async def update_business_event_process(
         ValidationError: If updates are invalid or process is resolved
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
-    try:
-        updates = {}
-        if request.name is not None:
-            updates["name"] = request.name
-        if request.type is not None:
-            # Validate process type
-            try:
-                BusinessEventType(request.type)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid process type: {request.type}. Must be one of: discrete, evolving, recurring",
-                )
-            updates["type"] = request.type
+    updates = {}
+    if request.name is not None:
+        updates["name"] = request.name
+    if request.type is not None:
+        # Validate process type
+        try:
+            BusinessEventType(request.type)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid process type: {request.type}. Must be one of: discrete, evolving, recurring",
+            )
+        updates["type"] = request.type
 
-        if request.domain is not None:
-            if not request.domain.strip():
-                raise HTTPException(
-                    status_code=400, detail="Process domain cannot be empty"
-                )
-            updates["domain"] = request.domain.strip()
+    if request.domain is not None:
+        if not request.domain.strip():
+            raise HTTPException(
+                status_code=400, detail="Process domain cannot be empty"
+            )
+        updates["domain"] = request.domain.strip()
 
-        if request.annotations_superset is not None:
-            updates["annotations_superset"] = request.annotations_superset.model_dump()
+    if request.annotations_superset is not None:
+        updates["annotations_superset"] = request.annotations_superset.model_dump()
 
-        if request.event_ids is not None:
-            if len(request.event_ids) == 0:
-                raise HTTPException(
-                    status_code=400, detail="event_ids list cannot be empty"
-                )
-            updates["event_ids"] = request.event_ids
+    if request.event_ids is not None:
+        if len(request.event_ids) == 0:
+            raise HTTPException(
+                status_code=400, detail="event_ids list cannot be empty"
+            )
+        updates["event_ids"] = request.event_ids
 
-        if not updates:
-            raise HTTPException(status_code=400, detail="No fields provided to update")
+    if not updates:
+        raise HTTPException(status_code=400, detail="No fields provided to update")
 
-        process = update_process(process_id, updates)
-        return process
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error updating process: {str(e)}")
+    process = update_process(process_id, updates)
+    return _model_response(process)
 
 
-@router.post("/processes/{process_id}/resolve", response_model=BusinessEventProcess)
-async def resolve_business_event_process(process_id: str):
+@router.post("/processes/{process_id}/resolve")
+@_translate_errors("resolving process")
+def resolve_business_event_process(process_id: str) -> BusinessEventProcess:
     """
     Resolve (ungroup) a business event process.
 
@@ -670,27 +663,15 @@ async def resolve_business_event_process(process_id: str):
         ValidationError: If process is already resolved
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
-    try:
-        process = resolve_process(process_id)
-        return process
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error resolving process: {str(e)}"
-        )
+    process = resolve_process(process_id)
+    return _model_response(process)
 
 
-@router.post("/processes/{process_id}/attach", response_model=BusinessEventProcess)
-async def attach_events_to_business_event_process(
+@router.post("/processes/{process_id}/attach")
+@_translate_errors("attaching events to process")
+def attach_events_to_business_event_process(
     process_id: str, request: AttachEventsRequest = Body(...)
-):
+) -> BusinessEventProcess:
     """
     Attach events to a business event process.
 
@@ -707,44 +688,34 @@ async def attach_events_to_business_event_process(
         ValidationError: If events are already in another process or process is resolved
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
-    try:
-        if not request.event_ids:
-            raise HTTPException(
-                status_code=400, detail="event_ids list cannot be empty"
-            )
-
-        # Validate event_ids exist
-        events = load_business_events()
-        existing_event_ids = {e.id for e in events}
-        invalid_ids = [
-            eid for eid in request.event_ids if eid not in existing_event_ids
-        ]
-        if invalid_ids:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Events not found: {', '.join(invalid_ids)}",
-            )
+    if not request.event_ids:
+        raise HTTPException(
+            status_code=400, detail="event_ids list cannot be empty"
+        )
 
-        process = attach_events_to_process(process_id, request.event_ids)
-        return process
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
+    # Validate event_ids exist
+    events = load_business_events()
+    existing_event_ids = {e.id for e in events}
+    invalid_ids = [
+        eid for eid in request.event_ids if eid not in existing_event_ids
+    ]
+    if invalid_ids:
         raise HTTPException(
-            status_code=500, detail=f"Error attaching events to process: {str(e)}"
+            status_code=404,
+            detail=f"Events not found: {', '.join(invalid_ids)}",
         )
 
+    process = attach_events_to_process(
+        process_id, request.event_ids, events=events
+    )
+    return _model_response(process)
+
 
-@router.post("/processes/{process_id}/detach", response_model=BusinessEventProcess)
-async def detach_events_from_business_event_process(
+@router.post("/processes/{process_id}/detach")
+@_translate_errors("detaching events from process")
+def detach_events_from_business_event_process(
     process_id: str, request: DetachEventsRequest = Body(...)
-):
+) -> BusinessEventProcess:
     """
     Detach events from a business event process.
 
@@ -760,31 +731,20 @@ async def detach_events_from_business_event_process(
         NotFoundError: If process not found
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
-    try:
-        if not request.event_ids:
-            raise HTTPException(
-                status_code=400, detail="event_ids list cannot be empty"
-            )
-
-        process = detach_events_from_process(process_id, request.event_ids)
-        return process
-    except NotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
+    if not request.event_ids:
         raise HTTPException(
-            status_code=500, detail=f"Error detaching events from process: {str(e)}"
+            status_code=400, detail="event_ids list cannot be empty"
         )
 
+    process = detach_events_from_process(process_id, request.event_ids)
+    return _model_response(process)
 
-@router.post(
-    "/processes/{process_id}/generate-entities",
-    response_model=GeneratedEntitiesResult,
-)
-async def generate_entities_from_business_event_process(process_id: str):
+
+@router.post("/processes/{process_id}/generate-entities")
+@_translate_errors("generating entities from process")
+def generate_entities_from_business_event_process(
+    process_id: str,
+) -> GeneratedEntitiesResult:
     """
     Generate dimensional entities from a business event process.
 
@@ -806,31 +766,12 @@ async def generate_entities_from_business_event_process(process_id: str):
         ValidationError: If process doesn't have required annotations or is resolved
         FileOperationError: If file operations fail
     """
-    _check_feature_enabled()
-
-    try:
-        processes = load_processes()
-        process = None
-        for p in processes:
-            if p.id == process_id:
-                process = p
-                break
-
-        if process is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Business event process '{process_id}' not found",
-            )
-
-        result = generate_entities_from_process(process)
-        return result
-    except NotFoundError:
-        raise
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileOperationError:
-        raise
-    except Exception as e:
+    process = get_process_by_id(process_id)
+    if process is None:
         raise HTTPException(
-            status_code=500, detail=f"Error generating entities from process: {str(e)}"
+            status_code=404,
+            detail=f"Business event process '{process_id}' not found",
         )
+
+    result = generate_entities_from_process(process)
+    return _model_response(result)
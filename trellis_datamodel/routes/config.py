@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional
 
 from fastapi import APIRouter, HTTPException, Query
 
+from trellis_datamodel.adapters.dbt_core import DbtCoreAdapter
 from trellis_datamodel.config import find_config_file, reload_config
 from trellis_datamodel.exceptions import ConfigurationError, ValidationError
 from trellis_datamodel.models.schemas import (
@@ -18,19 +19,34 @@ from trellis_datamodel.models.schemas import (
     ConfigConflictInfo,
 )
 from trellis_datamodel.services.config_service import (
+    _read_file_info,
+    clear_config_cache,
     get_schema_metadata,
     load_config,
     save_config,
     validate_config,
 )
+from trellis_datamodel.utils.path_validation import clear_path_exists_cache
 
 logger = logging.getLogger(__name__)
 
 config_router = APIRouter(prefix="/api/config", tags=["config"])
 
+# Pydantic v1/v2 compatibility, decided once at import. Prefer model_dump:
+# v2 still has dict(), but only as a deprecated alias that warns per call.
+if hasattr(ConfigConflictInfo, "model_dump"):
+
+    def _dump_model(model: Any) -> Dict[str, Any]:
+        return model.model_dump()
+
+else:
+
+    def _dump_model(model: Any) -> Dict[str, Any]:
+        return model.dict()
+
 
 @config_router.get("", response_model=ConfigGetResponse)
-async def get_config(
+def get_config(
     config_path: Optional[str] = Query(None, description="Override config file path")
 ) -> ConfigGetResponse:
     """
@@ -89,7 +105,7 @@ async def get_config_schema():
 
 
 @config_router.put("")
-async def update_config(request: ConfigUpdateRequest) -> Dict[str, Any]:
+def update_config(request: ConfigUpdateRequest) -> Dict[str, Any]:
     """
     Update configuration with validation, conflict detection, and backup.
 
@@ -116,26 +132,19 @@ async def update_config(request: ConfigUpdateRequest) -> Dict[str, Any]:
             expected_hash=request.expected_hash,
         )
 
+        # Current file info, shared by the conflict and success responses
+        current_mtime, current_hash = _read_file_info(config_path)
+
         # If there's a conflict, return 409
         if conflict_message:
-            # Get current file info for conflict response
-            from trellis_datamodel.services.config_service import (
-                _get_file_mtime,
-                _get_file_hash,
-            )
-
-            current_mtime = _get_file_mtime(config_path)
-            current_hash = _get_file_hash(config_path)
-
             conflict_info = ConfigConflictInfo(
                 current_mtime=current_mtime,
                 current_hash=current_hash,
                 expected_mtime=request.expected_mtime,
                 expected_hash=request.expected_hash,
             )
-            # Use dict() for Pydantic v1/v2 compatibility
-            conflict_dict = conflict_info.dict() if hasattr(conflict_info, 'dict') else conflict_info.model_dump()
-            
+            conflict_dict = _dump_model(conflict_info)
+
             raise HTTPException(
                 status_code=409,
                 detail={
@@ -146,17 +155,12 @@ async def update_config(request: ConfigUpdateRequest) -> Dict[str, Any]:
             )
 
         # Success - return updated config and new file info
-        from trellis_datamodel.services.config_service import (
-            _get_file_mtime,
-            _get_file_hash,
-        )
-
         response = {
             "config": saved_config,
             "file_info": {
                 "path": config_path,
-                "mtime": _get_file_mtime(config_path),
-                "hash": _get_file_hash(config_path),
+                "mtime": current_mtime,
+                "hash": current_hash,
             },
         }
 
@@ -187,7 +191,7 @@ async def update_config(request: ConfigUpdateRequest) -> Dict[str, Any]:
 
 
 @config_router.post("/reload")
-async def reload_config_endpoint() -> Dict[str, Any]:
+def reload_config_endpoint() -> Dict[str, Any]:
     """
     Reload configuration from trellis.yml at runtime.
 
@@ -205,8 +209,9 @@ async def reload_config_endpoint() -> Dict[str, Any]:
         # Reload config (updates all global variables)
         reload_config()
 
-        # Clear adapter caches that depend on config
-        from trellis_datamodel.adapters.dbt_core import DbtCoreAdapter
+        # Clear caches that depend on config
+        clear_config_cache()
+        clear_path_exists_cache()
         DbtCoreAdapter.reset_inference_cache()
 
         logger.info("Configuration reloaded successfully via API")
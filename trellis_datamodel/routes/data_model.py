@@ -1,33 +1,75 @@
 """Routes for data model CRUD operations."""
 
-from fastapi import APIRouter, HTTPException
-import yaml
+from fastapi import APIRouter, HTTPException, Request, Response
+import hashlib
+import logging
 import os
-from typing import Dict, Any, List, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 
 from trellis_datamodel import config as cfg
 from trellis_datamodel.exceptions import ValidationError
 from trellis_datamodel.models.schemas import DataModelUpdate
-from trellis_datamodel.services.lineage import extract_source_systems_for_model
+from trellis_datamodel.services.lineage import extract_source_systems_for_models
 from trellis_datamodel.adapters import get_adapter
+from trellis_datamodel.utils import yaml_cache, yaml_sidecar
 from trellis_datamodel.utils.yaml_handler import YamlHandler
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api", tags=["data-model"])
 
+# The handlers run on the threadpool. Saves are serialized so the model and
+# layout files on disk always come from the same request.
+_SAVE_LOCK = threading.Lock()
+
+# Shared emitter for the model and layout files. ruamel.yaml instances are not
+# thread-safe, so it is only used while holding _SAVE_LOCK.
+_YAML = YamlHandler()
+
+# Bumped on every save (under _SAVE_LOCK) and folded into the ETag, so a save
+# that keeps the files' size and mtime still invalidates cached responses.
+_save_generation = 0
+
+
+# Optional properties persisted in the model file, in output order
+_ENTITY_MODEL_FIELDS = (
+    "description",
+    "dbt_model",
+    "additional_models",
+    "drafted_fields",
+    "tags",
+    "entity_type",
+    "annotation_type",
+)
+_RELATIONSHIP_MODEL_FIELDS = ("label", "type", "source_field", "target_field")
+
+# Visual-only properties stored in canvas_layout.yml rather than the model file
+_ENTITY_LAYOUT_FIELDS = ("position", "width", "panel_height", "collapsed")
+_RELATIONSHIP_LAYOUT_FIELDS = ("label_dx", "label_dy")
+
+
+_VALID_ENTITY_TYPES = frozenset(("fact", "dimension", "unclassified"))
+_VALID_ENTITY_TYPES_MESSAGE = ", ".join(sorted(_VALID_ENTITY_TYPES))
+
+# Default for dict.get on optional fields, which may legitimately hold None
+_MISSING = object()
+
+
+def _empty_layout() -> Dict[str, Any]:
+    """Return a new canvas layout with no entries."""
+    return {"version": 0.1, "entities": {}, "relationships": {}, "source_colors": {}}
+
 
 def _load_canvas_layout() -> Dict[str, Any]:
     """Load canvas layout file if it exists."""
     if not os.path.exists(cfg.CANVAS_LAYOUT_PATH):
-        return {
-            "version": 0.1,
-            "entities": {},
-            "relationships": {},
-            "source_colors": {},
-        }
+        return _empty_layout()
 
     try:
-        with open(cfg.CANVAS_LAYOUT_PATH, "r") as f:
-            layout = yaml.safe_load(f) or {}
+        # Read-only: the merge copies layout values into entities as they are
+        layout = yaml_cache.load_yaml_cached(cfg.CANVAS_LAYOUT_PATH, shared=True) or {}
         source_colors = layout.get("source_colors")
         # Ensure source_colors is always a dict, not None
         if source_colors is None:
@@ -39,13 +81,8 @@ def _load_canvas_layout() -> Dict[str, Any]:
             "source_colors": source_colors,
         }
     except Exception as e:
-        print(f"Warning: Could not load canvas layout: {e}")
-        return {
-            "version": 0.1,
-            "entities": {},
-            "relationships": {},
-            "source_colors": {},
-        }
+        logger.warning("Could not load canvas layout: %s", e)
+        return _empty_layout()
 
 
 def _merge_layout_into_model(
@@ -55,6 +92,10 @@ def _merge_layout_into_model(
     entities_layout = layout_data.get("entities", {})
     relationships_layout = layout_data.get("relationships", {})
 
+    # Nothing to merge, e.g. a fresh project without canvas_layout.yml
+    if not entities_layout and not relationships_layout:
+        return model_data
+
     # Merge entity visual properties
     entities = model_data.get("entities", [])
     for entity in entities:
@@ -64,31 +105,28 @@ def _merge_layout_into_model(
         # Entity type defaults to "unclassified" are handled during POST saves, not during GET merges
         # This prevents overwriting manually-set entity types during page loads
 
-        if entity_id and entity_id in entities_layout:
-            layout = entities_layout[entity_id]
-            if "position" in layout:
-                entity["position"] = layout["position"]
-            if "width" in layout:
-                entity["width"] = layout["width"]
-            if "panel_height" in layout:
-                entity["panel_height"] = layout["panel_height"]
-            if "collapsed" in layout:
-                entity["collapsed"] = layout["collapsed"]
-
-    # Merge relationship visual properties
-    relationships = model_data.get("relationships", [])
+        layout = entities_layout.get(entity_id) if entity_id else None
+        if layout:
+            for key in _ENTITY_LAYOUT_FIELDS:
+                value = layout.get(key, _MISSING)
+                if value is not _MISSING:
+                    entity[key] = value
+
+    # Merge relationship visual properties. Layout keys are the persisted
+    # "source-target-index" strings, so there is nothing to look up (and no
+    # key to format) when the layout has no relationship entries.
+    relationships = model_data.get("relationships", []) if relationships_layout else []
     for idx, relationship in enumerate(relationships):
         source = relationship.get("source")
         target = relationship.get("target")
         if source and target:
             # Create key: source-target-index
-            rel_key = f"{source}-{target}-{idx}"
-            if rel_key in relationships_layout:
-                layout = relationships_layout[rel_key]
-                if "label_dx" in layout:
-                    relationship["label_dx"] = layout["label_dx"]
-                if "label_dy" in layout:
-                    relationship["label_dy"] = layout["label_dy"]
+            layout = relationships_layout.get(f"{source}-{target}-{idx}")
+            if layout:
+                for key in _RELATIONSHIP_LAYOUT_FIELDS:
+                    value = layout.get(key, _MISSING)
+                    if value is not _MISSING:
+                        relationship[key] = value
 
     return model_data
 
@@ -100,11 +138,18 @@ def _apply_entity_type_inference(model_data: Dict[str, Any]) -> Dict[str, Any]:
     Inference is only applied to entities that don't already have entity_type set.
     Manually set entity_type values are preserved.
     """
+    # Skip the adapter entirely when every entity is already classified
+    if not any(
+        entity.get("id") and entity.get("entity_type") in (None, "unclassified")
+        for entity in model_data.get("entities", [])
+    ):
+        return model_data
+
     try:
         adapter = get_adapter()
         inferred_types = adapter.infer_entity_types()
     except Exception as e:
-        print(f"Warning: Could not infer entity types: {e}")
+        logger.warning("Could not infer entity types: %s", e)
         return model_data
 
     entities = model_data.get("entities", [])
@@ -118,18 +163,157 @@ def _apply_entity_type_inference(model_data: Dict[str, Any]) -> Dict[str, Any]:
         should_infer = existing_type is None or existing_type == "unclassified"
         if should_infer and entity_id in inferred_types:
             entity["entity_type"] = inferred_types[entity_id]
-            print(
-                f"Inferred entity_type '{inferred_types[entity_id]}' for entity '{entity_id}'"
+            logger.debug(
+                "Inferred entity_type '%s' for entity '%s'",
+                inferred_types[entity_id],
+                entity_id,
             )
-        else:
-            pass
 
     return model_data
 
 
+def _file_signature(path: Optional[str]) -> Tuple[int, int]:
+    """Return (st_mtime_ns, st_size) of a file, or (0, 0) if it is missing."""
+    if not path:
+        return (0, 0)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# Source systems per model, keyed by (manifest path, manifest signature,
+# catalog path, model id). The signature is part of the key, so a new dbt
+# run yields fresh results without explicit invalidation.
+_SOURCES_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[str, ...]]" = OrderedDict()
+_SOURCES_CACHE_LOCK = threading.Lock()
+_SOURCES_CACHE_MAX_ENTRIES = 1024
+
+
+def _lineage_sources(
+    catalog_path: str | None, model_ids: set[str]
+) -> Dict[str, Tuple[str, ...]]:
+    """
+    Return lineage-derived source systems for each model ID.
+
+    Cached models are answered from memory; the rest are extracted together
+    so manifest.json is parsed at most once per call.
+    """
+    manifest_path = cfg.MANIFEST_PATH
+    signature = _file_signature(manifest_path)
+    result: Dict[str, Tuple[str, ...]] = {}
+    missing: List[str] = []
+
+    with _SOURCES_CACHE_LOCK:
+        for model_id in model_ids:
+            cached = _SOURCES_CACHE.get((manifest_path, signature, catalog_path, model_id))
+            if cached is None:
+                missing.append(model_id)
+            else:
+                result[model_id] = cached
+
+    if missing:
+        extracted = extract_source_systems_for_models(manifest_path, catalog_path, missing)
+        with _SOURCES_CACHE_LOCK:
+            for model_id, sources in extracted.items():
+                result[model_id] = tuple(sources)
+                _SOURCES_CACHE[(manifest_path, signature, catalog_path, model_id)] = (
+                    result[model_id]
+                )
+            while len(_SOURCES_CACHE) > _SOURCES_CACHE_MAX_ENTRIES:
+                _SOURCES_CACHE.popitem(last=False)
+
+    return result
+
+
+def _bound_model_ids(entities: List[Dict[str, Any]]) -> set[str]:
+    """Collect dbt_model and additional_models of all bound entities."""
+    model_ids: set[str] = set()
+    for entity in entities:
+        dbt_model = entity.get("dbt_model")
+        if dbt_model:
+            model_ids.add(dbt_model)
+            model_ids.update(entity.get("additional_models", []))
+    return model_ids
+
+
+def _existing_catalog_path() -> str | None:
+    """Return CATALOG_PATH if it is configured and exists, else None."""
+    if cfg.CATALOG_PATH and os.path.exists(cfg.CATALOG_PATH):
+        return cfg.CATALOG_PATH
+    return None
+
+
+def _warm_lineage_sources(entities: List[Dict[str, Any]]) -> None:
+    """Populate the source systems cache for the bound models of ``entities``."""
+    if not cfg.MANIFEST_PATH or not os.path.exists(cfg.MANIFEST_PATH):
+        return
+    try:
+        model_ids = _bound_model_ids(entities)
+        if model_ids:
+            _lineage_sources(_existing_catalog_path(), model_ids)
+    except Exception as e:
+        # The GET will retry; a failed warm-up must not fail the save
+        logger.warning("Could not resolve lineage sources: %s", e)
+
+
+def clear_sources_cache() -> None:
+    """Drop all cached lineage-derived source systems."""
+    with _SOURCES_CACHE_LOCK:
+        _SOURCES_CACHE.clear()
+
+
+def _data_model_etag() -> str:
+    """
+    Return a weak ETag for GET /api/data-model.
+
+    Covers every input of the response: the model and layout files (plus a
+    counter of saves made by this process), the manifest and catalog that
+    lineage sources and type inference read, and the config that decides
+    whether inference runs and with which prefixes.
+    """
+    dimensional_config = cfg.DIMENSIONAL_MODELING_CONFIG
+    state = (
+        _save_generation,
+        cfg.FRAMEWORK,
+        cfg.DATA_MODEL_PATH,
+        _file_signature(cfg.DATA_MODEL_PATH),
+        cfg.CANVAS_LAYOUT_PATH,
+        _file_signature(cfg.CANVAS_LAYOUT_PATH),
+        cfg.MANIFEST_PATH,
+        _file_signature(cfg.MANIFEST_PATH),
+        cfg.CATALOG_PATH,
+        _file_signature(cfg.CATALOG_PATH),
+        dimensional_config.enabled,
+        tuple(dimensional_config.dimension_prefix),
+        tuple(dimensional_config.fact_prefix),
+    )
+    digest = hashlib.blake2b(repr(state).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Return True if an If-None-Match header value covers ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/data-model")
-async def get_data_model():
-    """Return current data model with layout merged in."""
+def get_data_model(request: Request, response: Response):
+    """
+    Return current data model with layout merged in.
+
+    Responses carry an ETag; a matching If-None-Match gets a bodiless 304
+    without reading or merging anything.
+    """
+    etag = _data_model_etag()
+    if _etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     # Load layout data (including source_colors) even if data_model.yml doesn't exist
     layout_data = _load_canvas_layout()
 
@@ -143,14 +327,18 @@ async def get_data_model():
         }
 
     try:
-        # Load model data
-        with open(cfg.DATA_MODEL_PATH, "r") as f:
-            model_data = yaml.safe_load(f) or {}
-
-        if not model_data.get("entities"):
-            model_data["entities"] = []
-        if not model_data.get("relationships"):
-            model_data["relationships"] = []
+        # Load model data. Only the top level and the entity/relationship
+        # dicts are modified below, so copy just those instead of deep-copying
+        # the whole cached document.
+        cached_model = yaml_cache.load_yaml_cached(cfg.DATA_MODEL_PATH, shared=True) or {}
+        model_data = dict(cached_model)
+        model_data["entities"] = [
+            dict(entity) for entity in cached_model.get("entities") or []
+        ]
+        model_data["relationships"] = [
+            dict(relationship)
+            for relationship in cached_model.get("relationships") or []
+        ]
 
         # Apply entity type inference when dimensional modeling is enabled
         if cfg.DIMENSIONAL_MODELING_CONFIG.enabled:
@@ -165,59 +353,32 @@ async def get_data_model():
         # Add source_system field to entities
         # For bound entities: extract from lineage
         # For unbound entities: read from persisted YAML
-        entities = merged_data.get("entities", [])
+        manifest_ok = bool(cfg.MANIFEST_PATH) and os.path.exists(cfg.MANIFEST_PATH)
+        catalog_path = _existing_catalog_path()
+        entities = merged_data.get("entities", []) if manifest_ok else []
+        sources_by_model: Dict[str, Tuple[str, ...]] = {}
+        try:
+            model_ids = _bound_model_ids(entities)
+            if model_ids:
+                sources_by_model = _lineage_sources(catalog_path, model_ids)
+        except Exception as e:
+            # Gracefully handle errors - log but don't fail
+            logger.warning("Could not resolve lineage sources: %s", e)
+
         for entity in entities:
             dbt_model = entity.get("dbt_model")
-            additional_models = entity.get("additional_models", [])
-
-            if dbt_model:
-                # Bound entity: extract source systems from lineage
-                # Extract for primary model
-                source_systems = set()
-                try:
-                    if cfg.MANIFEST_PATH and os.path.exists(cfg.MANIFEST_PATH):
-                        primary_sources = extract_source_systems_for_model(
-                            cfg.MANIFEST_PATH,
-                            (
-                                cfg.CATALOG_PATH
-                                if cfg.CATALOG_PATH and os.path.exists(cfg.CATALOG_PATH)
-                                else None
-                            ),
-                            dbt_model,
-                        )
-                        source_systems.update(primary_sources)
-                except Exception:
-                    # Gracefully handle errors - log but don't fail
-                    pass
-
-                # Extract for additional models
-                for model_id in additional_models:
-                    try:
-                        if cfg.MANIFEST_PATH and os.path.exists(cfg.MANIFEST_PATH):
-                            additional_sources = extract_source_systems_for_model(
-                                cfg.MANIFEST_PATH,
-                                (
-                                    cfg.CATALOG_PATH
-                                    if cfg.CATALOG_PATH
-                                    and os.path.exists(cfg.CATALOG_PATH)
-                                    else None
-                                ),
-                                model_id,
-                            )
-                            source_systems.update(additional_sources)
-                    except Exception:
-                        # Gracefully handle errors
-                        pass
-
-                # Set source_system if any sources found
-                if source_systems:
-                    entity["source_system"] = sorted(list(source_systems))
-            else:
-                # Unbound entity: read from persisted YAML
-                if "source_system" in entity:
-                    # Already loaded from YAML, keep as-is
-                    pass
-                # If not present, entity won't have source_system field (optional)
+            if not dbt_model:
+                # Unbound entities keep the source_system persisted in the YAML (if any)
+                continue
+
+            # Bound entity: union of sources of the primary and additional models
+            source_systems = set(sources_by_model.get(dbt_model, ()))
+            for model_id in entity.get("additional_models", []):
+                source_systems.update(sources_by_model.get(model_id, ()))
+
+            # Set source_system if any sources found
+            if source_systems:
+                entity["source_system"] = sorted(source_systems)
 
         return merged_data
     except Exception as e:
@@ -229,24 +390,28 @@ async def get_data_model():
 def _split_model_and_layout(
     content: Dict[str, Any],
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    """Split incoming data into model-only and layout-only dictionaries."""
+    """
+    Split incoming data into model-only and layout-only dictionaries.
+
+    Entity types are validated in the same pass over the entities.
+
+    Raises:
+        ValidationError: If an entity has an unknown entity_type.
+    """
     model_data = {
         "version": content.get("version", 0.1),
         "entities": [],
         "relationships": [],
     }
 
-    layout_data = {
-        "version": 0.1,
-        "entities": {},
-        "relationships": {},
-        "source_colors": {},
-    }
+    layout_data = _empty_layout()
 
     # Split entities
     entities = content.get("entities", [])
 
     for entity in entities:
+        _validate_entity_type(entity.get("entity_type"))
+
         entity_id = entity.get("id")
         if not entity_id:
             continue
@@ -256,40 +421,28 @@ def _split_model_and_layout(
             "id": entity_id,
             "label": entity.get("label", ""),
         }
-        if "description" in entity:
-            model_entity["description"] = entity["description"]
-        if "dbt_model" in entity:
-            model_entity["dbt_model"] = entity["dbt_model"]
-        if "additional_models" in entity:
-            model_entity["additional_models"] = entity["additional_models"]
-        if "drafted_fields" in entity:
-            model_entity["drafted_fields"] = entity["drafted_fields"]
-        if "tags" in entity:
-            model_entity["tags"] = entity["tags"]
-        if "entity_type" in entity:
-            model_entity["entity_type"] = entity["entity_type"]
-        if "annotation_type" in entity:
-            model_entity["annotation_type"] = entity["annotation_type"]
+        for key in _ENTITY_MODEL_FIELDS:
+            value = entity.get(key, _MISSING)
+            if value is not _MISSING:
+                model_entity[key] = value
         # Only persist source_system for unbound entities (not for bound entities)
-        if "source_system" in entity and not entity.get("dbt_model"):
-            model_entity["source_system"] = entity["source_system"]
-            # Log instrumentation
-            print(
-                f"DEBUG: Entity {entity_id} is unbound, persisting source_system: {entity.get('source_system')}"
+        source_system = entity.get("source_system", _MISSING)
+        if source_system is not _MISSING and not entity.get("dbt_model"):
+            model_entity["source_system"] = source_system
+            logger.debug(
+                "Entity %s is unbound, persisting source_system: %s",
+                entity_id,
+                source_system,
             )
 
         model_data["entities"].append(model_entity)
 
         # Layout-only properties
         layout_entity = {}
-        if "position" in entity:
-            layout_entity["position"] = entity["position"]
-        if "width" in entity:
-            layout_entity["width"] = entity["width"]
-        if "panel_height" in entity:
-            layout_entity["panel_height"] = entity["panel_height"]
-        if "collapsed" in entity:
-            layout_entity["collapsed"] = entity["collapsed"]
+        for key in _ENTITY_LAYOUT_FIELDS:
+            value = entity.get(key, _MISSING)
+            if value is not _MISSING:
+                layout_entity[key] = value
 
         if layout_entity:
             layout_data["entities"][entity_id] = layout_entity
@@ -307,23 +460,19 @@ def _split_model_and_layout(
             "source": source,
             "target": target,
         }
-        if "label" in relationship:
-            model_rel["label"] = relationship["label"]
-        if "type" in relationship:
-            model_rel["type"] = relationship["type"]
-        if "source_field" in relationship:
-            model_rel["source_field"] = relationship["source_field"]
-        if "target_field" in relationship:
-            model_rel["target_field"] = relationship["target_field"]
+        for key in _RELATIONSHIP_MODEL_FIELDS:
+            value = relationship.get(key, _MISSING)
+            if value is not _MISSING:
+                model_rel[key] = value
 
         model_data["relationships"].append(model_rel)
 
         # Layout-only properties
         layout_rel = {}
-        if "label_dx" in relationship:
-            layout_rel["label_dx"] = relationship["label_dx"]
-        if "label_dy" in relationship:
-            layout_rel["label_dy"] = relationship["label_dy"]
+        for key in _RELATIONSHIP_LAYOUT_FIELDS:
+            value = relationship.get(key, _MISSING)
+            if value is not _MISSING:
+                layout_rel[key] = value
 
         if layout_rel:
             # Use source-target-index as key
@@ -338,7 +487,7 @@ def _split_model_and_layout(
 
 
 @router.get("/source-systems/suggestions")
-async def get_source_system_suggestions():
+def get_source_system_suggestions():
     """
     Return a consolidated list of known source system names for suggestions.
 
@@ -349,128 +498,101 @@ async def get_source_system_suggestions():
     """
     suggestions: set[str] = set()
 
-    # 1. Collect mock sources from data_model.yml
+    # Both passes below read the same entities; parse the file once.
+    entities: List[Dict[str, Any]] = []
     if os.path.exists(cfg.DATA_MODEL_PATH):
         try:
-            with open(cfg.DATA_MODEL_PATH, "r") as f:
-                model_data = yaml.safe_load(f) or {}
-
+            model_data = yaml_cache.load_yaml_cached(cfg.DATA_MODEL_PATH, shared=True) or {}
             entities = model_data.get("entities", [])
-            for entity in entities:
-                # Only collect from unbound entities (mock sources)
-                if not entity.get("dbt_model") and entity.get("source_system"):
-                    source_systems = entity.get("source_system", [])
-                    if isinstance(source_systems, list):
-                        for source in source_systems:
-                            if source and isinstance(source, str):
-                                suggestions.add(source.strip())
         except Exception:
             # Gracefully handle errors
             pass
 
+    # 1. Collect mock sources from data_model.yml
+    try:
+        for entity in entities:
+            # Only collect from unbound entities (mock sources)
+            if not entity.get("dbt_model") and entity.get("source_system"):
+                source_systems = entity.get("source_system", [])
+                if isinstance(source_systems, list):
+                    for source in source_systems:
+                        if source and isinstance(source, str):
+                            suggestions.add(source.strip())
+    except Exception:
+        # Gracefully handle errors
+        pass
+
     # 2. Collect lineage-derived sources from all bound entities
-    if cfg.MANIFEST_PATH and os.path.exists(cfg.MANIFEST_PATH):
+    if entities and cfg.MANIFEST_PATH and os.path.exists(cfg.MANIFEST_PATH):
+        catalog_path = _existing_catalog_path()
         try:
-            with open(cfg.DATA_MODEL_PATH, "r") as f:
-                model_data = yaml.safe_load(f) or {}
-
-            entities = model_data.get("entities", [])
-            for entity in entities:
-                dbt_model = entity.get("dbt_model")
-                additional_models = entity.get("additional_models", [])
-
-                if dbt_model:
-                    # Extract from primary model
-                    try:
-                        sources = extract_source_systems_for_model(
-                            cfg.MANIFEST_PATH,
-                            (
-                                cfg.CATALOG_PATH
-                                if cfg.CATALOG_PATH and os.path.exists(cfg.CATALOG_PATH)
-                                else None
-                            ),
-                            dbt_model,
-                        )
-                        suggestions.update(sources)
-                    except Exception:
-                        pass
-
-                    # Extract from additional models
-                    for model_id in additional_models:
-                        try:
-                            sources = extract_source_systems_for_model(
-                                cfg.MANIFEST_PATH,
-                                (
-                                    cfg.CATALOG_PATH
-                                    if cfg.CATALOG_PATH
-                                    and os.path.exists(cfg.CATALOG_PATH)
-                                    else None
-                                ),
-                                model_id,
-                            )
-                            suggestions.update(sources)
-                        except Exception:
-                            pass
-        except Exception:
+            model_ids = _bound_model_ids(entities)
+            if model_ids:
+                for sources in _lineage_sources(catalog_path, model_ids).values():
+                    suggestions.update(sources)
+        except Exception as e:
             # Gracefully handle errors
-            pass
+            logger.warning("Could not resolve lineage sources: %s", e)
 
     # 3. Collect from dbt sources.yml (if available)
     # Note: This would require parsing sources.yml files, which is out of scope for now
     # Future enhancement: parse sources.yml to extract source-name values
 
     # Return sorted list
-    return {"suggestions": sorted(list(suggestions))}
+    return {"suggestions": sorted(suggestions)}
 
 
-def _validate_entity_type(entity_type: str) -> None:
+def _validate_entity_type(entity_type: Optional[str]) -> None:
     """
-    Validate that entity_type is one of the allowed values.
+    Validate that entity_type is one of the allowed values (or unset).
 
     Raises ValidationError if invalid.
     """
-    from trellis_datamodel.exceptions import ValidationError
-
-    valid_types = {"fact", "dimension", "unclassified"}
-    if entity_type and entity_type not in valid_types:
+    if entity_type and entity_type not in _VALID_ENTITY_TYPES:
         raise ValidationError(
-            f"Invalid entity_type '{entity_type}'. Must be one of: {', '.join(sorted(valid_types))}"
+            f"Invalid entity_type '{entity_type}'. Must be one of: {_VALID_ENTITY_TYPES_MESSAGE}"
         )
 
 
 @router.post("/data-model")
-async def save_data_model(data: DataModelUpdate):
+def save_data_model(data: DataModelUpdate):
     """Save data model, splitting model and layout into separate files."""
-    try:
-        content = data.dict()  # Pydantic v1 (required by dbt-core==1.10)
+    global _save_generation
 
-        # Validate entity_type values in all entities
-        entities = content.get("entities", [])
-        for entity in entities:
-            entity_type = entity.get("entity_type")
-            if entity_type:
-                _validate_entity_type(entity_type)
+    try:
+        # Shallow field mapping; works on Pydantic v1 and v2. The split below
+        # only reads the nested entity/relationship dicts, so the recursive
+        # copy made by .dict()/.model_dump() is not needed.
+        content = dict(data)
 
-        # Split into model and layout
+        # Split into model and layout (validates entity_type values as well)
         model_data, layout_data = _split_model_and_layout(content)
 
-        # Save model file
-        print(f"Saving data model to: {cfg.DATA_MODEL_PATH}")
-
-        YamlHandler().save_file(cfg.DATA_MODEL_PATH, model_data)
-
-        # Save layout file
-        print(f"Saving canvas layout to: {cfg.CANVAS_LAYOUT_PATH}")
-        YamlHandler().save_file(cfg.CANVAS_LAYOUT_PATH, layout_data)
+        with _SAVE_LOCK:
+            # Save model file
+            logger.info("Saving data model to: %s", cfg.DATA_MODEL_PATH)
+            _YAML.save_file(cfg.DATA_MODEL_PATH, model_data)
+            yaml_sidecar.remove_sidecar(cfg.DATA_MODEL_PATH)
+            yaml_cache.invalidate(cfg.DATA_MODEL_PATH)
+
+            # Save layout file
+            logger.info("Saving canvas layout to: %s", cfg.CANVAS_LAYOUT_PATH)
+            _YAML.save_file(cfg.CANVAS_LAYOUT_PATH, layout_data)
+            yaml_sidecar.remove_sidecar(cfg.CANVAS_LAYOUT_PATH)
+            yaml_cache.invalidate(cfg.CANVAS_LAYOUT_PATH)
+            _save_generation += 1
+
+        # Resolve lineage sources for newly bound models now, so the GET that
+        # follows every save is served from the cache. Already cached models
+        # cost nothing; entries stay valid until the manifest changes.
+        _warm_lineage_sources(model_data["entities"])
 
         return {"status": "success"}
     except ValidationError:
         # Let ValidationError propagate to exception handler
         raise
     except Exception as e:
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Error saving data model")
         raise HTTPException(
             status_code=500, detail=f"Error saving data model: {str(e)}"
         )
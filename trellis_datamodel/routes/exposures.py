@@ -19,7 +19,7 @@ router = APIRouter(prefix="/api", tags=["exposures"])
 
 
 @router.get("/exposures", response_model=ExposuresResponse)
-async def get_exposures_endpoint():
+def get_exposures_endpoint():
     """
     Return exposures data and entity usage mapping.
 
@@ -15,7 +15,7 @@ router = APIRouter(
 
 
 @router.get("/lineage/{model_id}")
-async def get_lineage(model_id: str):
+def get_lineage(model_id: str):
     """
     Get upstream table-level lineage for a given model.
 
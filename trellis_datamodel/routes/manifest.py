@@ -1,19 +1,21 @@
 """Routes for manifest and catalog operations."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 import os
 
 from trellis_datamodel import config as cfg
 from trellis_datamodel.config import find_config_file
 from trellis_datamodel.adapters import get_adapter
+from trellis_datamodel.routes.base import json_response
 from trellis_datamodel.services.manifest import get_models
+from trellis_datamodel.utils.path_validation import path_exists_cached
 
 router = APIRouter(prefix="/api", tags=["manifest"])
 
 
 def _resolve_config_path() -> str | None:
     """Resolve config file path, preferring CONFIG_PATH from startup, falling back to search."""
-    if cfg.CONFIG_PATH and os.path.exists(cfg.CONFIG_PATH):
+    if path_exists_cached(cfg.CONFIG_PATH):
         return cfg.CONFIG_PATH
     return find_config_file()
 
@@ -34,10 +36,38 @@ def _resolve_label_prefixes() -> list[str]:
     return []
 
 
+# Encoded /config-status body, keyed by every value it is built from.
+_status_body_cache: tuple[tuple, bytes] | None = None
+
+
 @router.get("/config-status")
-async def get_config_status():
+def get_config_status():
     """Return configuration status for the frontend."""
+    global _status_body_cache
+
     found_config = _resolve_config_path()
+
+    # Existence is probed (with a one-second cache) rather than fixed at config
+    # load: manifest.json and catalog.json appear whenever dbt runs, which
+    # does not trigger a config reload.
+    manifest_exists = path_exists_cached(cfg.MANIFEST_PATH)
+    catalog_exists = path_exists_cached(cfg.CATALOG_PATH)
+    data_model_exists = path_exists_cached(cfg.DATA_MODEL_PATH)
+
+    key = (
+        found_config,
+        cfg.FRAMEWORK,
+        cfg.DBT_PROJECT_PATH,
+        cfg.MANIFEST_PATH,
+        cfg.CATALOG_PATH,
+        manifest_exists,
+        catalog_exists,
+        data_model_exists,
+    )
+    cached = _status_body_cache
+    if cached is not None and cached[0] == key:
+        return Response(content=cached[1], media_type="application/json")
+
     config_present = found_config is not None
 
     # Determine expected config filename for display
@@ -47,12 +77,6 @@ async def get_config_status():
         # Default to trellis.yml (primary config file name)
         config_filename = "trellis.yml"
 
-    manifest_exists = os.path.exists(cfg.MANIFEST_PATH) if cfg.MANIFEST_PATH else False
-    catalog_exists = os.path.exists(cfg.CATALOG_PATH) if cfg.CATALOG_PATH else False
-    data_model_exists = (
-        os.path.exists(cfg.DATA_MODEL_PATH) if cfg.DATA_MODEL_PATH else False
-    )
-
     error = None
     if not config_present:
         error = "Config file not found."
@@ -61,7 +85,7 @@ async def get_config_status():
     elif not manifest_exists:
         error = f"Manifest not found at {cfg.MANIFEST_PATH}"
 
-    return {
+    payload = {
         "config_present": config_present,
         "config_filename": config_filename,
         "framework": cfg.FRAMEWORK,
@@ -73,10 +97,13 @@ async def get_config_status():
         "data_model_exists": data_model_exists,
         "error": error,
     }
+    response = json_response(payload)
+    _status_body_cache = (key, response.body)
+    return response
 
 
 @router.get("/config-info")
-async def get_config_info():
+def get_config_info():
     """
     Return resolved config paths and their existence for transparency/debugging.
     """
@@ -88,39 +115,32 @@ async def get_config_info():
     except Exception:
         model_dirs = []
 
-    return {
+    # Exposed under both keys; build it once and let the encoder write it twice.
+    guidance_config = cfg.GUIDANCE_CONFIG
+    guidance = {
+        "entity_wizard_enabled": guidance_config.entity_wizard_enabled,
+        "push_warning_enabled": guidance_config.push_warning_enabled,
+        "min_description_length": guidance_config.min_description_length,
+        "disabled_guidance": guidance_config.disabled_guidance,
+    }
+
+    payload = {
         "config_path": config_path,
         "framework": cfg.FRAMEWORK,
         "dbt_project_path": cfg.DBT_PROJECT_PATH,
         "manifest_path": cfg.MANIFEST_PATH,
-        "manifest_exists": bool(
-            cfg.MANIFEST_PATH and os.path.exists(cfg.MANIFEST_PATH)
-        ),
+        "manifest_exists": path_exists_cached(cfg.MANIFEST_PATH),
         "catalog_path": cfg.CATALOG_PATH,
-        "catalog_exists": bool(cfg.CATALOG_PATH and os.path.exists(cfg.CATALOG_PATH)),
+        "catalog_exists": path_exists_cached(cfg.CATALOG_PATH),
         "data_model_path": cfg.DATA_MODEL_PATH,
-        "data_model_exists": bool(
-            cfg.DATA_MODEL_PATH and os.path.exists(cfg.DATA_MODEL_PATH)
-        ),
+        "data_model_exists": path_exists_cached(cfg.DATA_MODEL_PATH),
         "canvas_layout_path": cfg.CANVAS_LAYOUT_PATH,
-        "canvas_layout_exists": bool(
-            cfg.CANVAS_LAYOUT_PATH and os.path.exists(cfg.CANVAS_LAYOUT_PATH)
-        ),
+        "canvas_layout_exists": path_exists_cached(cfg.CANVAS_LAYOUT_PATH),
         "frontend_build_dir": cfg.FRONTEND_BUILD_DIR,
         "model_paths_configured": cfg.DBT_MODEL_PATHS,
         "model_paths_resolved": model_dirs,
-        "guidance": {
-            "entity_wizard_enabled": cfg.GUIDANCE_CONFIG.entity_wizard_enabled,
-            "push_warning_enabled": cfg.GUIDANCE_CONFIG.push_warning_enabled,
-            "min_description_length": cfg.GUIDANCE_CONFIG.min_description_length,
-            "disabled_guidance": cfg.GUIDANCE_CONFIG.disabled_guidance,
-        },
-        "entity_creation_guidance": {
-            "entity_wizard_enabled": cfg.GUIDANCE_CONFIG.entity_wizard_enabled,
-            "push_warning_enabled": cfg.GUIDANCE_CONFIG.push_warning_enabled,
-            "min_description_length": cfg.GUIDANCE_CONFIG.min_description_length,
-            "disabled_guidance": cfg.GUIDANCE_CONFIG.disabled_guidance,
-        },
+        "guidance": guidance,
+        "entity_creation_guidance": guidance,
         "lineage_enabled": cfg.LINEAGE_ENABLED,
         "lineage_layers": cfg.LINEAGE_LAYERS,
         "exposures_enabled": cfg.EXPOSURES_ENABLED,
@@ -145,10 +165,11 @@ async def get_config_info():
             else []
         ),
     }
+    return json_response(payload)
 
 
 @router.get("/manifest")
-async def get_manifest():
+def get_manifest():
     """Return parsed models from the transformation framework."""
     models = get_models()
     return {"models": models}
@@ -5,8 +5,10 @@ This is the FastAPI application that serves the API and frontend.
 """
 
 import os
+from contextlib import asynccontextmanager
 from importlib.resources import files
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
@@ -32,6 +34,18 @@ from trellis_datamodel.routes import (
 )
 
 
+# Worker threads available to sync (`def`) route handlers. Most handlers do
+# blocking file I/O, so allow more than anyio's default of 40.
+THREADPOOL_SIZE = 200
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Size the threadpool used for sync route handlers."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
+
 def _configure_cors(app: FastAPI) -> None:
     """Allow all origins for local development."""
     app.add_middleware(
@@ -162,7 +176,7 @@ def _register_routers(app: FastAPI) -> None:
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
-    app = FastAPI(title="Trellis Data", version="0.1.0")
+    app = FastAPI(title="Trellis Data", version="0.1.0", lifespan=_lifespan)
 
     _configure_cors(app)
     _register_exception_handlers(app)
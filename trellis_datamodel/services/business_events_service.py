@@ -13,10 +13,13 @@ This service:
 - Validates event data
 """
 
+import functools
 import logging
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -28,17 +31,55 @@ from trellis_datamodel.exceptions import (
     NotFoundError,
 )
 from trellis_datamodel.models.business_event import (
+    ANNOTATION_TYPES,
+    VALID_ANNOTATION_TYPES,
     BusinessEvent,
     BusinessEventType,
     BusinessEventsFile,
     BusinessEventProcess,
-    BusinessEventProcessFile,
     AnnotationEntry,
     BusinessEventAnnotations,
 )
+from trellis_datamodel.utils import json_utils, yaml_sidecar
 
 logger = logging.getLogger(__name__)
 
+_VALID_ANNOTATION_TYPES_MSG = ", ".join(ANNOTATION_TYPES)
+
+# Parsed YAML contents of business events files plus an event id -> raw event
+# index, keyed by path and validated against (st_mtime_ns, st_size). Holds raw
+# data rather than models so every load still returns fresh, mutable
+# BusinessEvent objects. Cache hits are still fully validated: pydantic-core
+# validation of the nested annotation models is faster than rebuilding them
+# with model_construct(), which recurses in Python, and it keeps hand-edited
+# files from bypassing the model validators.
+_CachedEventsFile = Tuple[Tuple[int, int], Dict[str, Any], Dict[str, Dict[str, Any]]]
+_FILE_CACHE: "OrderedDict[str, _CachedEventsFile]" = OrderedDict()
+_FILE_CACHE_LOCK = threading.Lock()
+
+# Serializes every load -> mutate -> write of business_events.yml, since sync
+# handlers run concurrently on the threadpool. Reentrant because operations
+# nest (process operations relink events through other public functions).
+_WRITE_LOCK = threading.RLock()
+_FILE_CACHE_MAX_ENTRIES = 100
+
+# Pre-encoded JSON listings served by the GET endpoints, keyed by
+# (path, listing name) and validated against the same file signature.
+_ENCODED_CACHE: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], bytes]]" = (
+    OrderedDict()
+)
+
+
+def _serialized(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Run ``func`` while holding the business events write lock."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with _WRITE_LOCK:
+            return func(*args, **kwargs)
+
+    return wrapper
+
 
 def _get_business_events_path() -> str:
     """
@@ -59,6 +100,133 @@ def _get_business_events_path() -> str:
     return os.path.abspath("business_events.yml")
 
 
+def _file_signature(path: str) -> Tuple[int, int]:
+    """Return (st_mtime_ns, st_size) used to validate cache entries for a file."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_events_file(
+    path: str,
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Parse a business events YAML file, reusing the cached parse while unchanged.
+
+    On an in-process cache miss the JSON sidecar written alongside the file is
+    tried before falling back to a full YAML parse. The returned objects are
+    shared between callers and must not be mutated.
+
+    Returns:
+        Tuple of (parsed file data, raw events keyed by event id)
+
+    Raises:
+        OSError: If the file cannot be read.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    signature = _file_signature(path)
+
+    with _FILE_CACHE_LOCK:
+        cached = _FILE_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            _FILE_CACHE.move_to_end(path)
+            return cached[1], cached[2]
+
+    data = yaml_sidecar.load_yaml(path, signature) or {}
+
+    events_by_id = {}
+    raw_events = data.get("events") if isinstance(data, dict) else None
+    if isinstance(raw_events, list):
+        for raw_event in raw_events:
+            if isinstance(raw_event, dict) and "id" in raw_event:
+                events_by_id.setdefault(raw_event["id"], raw_event)
+
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[path] = (signature, data, events_by_id)
+        _FILE_CACHE.move_to_end(path)
+        while len(_FILE_CACHE) > _FILE_CACHE_MAX_ENTRIES:
+            _FILE_CACHE.popitem(last=False)
+    return data, events_by_id
+
+
+def _read_events_file(path: str) -> Dict[str, Any]:
+    """Return the (cached) parsed contents of a business events file."""
+    return _load_events_file(path)[0]
+
+
+def _write_events_file(path: str, data: Dict[str, Any]) -> None:
+    """
+    Atomically write business_events.yml and refresh its JSON sidecar.
+
+    The file is written to a temporary file and renamed into place so
+    concurrent readers never see a partial document. The in-process caches
+    are invalidated so a rewrite within the filesystem's mtime resolution is
+    never served from a stale entry.
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "w") as f:
+            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    clear_business_events_cache(path)
+    yaml_sidecar.write_sidecar(path, _file_signature(path), data)
+
+
+def clear_business_events_cache(path: Optional[str] = None) -> None:
+    """
+    Drop cached file contents for one path, or for all paths when omitted.
+
+    Saves call this so a rewrite within the filesystem's mtime resolution is
+    never served from a stale entry.
+    """
+    with _FILE_CACHE_LOCK:
+        if path is None:
+            _FILE_CACHE.clear()
+            _ENCODED_CACHE.clear()
+        else:
+            _FILE_CACHE.pop(path, None)
+            for key in [key for key in _ENCODED_CACHE if key[0] == path]:
+                del _ENCODED_CACHE[key]
+
+
+def _encoded_listing(
+    path: str, name: str, build: Callable[[str], List[Any]]
+) -> bytes:
+    """
+    Return a JSON-encoded listing, re-encoding only when the file changed.
+
+    Args:
+        path: Path to business_events.yml
+        name: Cache key for this listing (e.g. "events")
+        build: Function returning the JSON-compatible list for a path
+
+    Returns:
+        JSON array as bytes ("[]" when the file does not exist)
+    """
+    if not os.path.exists(path):
+        return b"[]"
+
+    signature = _file_signature(path)
+    key = (path, name)
+    with _FILE_CACHE_LOCK:
+        cached = _ENCODED_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            _ENCODED_CACHE.move_to_end(key)
+            return cached[1]
+
+    encoded = json_utils.dumps(build(path))
+
+    with _FILE_CACHE_LOCK:
+        _ENCODED_CACHE[key] = (signature, encoded)
+        _ENCODED_CACHE.move_to_end(key)
+        while len(_ENCODED_CACHE) > _FILE_CACHE_MAX_ENTRIES:
+            _ENCODED_CACHE.popitem(last=False)
+    return encoded
+
+
 def load_business_events(path: Optional[str] = None) -> List[BusinessEvent]:
     """
     Load business events from YAML file.
@@ -82,8 +250,7 @@ def load_business_events(path: Optional[str] = None) -> List[BusinessEvent]:
         return []
 
     try:
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_events_file(path)
     except yaml.YAMLError as e:
         logger.error(f"YAML parse error in business events file {path}: {e}")
         raise FileOperationError("Invalid business events file format")
@@ -103,18 +270,97 @@ def load_business_events(path: Optional[str] = None) -> List[BusinessEvent]:
         raise FileOperationError("Invalid business events file format")
 
 
+def get_event_by_id(
+    event_id: str, path: Optional[str] = None
+) -> Optional[BusinessEvent]:
+    """
+    Look up a single business event by ID.
+
+    Uses the cached id index, so only the requested event is validated.
+
+    Args:
+        event_id: ID of event to look up
+        path: Optional path to business_events.yml. If not provided, uses
+              configured BUSINESS_EVENTS_PATH or default location.
+
+    Returns:
+        BusinessEvent object, or None if no event has this ID.
+
+    Raises:
+        FileOperationError: If file exists but cannot be read or parsed.
+    """
+    return get_events_by_ids([event_id], path).get(event_id)
+
+
+def get_events_by_ids(
+    event_ids: List[str], path: Optional[str] = None
+) -> Dict[str, BusinessEvent]:
+    """
+    Look up several business events by ID with a single file load.
+
+    Uses the cached id index, so only the requested events are validated.
+
+    Args:
+        event_ids: IDs of events to look up
+        path: Optional path to business_events.yml. If not provided, uses
+              configured BUSINESS_EVENTS_PATH or default location.
+
+    Returns:
+        Dictionary mapping each found event ID to its BusinessEvent. IDs
+        without a matching event are omitted.
+
+    Raises:
+        FileOperationError: If file exists but cannot be read or parsed.
+    """
+    if path is None:
+        path = _get_business_events_path()
+
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        data, events_by_id = _load_events_file(path)
+    except yaml.YAMLError as e:
+        logger.error(f"YAML parse error in business events file {path}: {e}")
+        raise FileOperationError("Invalid business events file format")
+    except Exception as e:
+        logger.error(f"Error reading business events file {path}: {e}")
+        raise FileOperationError(f"Failed to read business events file: {e}")
+
+    if "events" not in data:
+        logger.error(f"Missing 'events' key in business events file {path}")
+        raise FileOperationError("Invalid business events file format")
+
+    found = {}
+    for event_id in event_ids:
+        raw_event = events_by_id.get(event_id)
+        if raw_event is None or event_id in found:
+            continue
+        try:
+            found[event_id] = BusinessEvent(**raw_event)
+        except Exception as e:
+            logger.error(f"Invalid business event '{event_id}' in {path}: {e}")
+            raise FileOperationError("Invalid business events file format")
+    return found
+
+
+@_serialized
 def save_business_events(
-    events: List[BusinessEvent], path: Optional[str] = None
+    events: List[BusinessEvent],
+    path: Optional[str] = None,
+    processes: Optional[List[BusinessEventProcess]] = None,
 ) -> None:
     """
     Save business events to YAML file.
 
-    This function preserves existing processes when saving events.
+    This function preserves existing processes when saving events, unless
+    updated processes are passed in to be written in the same write.
 
     Args:
         events: List of BusinessEvent objects to save.
         path: Optional path to business_events.yml. If not provided, uses
               configured BUSINESS_EVENTS_PATH or default location.
+        processes: Optional processes to write alongside the events.
 
     Raises:
         FileOperationError: If file cannot be written.
@@ -126,8 +372,8 @@ def save_business_events(
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
     # Load existing processes to preserve them
-    existing_processes = []
-    if os.path.exists(path):
+    existing_processes = processes if processes is not None else []
+    if processes is None and os.path.exists(path):
         try:
             existing_processes = load_processes(path)
         except Exception:
@@ -141,8 +387,7 @@ def save_business_events(
         # Convert to dict for YAML serialization
         data = events_file.model_dump(mode="json")
 
-        with open(path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        _write_events_file(path, data)
         logger.info(f"Saved {len(events)} business events to {path}")
     except Exception as e:
         raise FileOperationError(f"Failed to write business events file: {e}")
@@ -156,15 +401,65 @@ def get_unique_domains() -> List[str]:
         Sorted list of unique domain strings (excluding None/null values)
     """
     events = load_business_events()
-    domains = set()
-    for event in events:
-        if event.domain:
-            domains.add(event.domain)
-    return sorted(list(domains))
+    return sorted({event.domain for event in events if event.domain})
+
+
+def load_business_events_json(path: Optional[str] = None) -> bytes:
+    """
+    Return all business events as a JSON array, encoded once per file version.
+
+    Raises:
+        FileOperationError: If file exists but cannot be read or parsed.
+    """
+    if path is None:
+        path = _get_business_events_path()
+    return _encoded_listing(
+        path,
+        "events",
+        lambda p: [event.model_dump(mode="json") for event in load_business_events(p)],
+    )
 
 
+def load_processes_json(path: Optional[str] = None) -> bytes:
+    """
+    Return all processes as a JSON array, encoded once per file version.
+
+    Raises:
+        FileOperationError: If file exists but cannot be read or parsed.
+    """
+    if path is None:
+        path = _get_processes_path()
+    return _encoded_listing(
+        path,
+        "processes",
+        lambda p: [process.model_dump(mode="json") for process in load_processes(p)],
+    )
+
+
+def get_unique_domains_json(path: Optional[str] = None) -> bytes:
+    """
+    Return the sorted unique event domains as a JSON array.
+
+    Raises:
+        FileOperationError: If file exists but cannot be read or parsed.
+    """
+    if path is None:
+        path = _get_business_events_path()
+    return _encoded_listing(
+        path,
+        "domains",
+        lambda p: sorted(
+            {event.domain for event in load_business_events(p) if event.domain}
+        ),
+    )
+
+
+@_serialized
 def create_event(
-    text: str, type: BusinessEventType, domain: Optional[str] = None
+    text: str,
+    type: BusinessEventType,
+    domain: Optional[str] = None,
+    annotations: Optional[BusinessEventAnnotations] = None,
 ) -> BusinessEvent:
     """
     Create a new business event with auto-generated ID.
@@ -173,9 +468,10 @@ def create_event(
         text: Event description text
         type: Event type (discrete, evolving, recurring)
         domain: Optional business domain
+        annotations: Optional already-validated annotations; used as-is
 
     Returns:
-        New BusinessEvent object with empty 7 Ws structure
+        New BusinessEvent object, with empty annotations unless provided
 
     Raises:
         ValidationError: If text is invalid
@@ -206,7 +502,9 @@ def create_event(
         domain=domain.strip() if domain else None,
         created_at=now,
         updated_at=now,
-        annotations=BusinessEventAnnotations(),
+        annotations=(
+            annotations if annotations is not None else BusinessEventAnnotations()
+        ),
         derived_entities=[],
     )
 
@@ -216,6 +514,7 @@ def create_event(
     return new_event
 
 
+@_serialized
 def update_event(event_id: str, updates: dict) -> BusinessEvent:
     """
     Update an existing business event.
@@ -331,6 +630,7 @@ def update_event(event_id: str, updates: dict) -> BusinessEvent:
     return updated_event
 
 
+@_serialized
 def delete_event(event_id: str) -> None:
     """
     Delete a business event.
@@ -358,39 +658,35 @@ def delete_event(event_id: str) -> None:
     process_id = event_to_delete.process_id
 
     events = [e for e in events if e.id != event_id]
-    save_business_events(events)
-    logger.info(f"Deleted business event: {event_id}")
 
-    # Recompute process superset if event was part of a process
+    # Remove the event from its process so both sections are saved in one write
+    processes = None
     if process_id:
         try:
-            # Remove event from process's event_ids list
             processes = load_processes()
-            process_index = None
-            for i, proc in enumerate(processes):
-                if proc.id == process_id:
-                    process_index = i
-                    break
-
-            if process_index is not None:
-                process = processes[process_index]
-                if event_id in process.event_ids:
-                    process.event_ids = [eid for eid in process.event_ids if eid != event_id]
-                    # Only recompute if process still has events
-                    if process.event_ids:
-                        process.annotations_superset = _compute_annotation_union(
-                            [e for e in load_business_events() if e.id in process.event_ids]
-                        )
-                        process.updated_at = datetime.now()
-                    else:
-                        # Process has no events left, resolve it
-                        process.resolved_at = datetime.now()
-                        process.updated_at = datetime.now()
-                    save_processes(processes)
+            process = next((p for p in processes if p.id == process_id), None)
+            if process is not None and event_id in process.event_ids:
+                process.event_ids = [eid for eid in process.event_ids if eid != event_id]
+                # Only recompute if process still has events
+                if process.event_ids:
+                    member_ids = set(process.event_ids)
+                    process.annotations_superset = _compute_annotation_union(
+                        [e for e in events if e.id in member_ids]
+                    )
+                    process.updated_at = datetime.now()
+                else:
+                    # Process has no events left, resolve it
+                    process.resolved_at = datetime.now()
+                    process.updated_at = datetime.now()
         except Exception as e:
             logger.warning(f"Failed to update process after event deletion: {e}")
+            processes = None
 
+    save_business_events(events, processes=processes)
+    logger.info(f"Deleted business event: {event_id}")
 
+
+@_serialized
 def update_event_annotations(event_id: str, annotations_data: dict) -> BusinessEvent:
     """
     Update the entire annotations structure for a business event.
@@ -410,6 +706,7 @@ def update_event_annotations(event_id: str, annotations_data: dict) -> BusinessE
     return update_event(event_id, {"annotations": annotations_data})
 
 
+@_serialized
 def add_annotation_entry(
     event_id: str,
     annotation_type: str,
@@ -437,10 +734,9 @@ def add_annotation_entry(
         ValidationError: If annotation_type is invalid or entry_id is not unique
         FileOperationError: If file operations fail
     """
-    valid_types = ["who", "what", "when", "where", "how", "how_many", "why"]
-    if annotation_type not in valid_types:
+    if annotation_type not in VALID_ANNOTATION_TYPES:
         raise ValidationError(
-            f"Invalid annotation_type: '{annotation_type}'. Must be one of: {', '.join(valid_types)}"
+            f"Invalid annotation_type: '{annotation_type}'. Must be one of: {_VALID_ANNOTATION_TYPES_MSG}"
         )
 
     if not text or not text.strip():
@@ -492,6 +788,7 @@ def add_annotation_entry(
     return updated_event
 
 
+@_serialized
 def remove_annotation_entry(event_id: str, entry_id: str) -> BusinessEvent:
     """
     Remove an annotation entry by entry_id from a business event.
@@ -526,7 +823,7 @@ def remove_annotation_entry(event_id: str, entry_id: str) -> BusinessEvent:
     current_annotations = event.annotations.model_dump()
     entry_found = False
 
-    for annotation_type in ["who", "what", "when", "where", "how", "how_many", "why"]:
+    for annotation_type in ANNOTATION_TYPES:
         category_list = current_annotations.get(annotation_type, [])
         original_length = len(category_list)
         category_list = [
@@ -543,6 +840,7 @@ def remove_annotation_entry(event_id: str, entry_id: str) -> BusinessEvent:
     return updated_event
 
 
+@_serialized
 def update_annotation_entry(
     event_id: str,
     entry_id: str,
@@ -592,7 +890,7 @@ def update_annotation_entry(
     current_annotations = event.annotations.model_dump()
     entry_found = False
 
-    for annotation_type in ["who", "what", "when", "where", "how", "how_many", "why"]:
+    for annotation_type in ANNOTATION_TYPES:
         category_list = current_annotations.get(annotation_type, [])
         for entry in category_list:
             if entry.get("id") == entry_id:
@@ -625,7 +923,7 @@ def _collect_all_entry_ids(annotations: BusinessEventAnnotations) -> set:
         Set of entry IDs
     """
     entry_ids = set()
-    for annotation_type in ["who", "what", "when", "where", "how", "how_many", "why"]:
+    for annotation_type in ANNOTATION_TYPES:
         category_list = getattr(annotations, annotation_type, [])
         for entry in category_list:
             if hasattr(entry, "id"):
@@ -643,167 +941,20 @@ def _get_processes_path() -> str:
     return _get_business_events_path()
 
 
-def load_processes(path: Optional[str] = None) -> List[BusinessEventProcess]:
-    """
-    Load business event processes from YAML file.
-
-    Args:
-        path: Optional path to business_events.yml. If not provided, uses
-              configured BUSINESS_EVENTS_PATH or default location.
-
-    Returns:
-        List of BusinessEventProcess objects.
-
-    Raises:
-        FileOperationError: If file exists but cannot be read or parsed.
-    """
-    if path is None:
-        path = _get_processes_path()
-
-    # If file doesn't exist, return empty list
-    if not os.path.exists(path):
-        logger.info(f"Business events file not found at {path}, returning empty processes list")
-        return []
-
-    try:
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
-    except yaml.YAMLError as e:
-        logger.error(f"YAML parse error in business events file {path}: {e}")
-        raise FileOperationError("Invalid business events file format")
-    except Exception as e:
-        logger.error(f"Error reading business events file {path}: {e}")
-        raise FileOperationError(f"Failed to read business events file: {e}")
-
-    # Parse processes section
-    try:
-        if "processes" not in data:
-            return []
-        processes_file = BusinessEventProcessFile(**{"processes": data["processes"]})
-        return processes_file.processes
-    except Exception as e:
-        logger.error(f"Invalid processes structure in {path}: {e}")
-        raise FileOperationError("Invalid business events file format")
-
-
-def save_processes(
-    processes: List[BusinessEventProcess], path: Optional[str] = None
-) -> None:
-    """
-    Save business event processes to YAML file.
-
-    Args:
-        processes: List of BusinessEventProcess objects to save.
-        path: Optional path to business_events.yml. If not provided, uses
-              configured BUSINESS_EVENTS_PATH or default location.
-
-    Raises:
-        FileOperationError: If file cannot be written.
-    """
-    if path is None:
-        path = _get_processes_path()
-
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-
-    # Load existing file data to preserve events section
-    existing_data = {}
-    if os.path.exists(path):
-        try:
-            with open(path, "r") as f:
-                existing_data = yaml.safe_load(f) or {}
-        except Exception:
-            pass  # If we can't read, we'll create new file
-
-    # Create processes file structure
-    processes_file = BusinessEventProcessFile(processes=processes)
-
-    try:
-        # Merge with existing data (preserve events)
-        data = existing_data.copy()
-        data["processes"] = processes_file.model_dump(mode="json")["processes"]
-
-        with open(path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
-        logger.info(f"Saved {len(processes)} processes to {path}")
-    except Exception as e:
-        raise FileOperationError(f"Failed to write processes file: {e}")
-
-
-def update_process(process_id: str, updates: dict) -> BusinessEventProcess:
-    """
-    Update an existing business event process.
-
-    Args:
-        process_id: ID of process to update
-        updates: Dictionary with fields to update (name, type, domain)
-
-    Returns:
-        Updated BusinessEventProcess object
-
-    Raises:
-        NotFoundError: If process not found
-        ValidationError: If updates are invalid
-        FileOperationError: If file operations fail
-    """
-    processes = load_processes()
-    process_index = None
-    for i, process in enumerate(processes):
-        if process.id == process_id:
-            process_index = i
-            break
-
-    if process_index is None:
-        raise NotFoundError(f"Process '{process_id}' not found")
-
-    process = processes[process_index]
-
-    # Don't allow updating resolved processes
-    if process.resolved_at is not None:
-        raise ValidationError(f"Cannot update resolved process '{process_id}'")
-
-    # Update fields
-    if "name" in updates:
-        name = updates["name"]
-        if not name or not name.strip():
-            raise ValidationError("Process name cannot be empty")
-        process.name = name.strip()
-
-    if "type" in updates:
-        try:
-            process.type = BusinessEventType(updates["type"])
-        except ValueError:
-            raise ValidationError(f"Invalid process type: {updates['type']}")
-
-    if "domain" in updates:
-        domain_value = updates["domain"]
-        if domain_value is None or (
-            isinstance(domain_value, str) and not domain_value.strip()
-        ):
-            raise ValidationError("Process domain cannot be empty")
-        process.domain = domain_value.strip()
-
-    process.updated_at = datetime.now()
-
-    # Validate updated process
-    try:
-        updated_process = BusinessEventProcess(**process.model_dump())
-    except Exception as e:
-        raise ValidationError(f"Invalid process data: {str(e)}") from e
-
-    processes[process_index] = updated_process
-    save_processes(processes)
-    logger.info(f"Updated process: {process_id}")
-    return updated_process
-
-
-def attach_events_to_process(process_id: str, event_ids: List[str]) -> BusinessEventProcess:
+@_serialized
+def attach_events_to_process(
+    process_id: str,
+    event_ids: List[str],
+    events: Optional[List[BusinessEvent]] = None,
+) -> BusinessEventProcess:
     """
     Attach events to a process.
 
     Args:
         process_id: ID of process
         event_ids: List of event IDs to attach
+        events: Optional pre-loaded events used for validation. Loaded from
+                disk when not provided.
 
     Returns:
         Updated BusinessEventProcess object
@@ -830,7 +981,8 @@ def attach_events_to_process(process_id: str, event_ids: List[str]) -> BusinessE
         raise ValidationError(f"Cannot attach events to resolved process '{process_id}'")
 
     # Validate events exist and aren't already in another process
-    events = load_business_events()
+    if events is None:
+        events = load_business_events()
     existing_event_ids = {e.id for e in events}
     for event_id in event_ids:
         if event_id not in existing_event_ids:
@@ -848,14 +1000,8 @@ def attach_events_to_process(process_id: str, event_ids: List[str]) -> BusinessE
         if event_id not in process.event_ids:
             process.event_ids.append(event_id)
 
-        # Update event's process_id
-        events = load_business_events()
-        for i, event in enumerate(events):
-            if event.id == event_id:
-                events[i].process_id = process_id
-                events[i].updated_at = datetime.now()
-                break
-        save_business_events(events)
+    # Update the events' process_id in one write
+    _set_events_process_id(event_ids, process_id)
 
     process.updated_at = datetime.now()
     processes[process_index] = process
@@ -864,6 +1010,7 @@ def attach_events_to_process(process_id: str, event_ids: List[str]) -> BusinessE
     return process
 
 
+@_serialized
 def detach_events_from_process(process_id: str, event_ids: List[str]) -> BusinessEventProcess:
     """
     Detach events from a process.
@@ -896,12 +1043,7 @@ def detach_events_from_process(process_id: str, event_ids: List[str]) -> Busines
     process.event_ids = [eid for eid in process.event_ids if eid not in event_ids]
 
     # Update events' process_id
-    events = load_business_events()
-    for i, event in enumerate(events):
-        if event.id in event_ids and event.process_id == process_id:
-            events[i].process_id = None
-            events[i].updated_at = datetime.now()
-    save_business_events(events)
+    _set_events_process_id(event_ids, None, only_from=process_id)
 
     process.updated_at = datetime.now()
     processes[process_index] = process
@@ -940,8 +1082,7 @@ def load_processes(path: Optional[str] = None) -> List[BusinessEventProcess]:
         return []
 
     try:
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_events_file(path)
     except yaml.YAMLError as e:
         logger.error(f"YAML parse error in business events file {path}: {e}")
         raise FileOperationError("Invalid business events file format")
@@ -967,6 +1108,54 @@ def load_processes(path: Optional[str] = None) -> List[BusinessEventProcess]:
         raise FileOperationError("Invalid business events file format")
 
 
+def get_process_by_id(
+    process_id: str, path: Optional[str] = None
+) -> Optional[BusinessEventProcess]:
+    """
+    Look up a single business event process by ID.
+
+    Scans the cached raw file data and validates only the matching process.
+
+    Args:
+        process_id: ID of process to look up
+        path: Optional path to business_events.yml. If not provided, uses
+              configured BUSINESS_EVENTS_PATH or default location.
+
+    Returns:
+        BusinessEventProcess object, or None if no process has this ID.
+
+    Raises:
+        FileOperationError: If file exists but cannot be read or parsed.
+    """
+    if path is None:
+        path = _get_business_events_path()
+
+    if not os.path.exists(path):
+        return None
+
+    try:
+        data = _read_events_file(path)
+    except yaml.YAMLError as e:
+        logger.error(f"YAML parse error in business events file {path}: {e}")
+        raise FileOperationError("Invalid business events file format")
+    except Exception as e:
+        logger.error(f"Error reading business events file {path}: {e}")
+        raise FileOperationError(f"Failed to read business events file: {e}")
+
+    for proc_data in data.get("processes") or []:
+        if not isinstance(proc_data, dict) or proc_data.get("id") != process_id:
+            continue
+        if "resolved_at" in proc_data and proc_data["resolved_at"] is None:
+            proc_data = {k: v for k, v in proc_data.items() if k != "resolved_at"}
+        try:
+            return BusinessEventProcess(**proc_data)
+        except Exception as e:
+            logger.error(f"Invalid process '{process_id}' in {path}: {e}")
+            raise FileOperationError("Invalid business events file format")
+    return None
+
+
+@_serialized
 def save_processes(
     processes: List[BusinessEventProcess], path: Optional[str] = None
 ) -> None:
@@ -1006,13 +1195,64 @@ def save_processes(
         # Convert to dict for YAML serialization
         data = events_file.model_dump(mode="json")
 
-        with open(path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        _write_events_file(path, data)
         logger.info(f"Saved {len(processes)} business event processes to {path}")
     except Exception as e:
         raise FileOperationError(f"Failed to write business events file: {e}")
 
 
+@_serialized
+def _set_events_process_id(
+    event_ids: List[str],
+    process_id: Optional[str],
+    only_from: Optional[str] = None,
+) -> set:
+    """
+    Set process_id on several events with a single load and save.
+
+    Args:
+        event_ids: IDs of events to update (unknown IDs are ignored)
+        process_id: Process ID to link, or None to unlink
+        only_from: If set, only events currently linked to this process change
+
+    Returns:
+        Set of other process IDs the changed events were previously linked to
+    """
+    target_ids = set(event_ids)
+    if not target_ids:
+        return set()
+
+    events = load_business_events()
+    now = datetime.now()
+    previous_process_ids = set()
+    changed = False
+    for event in events:
+        if event.id not in target_ids:
+            continue
+        if only_from is not None and event.process_id != only_from:
+            continue
+        if event.process_id and event.process_id != process_id:
+            previous_process_ids.add(event.process_id)
+        event.process_id = process_id
+        event.updated_at = now
+        changed = True
+
+    if changed:
+        save_business_events(events)
+    return previous_process_ids
+
+
+def _recompute_supersets_quietly(process_ids: set) -> None:
+    """Recompute supersets for the given processes, logging instead of raising."""
+    for process_id in process_ids:
+        try:
+            recompute_process_superset(process_id)
+        except NotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to recompute superset for process {process_id}: {e}")
+
+
 def _compute_annotation_union(
     events: List[BusinessEvent],
 ) -> BusinessEventAnnotations:
@@ -1030,15 +1270,14 @@ def _compute_annotation_union(
     Returns:
         BusinessEventAnnotations with unioned entries
     """
-    annotation_types = ["who", "what", "when", "where", "how", "how_many", "why"]
-    annotations_by_type: Dict[str, List[AnnotationEntry]] = {t: [] for t in annotation_types}
+    annotations_by_type: Dict[str, List[AnnotationEntry]] = {t: [] for t in ANNOTATION_TYPES}
 
     def _normalize_key(entry: AnnotationEntry) -> tuple[str, str]:
         normalized_text = entry.text.lower().strip() if entry.text else ""
         normalized_desc = entry.description.lower().strip() if entry.description else ""
         return normalized_text, normalized_desc
 
-    for annotation_type in annotation_types:
+    for annotation_type in ANNOTATION_TYPES:
         seen_by_dimension: Dict[str, int] = {}
         seen_by_text_no_dim: Dict[tuple[str, str], int] = {}
         seen_text_with_dim: set[tuple[str, str]] = set()
@@ -1076,7 +1315,7 @@ def _compute_annotation_union(
                     seen_by_text_no_dim[text_key] = index
 
     result = BusinessEventAnnotations()
-    for annotation_type in annotation_types:
+    for annotation_type in ANNOTATION_TYPES:
         setattr(result, annotation_type, annotations_by_type[annotation_type])
 
     return result
@@ -1091,11 +1330,13 @@ def _require_process_domain(domain: Optional[str]) -> str:
     return domain.strip()
 
 
+@_serialized
 def create_process(
     name: str,
     type: BusinessEventType,
     domain: str,
     event_ids: List[str],
+    events: Optional[List[BusinessEvent]] = None,
 ) -> BusinessEventProcess:
     """
     Create a new business event process with auto-generated ID.
@@ -1105,6 +1346,7 @@ def create_process(
         type: Process type (discrete, evolving, recurring)
         domain: Business domain for the process
         event_ids: List of event IDs to include in this process
+        events: Optional pre-loaded events. Loaded from disk when not provided.
 
     Returns:
         New BusinessEventProcess object with computed annotations superset
@@ -1123,7 +1365,8 @@ def create_process(
     domain_value = _require_process_domain(domain)
 
     # Validate all events exist
-    events = load_business_events()
+    if events is None:
+        events = load_business_events()
     existing_event_ids = {event.id for event in events}
     for event_id in event_ids:
         if event_id not in existing_event_ids:
@@ -1162,19 +1405,20 @@ def create_process(
         annotations_superset=annotations_superset,
     )
 
-    # Update events to link them to this process
-    for event_id in event_ids:
-        update_event(event_id, {"process_id": new_id})
+    # Link events to this process in one write
+    previous_process_ids = _set_events_process_id(event_ids, new_id)
 
     # Save process
     processes.append(new_process)
     save_processes(processes)
+    _recompute_supersets_quietly(previous_process_ids)
     logger.info(
         f"Created business event process: {new_id} (type: {type.value}, domain: {domain_value})"
     )
     return new_process
 
 
+@_serialized
 def update_process(process_id: str, updates: dict) -> BusinessEventProcess:
     """
     Update an existing business event process.
@@ -1249,14 +1493,14 @@ def update_process(process_id: str, updates: dict) -> BusinessEventProcess:
         new_event_ids_set = set(new_event_ids)
 
         # Update event links: remove process_id from events no longer in process
-        for event_id in old_event_ids - new_event_ids_set:
-            event = next((e for e in events if e.id == event_id), None)
-            if event and event.process_id == process_id:
-                update_event(event_id, {"process_id": None})
+        _set_events_process_id(
+            list(old_event_ids - new_event_ids_set), None, only_from=process_id
+        )
 
         # Add process_id to newly added events
-        for event_id in new_event_ids_set - old_event_ids:
-            update_event(event_id, {"process_id": process_id})
+        previous_process_ids = _set_events_process_id(
+            list(new_event_ids_set - old_event_ids), process_id
+        )
 
     # Recompute annotations superset if event_ids changed
     if "event_ids" in updates:
@@ -1274,10 +1518,13 @@ def update_process(process_id: str, updates: dict) -> BusinessEventProcess:
 
     processes[process_index] = updated_process
     save_processes(processes)
+    if "event_ids" in updates:
+        _recompute_supersets_quietly(previous_process_ids)
     logger.info(f"Updated business event process: {process_id}")
     return updated_process
 
 
+@_serialized
 def resolve_process(process_id: str) -> BusinessEventProcess:
     """
     Resolve (ungroup) a business event process.
@@ -1345,6 +1592,7 @@ def resolve_process(process_id: str) -> BusinessEventProcess:
     return process
 
 
+@_serialized
 def recompute_process_superset(process_id: str) -> BusinessEventProcess:
     """
     Recompute the annotations superset for a process.
@@ -1393,6 +1641,7 @@ def recompute_process_superset(process_id: str) -> BusinessEventProcess:
     return process
 
 
+@_serialized
 def recompute_all_process_supersets() -> None:
     """
     Recompute annotations supersets for all active (non-resolved) processes.
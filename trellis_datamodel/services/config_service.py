@@ -4,11 +4,14 @@ Config service for managing trellis.yml through the API.
 Handles loading, validation, conflict detection, backup, and atomic writes.
 """
 
+import copy
+import functools
 import hashlib
 import logging
 import os
 import shutil
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
@@ -27,6 +30,7 @@ from trellis_datamodel.models.schemas import (
     ConfigSchemaResponse,
     ConfigFieldMetadata,
 )
+from trellis_datamodel.utils import yaml_sidecar
 
 logger = logging.getLogger(__name__)
 
@@ -196,13 +200,39 @@ _BETA_FIELDS = [
 ]
 
 
+# Normalized config and file info per config path, validated against the
+# file's (st_mtime_ns, st_size) so repeated GET /api/config calls skip the YAML
+# parse and hash while trellis.yml is unchanged.
+_LOADED_CONFIG_CACHE: Dict[
+    str, Tuple[Tuple[int, int], Dict[str, Any], Dict[str, Any]]
+] = {}
+_LOADED_CONFIG_LOCK = threading.Lock()
+
+
+def clear_config_cache(config_path: Optional[str] = None) -> None:
+    """Drop the cached config for one path, or for all paths when omitted."""
+    with _LOADED_CONFIG_LOCK:
+        if config_path is None:
+            _LOADED_CONFIG_CACHE.clear()
+        else:
+            _LOADED_CONFIG_CACHE.pop(config_path, None)
+
+
+def _hash_bytes(data: bytes) -> str:
+    """
+    Hash file contents for change detection.
+
+    The hash is only compared for equality, never used for security, so
+    BLAKE2b is used for speed. A 32-byte digest keeps the 64-character hex
+    shape clients already store.
+    """
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
 def _get_file_hash(file_path: str) -> str:
-    """Calculate SHA256 hash of a file."""
-    sha256_hash = hashlib.sha256()
+    """Calculate the content hash of a file."""
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+        return _hash_bytes(f.read())
 
 
 def _get_file_mtime(file_path: str) -> float:
@@ -210,6 +240,22 @@ def _get_file_mtime(file_path: str) -> float:
     return os.path.getmtime(file_path)
 
 
+def _read_file_info(file_path: str) -> Tuple[float, str]:
+    """
+    Get a file's modification time and content hash together.
+
+    Uses a single stat and a single read, which is what conflict detection
+    needs; prefer this over calling _get_file_mtime and _get_file_hash.
+
+    Returns:
+        Tuple of (mtime, hash)
+    """
+    with open(file_path, "rb") as f:
+        mtime = os.fstat(f.fileno()).st_mtime
+        data = f.read()
+    return mtime, _hash_bytes(data)
+
+
 def _normalize_nested_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize config to match Pydantic schema structure."""
     normalized = {}
@@ -399,7 +445,9 @@ def _atomic_write(config_path: str, config: Dict[str, Any]) -> None:
     """
     Atomically write config to file.
 
-    Uses temp file + move to ensure atomic operation.
+    Uses temp file + move to ensure atomic operation. The JSON sidecar of the
+    old file is deleted, since a rewrite within the filesystem's mtime
+    resolution could otherwise still match its signature.
     """
     # Write to temp file
     fd, temp_path = tempfile.mkstemp(
@@ -412,6 +460,7 @@ def _atomic_write(config_path: str, config: Dict[str, Any]) -> None:
 
         # Atomic move
         os.replace(temp_path, config_path)
+        yaml_sidecar.remove_sidecar(config_path)
         logger.info(f"Atomically wrote config to: {config_path}")
     except Exception as e:
         # Clean up temp file on error
@@ -422,11 +471,13 @@ def _atomic_write(config_path: str, config: Dict[str, Any]) -> None:
         raise ConfigurationError(f"Failed to write config: {e}")
 
 
+@functools.lru_cache(maxsize=1)
 def get_schema_metadata() -> ConfigSchemaResponse:
     """
     Get schema metadata for the config UI.
 
-    Returns field definitions and list of beta flags.
+    Returns field definitions and list of beta flags. The metadata is static,
+    so the response model is built once and shared; callers must not mutate it.
     """
     return ConfigSchemaResponse(fields=_FIELD_DEFINITIONS, beta_flags=_BETA_FIELDS)
 
@@ -452,26 +503,35 @@ def load_config(
             "No config file found. Please create trellis.yml in the current directory."
         )
 
-    if not os.path.exists(config_path):
+    try:
+        stat = os.stat(config_path)
+    except OSError:
         raise ConfigurationError(f"Config file not found: {config_path}")
 
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _LOADED_CONFIG_LOCK:
+        cached = _LOADED_CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1]), dict(cached[2])
+
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f) or {}
+        config = yaml_sidecar.load_yaml(config_path, signature) or {}
     except Exception as e:
         raise ConfigurationError(f"Failed to read config file: {e}")
 
     # Get file info for conflict detection
     file_info = {
         "path": config_path,
-        "mtime": _get_file_mtime(config_path),
+        "mtime": stat.st_mtime,
         "hash": _get_file_hash(config_path),
     }
 
     # Normalize config
     normalized = _normalize_nested_config(config)
 
-    return normalized, file_info
+    with _LOADED_CONFIG_LOCK:
+        _LOADED_CONFIG_CACHE[config_path] = (signature, normalized, file_info)
+    return copy.deepcopy(normalized), dict(file_info)
 
 
 def validate_config(config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
@@ -525,8 +585,7 @@ def save_config(
         raise ConfigurationError(f"Config file not found: {config_path}")
 
     # Check for conflicts
-    current_mtime = _get_file_mtime(config_path)
-    current_hash = _get_file_hash(config_path)
+    current_mtime, current_hash = _read_file_info(config_path)
 
     conflict_message = None
     if expected_mtime and expected_mtime != current_mtime:
@@ -543,19 +602,10 @@ def save_config(
         raise CustomValidationError(f"Config validation failed: {error_msg}")
 
     # Create backup before overwrite
-    backup_path = _create_backup(config_path)
+    _create_backup(config_path)
 
     # Atomically write config
     _atomic_write(config_path, normalized)
-
-    # Return saved config with new file info
-    file_info = {
-        "path": config_path,
-        "mtime": _get_file_mtime(config_path),
-        "hash": _get_file_hash(config_path),
-    }
-
-    if backup_path:
-        file_info["backup_path"] = backup_path
+    clear_config_cache(config_path)
 
     return normalized, conflict_message
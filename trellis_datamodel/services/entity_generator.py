@@ -461,7 +461,8 @@ def generate_entities_from_process(
 
     # Load member events for metadata
     events = load_business_events()
-    process_events = [e for e in events if e.id in process.event_ids]
+    member_ids = set(process.event_ids)
+    process_events = [e for e in events if e.id in member_ids]
 
     if not process_events:
         errors.append("Process must have at least one member event")
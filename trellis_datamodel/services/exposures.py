@@ -12,61 +12,149 @@ The service traverses upstream dependencies to ensure exposures that depend on
 mart/intermediate models still mark underlying entity-bound models as "used".
 """
 
-import json
+import functools
+import logging
 import os
 import re
-from collections import deque
-from typing import Any
-
-import yaml
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 from trellis_datamodel import config as cfg
 from trellis_datamodel.exceptions import FeatureDisabledError
+from trellis_datamodel.utils import json_utils, yaml_cache
+from trellis_datamodel.utils.path_validation import path_exists_cached
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _ManifestEntry:
+    """A parsed manifest plus lookup tables derived from it on first use."""
+
+    manifest: dict[str, Any]
+    # model name -> [(version, unique_id)] in manifest order
+    models_by_name: Optional[dict[str, list[tuple[Optional[str], str]]]] = None
+    # node unique_id -> upstream model ids (including itself), filled on demand
+    upstream_models: dict[str, frozenset[str]] = field(default_factory=dict)
+
+
+# Parsed manifest.json per path, validated against the file's
+# (st_mtime_ns, st_size) signature. Entries are shared and must not be mutated.
+_MANIFEST_CACHE: "OrderedDict[str, tuple[tuple[int, int], _ManifestEntry]]" = (
+    OrderedDict()
+)
+_MANIFEST_CACHE_LOCK = threading.Lock()
+_MANIFEST_CACHE_MAX_ENTRIES = 4
+
+
+_REF_PATTERN = re.compile(
+    r"ref\(\s*['\"]([^,'\"]+)['\"](?:\s*,\s*(?:v|version)\s*=\s*([0-9]+))?\s*\)"
+)
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_ref(ref_value: str) -> tuple[str, str | None]:
     """
     Parse ref() targets, supporting optional version arguments.
 
+    The same ref strings recur across exposures, so results are memoized.
+
     Examples:
         ref('player') -> ("player", None)
         ref('player', v=1) -> ("player", "1")
         ref("player", version=2) -> ("player", "2")
     """
-    ref_pattern = (
-        r"ref\(\s*['\"]([^,'\"]+)['\"](?:\s*,\s*(?:v|version)\s*=\s*([0-9]+))?\s*\)"
-    )
-    match = re.fullmatch(ref_pattern, ref_value.strip())
+    match = _REF_PATTERN.fullmatch(ref_value.strip())
     if match:
         return match.group(1), match.group(2)
     return ref_value, None
 
 
-def _load_manifest() -> dict[str, Any]:
-    """Load dbt manifest.json."""
-    if not cfg.MANIFEST_PATH or not os.path.exists(cfg.MANIFEST_PATH):
-        return {}
+def _load_manifest_entry() -> _ManifestEntry:
+    """
+    Load dbt manifest.json, reusing the previous parse while it is unchanged.
+
+    The returned entry is shared between requests and must not be mutated
+    (its lazily built indexes excepted).
+    """
+    manifest_path = cfg.MANIFEST_PATH
+    if not manifest_path:
+        return _ManifestEntry({})
     try:
-        with open(cfg.MANIFEST_PATH, "r") as f:
-            return json.load(f)
+        try:
+            stat = os.stat(manifest_path)
+        except FileNotFoundError:
+            return _ManifestEntry({})
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with _MANIFEST_CACHE_LOCK:
+            cached = _MANIFEST_CACHE.get(manifest_path)
+            if cached is not None and cached[0] == signature:
+                _MANIFEST_CACHE.move_to_end(manifest_path)
+                return cached[1]
+
+        with open(manifest_path, "rb") as f:
+            entry = _ManifestEntry(json_utils.loads(f.read()))
+
+        with _MANIFEST_CACHE_LOCK:
+            _MANIFEST_CACHE[manifest_path] = (signature, entry)
+            _MANIFEST_CACHE.move_to_end(manifest_path)
+            while len(_MANIFEST_CACHE) > _MANIFEST_CACHE_MAX_ENTRIES:
+                _MANIFEST_CACHE.popitem(last=False)
+        return entry
     except Exception as e:
-        print(f"Warning: Could not load manifest: {e}")
-        return {}
+        logger.warning("Could not load manifest: %s", e)
+        return _ManifestEntry({})
+
+
+def _load_manifest() -> dict[str, Any]:
+    """Load dbt manifest.json (shared; must not be mutated)."""
+    return _load_manifest_entry().manifest
 
 
 def _load_data_model() -> dict[str, Any]:
-    """Load data model YAML."""
+    """
+    Load data model YAML through the shared parse cache.
+
+    The returned dict is shared and must not be mutated.
+    """
     if not cfg.DATA_MODEL_PATH or not os.path.exists(cfg.DATA_MODEL_PATH):
         return {}
     try:
-        with open(cfg.DATA_MODEL_PATH, "r") as f:
-            return yaml.safe_load(f) or {}
+        return yaml_cache.load_yaml_cached(cfg.DATA_MODEL_PATH, shared=True) or {}
     except Exception as e:
-        print(f"Warning: Could not load data model: {e}")
+        logger.warning("Could not load data model: %s", e)
         return {}
 
 
-def _resolve_model_ref(ref_string: str, manifest: dict[str, Any]) -> str | None:
+def clear_manifest_cache() -> None:
+    """Drop all cached manifest parses."""
+    with _MANIFEST_CACHE_LOCK:
+        _MANIFEST_CACHE.clear()
+
+
+def _models_by_name(
+    entry: _ManifestEntry,
+) -> dict[str, list[tuple[Optional[str], str]]]:
+    """Return (building once per manifest) the model name index of ``entry``."""
+    if entry.models_by_name is None:
+        index: dict[str, list[tuple[Optional[str], str]]] = {}
+        for unique_id, node in entry.manifest.get("nodes", {}).items():
+            if node.get("resource_type") != "model":
+                continue
+            node_version = node.get("version")
+            index.setdefault(node.get("name"), []).append(
+                (str(node_version) if node_version is not None else None, unique_id)
+            )
+        entry.models_by_name = index
+    return entry.models_by_name
+
+
+def _resolve_model_ref(
+    ref_string: str, models_by_name: dict[str, list[tuple[Optional[str], str]]]
+) -> str | None:
     """
     Resolve a ref('model_name') string to a model unique_id.
 
@@ -76,48 +164,59 @@ def _resolve_model_ref(ref_string: str, manifest: dict[str, Any]) -> str | None:
     if not model_name:
         return None
 
-    # Search manifest nodes for matching model
-    nodes = manifest.get("nodes", {})
-    for unique_id, node in nodes.items():
-        if node.get("resource_type") != "model":
-            continue
-        if node.get("name") == model_name:
-            # If version specified, check if it matches
-            if version is not None:
-                node_version = node.get("version")
-                if node_version is not None and str(node_version) == version:
-                    return unique_id
-            else:
-                # No version specified, return first match
-                return unique_id
+    for node_version, unique_id in models_by_name.get(model_name, ()):
+        # No version specified: first match wins; otherwise it must match
+        if version is None or node_version == version:
+            return unique_id
 
     return None
 
 
-def _find_entities_for_model(unique_id: str, data_model: dict[str, Any]) -> list[str]:
+def _entities_by_model(data_model: dict[str, Any]) -> dict[str, list[str]]:
     """
-    Find all entity IDs that are bound to the given model unique_id.
+    Map each model unique_id to the IDs of the entities bound to it.
 
-    Checks both dbt_model and additional_models fields.
+    Covers both dbt_model and additional_models; entity IDs keep data model
+    order and appear at most once per model.
     """
-    entity_ids = []
-    entities = data_model.get("entities", [])
-    for entity in entities:
+    index: dict[str, list[str]] = {}
+    for entity in data_model.get("entities", []):
         entity_id = entity.get("id")
         if not entity_id:
             continue
 
-        # Check primary dbt_model
-        if entity.get("dbt_model") == unique_id:
-            entity_ids.append(entity_id)
-            continue
-
-        # Check additional_models
+        model_ids = [entity.get("dbt_model")]
         additional_models = entity.get("additional_models", [])
-        if isinstance(additional_models, list) and unique_id in additional_models:
-            entity_ids.append(entity_id)
+        if isinstance(additional_models, list):
+            model_ids.extend(additional_models)
 
-    return entity_ids
+        for model_id in model_ids:
+            if not isinstance(model_id, str):
+                continue
+            entity_ids = index.setdefault(model_id, [])
+            if not entity_ids or entity_ids[-1] != entity_id:
+                entity_ids.append(entity_id)
+
+    return index
+
+
+def _node_dependencies(node: Any) -> list[str]:
+    """Return the upstream ids listed in a manifest node's depends_on."""
+    if not node:
+        return []
+    depends_on = node.get("depends_on")
+    if not depends_on:
+        return []
+
+    if isinstance(depends_on, dict):
+        upstream_nodes = depends_on.get("nodes", [])
+    elif isinstance(depends_on, list):
+        upstream_nodes = depends_on
+    else:
+        upstream_nodes = []
+    return [
+        upstream_id for upstream_id in upstream_nodes if isinstance(upstream_id, str)
+    ]
 
 
 def _collect_upstream_model_ids(
@@ -149,28 +248,88 @@ def _collect_upstream_model_ids(
         if current_id.startswith("model."):
             upstream_models.add(current_id)
 
-        current_node = nodes.get(current_id)
-        if not current_node:
+        for upstream_id in _node_dependencies(nodes.get(current_id)):
+            if upstream_id not in visited:
+                # Continue traversal for all upstream ids; non-model ids will
+                # naturally stop when not present in manifest["nodes"].
+                queue.append(upstream_id)
+
+    return upstream_models
+
+
+def _upstream_model_ids(
+    manifest: dict[str, Any], model_unique_id: str, memo: dict[str, frozenset[str]]
+) -> frozenset[str]:
+    """
+    Same result as _collect_upstream_model_ids, memoized per node.
+
+    Walks the DAG depth-first (iteratively, so deep lineage cannot hit the
+    recursion limit) and stores the upstream model set of every node it
+    finishes in ``memo``. Exposures with overlapping lineage therefore share
+    the work, and each node's set is built once per manifest.
+
+    dbt manifests are acyclic; should a cycle show up anyway, the plain BFS
+    answers for the start node. Sets already stored are still complete: a
+    node is only finished once all of its upstream nodes are.
+
+    Concurrent callers may share ``memo``; at worst they compute the same
+    (identical) set twice.
+    """
+    cached = memo.get(model_unique_id)
+    if cached is not None:
+        return cached
+
+    nodes = manifest.get("nodes", {}) if isinstance(manifest, dict) else {}
+    if not nodes or not model_unique_id:
+        return frozenset()
+
+    on_path: set[str] = set()
+    stack: list[tuple[str, bool]] = [(model_unique_id, False)]
+    while stack:
+        node_id, expanded = stack.pop()
+        if node_id in memo:
             continue
 
-        depends_on = current_node.get("depends_on")
-        if not depends_on:
+        if not expanded:
+            if node_id in on_path:
+                # Cycle: fall back to the BFS for this start node only
+                result = frozenset(
+                    _collect_upstream_model_ids(manifest, model_unique_id)
+                )
+                memo[model_unique_id] = result
+                return result
+            on_path.add(node_id)
+            stack.append((node_id, True))
+            for upstream_id in _node_dependencies(nodes.get(node_id)):
+                if upstream_id not in memo:
+                    stack.append((upstream_id, False))
             continue
 
-        if isinstance(depends_on, dict):
-            upstream_nodes = depends_on.get("nodes", [])
-        elif isinstance(depends_on, list):
-            upstream_nodes = depends_on
-        else:
-            upstream_nodes = []
+        on_path.discard(node_id)
+        upstream_models: set[str] = set()
+        if node_id.startswith("model."):
+            upstream_models.add(node_id)
+        for upstream_id in _node_dependencies(nodes.get(node_id)):
+            upstream_models.update(memo.get(upstream_id, ()))
+        memo[node_id] = frozenset(upstream_models)
 
-        for upstream_id in upstream_nodes:
-            if isinstance(upstream_id, str) and upstream_id not in visited:
-                # Continue traversal for all upstream ids; non-model ids will
-                # naturally stop when not present in manifest["nodes"].
-                queue.append(upstream_id)
+    return memo[model_unique_id]
 
-    return upstream_models
+
+def _find_exposures_file(project_path: str) -> str | None:
+    """
+    Locate exposures.yml in a dbt project: the project root first, then models/.
+
+    Existence probes are cached for a second (see path_exists_cached), so
+    repeated requests do not stat the candidates every time.
+    """
+    for candidate in (
+        os.path.join(project_path, "exposures.yml"),
+        os.path.join(project_path, "models", "exposures.yml"),
+    ):
+        if path_exists_cached(candidate):
+            return candidate
+    return None
 
 
 def get_exposures() -> dict[str, Any]:
@@ -193,7 +352,8 @@ def get_exposures() -> dict[str, Any]:
         )
 
     # Load manifest and data model
-    manifest = _load_manifest()
+    manifest_entry = _load_manifest_entry()
+    manifest = manifest_entry.manifest
     data_model = _load_data_model()
 
     # Try to read exposures from manifest first (canonical source)
@@ -208,35 +368,29 @@ def get_exposures() -> dict[str, Any]:
             exposures_list.append(exposure)
     else:
         # Fallback: try to read from exposures.yml file
-        exposures_path = None
-        if cfg.DBT_PROJECT_PATH:
-            # Check multiple locations:
-            # 1. Root of dbt project
-            root_path = os.path.join(cfg.DBT_PROJECT_PATH, "exposures.yml")
-            if os.path.exists(root_path):
-                exposures_path = root_path
-            # 2. Standard location: models/exposures.yml
-            elif os.path.exists(os.path.join(cfg.DBT_PROJECT_PATH, "models", "exposures.yml")):
-                exposures_path = os.path.join(cfg.DBT_PROJECT_PATH, "models", "exposures.yml")
-            # 3. Search in models directory
-            else:
-                models_dir = os.path.join(cfg.DBT_PROJECT_PATH, "models")
-                if os.path.exists(models_dir):
-                    for file in os.listdir(models_dir):
-                        if file == "exposures.yml":
-                            exposures_path = os.path.join(models_dir, file)
-                            break
+        exposures_path = (
+            _find_exposures_file(cfg.DBT_PROJECT_PATH) if cfg.DBT_PROJECT_PATH else None
+        )
 
         # Load exposures.yml if found
-        if exposures_path and os.path.exists(exposures_path):
+        if exposures_path:
             try:
-                with open(exposures_path, "r") as f:
-                    exposures_data = yaml.safe_load(f) or {}
+                # Shared in-process parse; read-only below. No sidecar: the
+                # file belongs to the user's dbt project.
+                exposures_data = (
+                    yaml_cache.load_yaml_cached(
+                        exposures_path, shared=True, sidecar=False
+                    )
+                    or {}
+                )
                 exposures_list = exposures_data.get("exposures", [])
                 if not isinstance(exposures_list, list):
                     exposures_list = []
+            except FileNotFoundError:
+                # Removed since the (cached) existence probe; nothing to read
+                pass
             except Exception as e:
-                print(f"Warning: Could not read exposures.yml: {e}")
+                logger.warning("Could not read exposures.yml: %s", e)
 
     # If no exposures found, return empty response
     if not exposures_list:
@@ -244,8 +398,11 @@ def get_exposures() -> dict[str, Any]:
 
     # Build response: extract exposure metadata
     exposures_response = []
-    entity_usage: dict[str, list[str]] = {}  # entity_id -> [exposure_names]
-    upstream_cache: dict[str, set[str]] = {}  # model_unique_id -> upstream model ids
+    # entity_id -> exposure names; a dict keeps insertion order with O(1) membership
+    entity_usage: dict[str, dict[str, None]] = {}
+    # Upstream sets depend only on the manifest, so they live on its cache entry
+    upstream_cache = manifest_entry.upstream_models
+    entities_by_model = _entities_by_model(data_model)
 
     for exposure in exposures_list:
         if not isinstance(exposure, dict):
@@ -288,11 +445,13 @@ def get_exposures() -> dict[str, Any]:
                 if not isinstance(ref_string, str):
                     continue
                 # Resolve ref() to model unique_id
-                unique_id = _resolve_model_ref(ref_string, manifest)
+                unique_id = _resolve_model_ref(
+                    ref_string, _models_by_name(manifest_entry)
+                )
                 if unique_id:
                     depends_on_nodes.append(unique_id)
                 else:
-                    print(f"Warning: Could not resolve {ref_string} to a model")
+                    logger.warning("Could not resolve %s to a model", ref_string)
 
         # Process each model that this exposure depends on
         for unique_id in depends_on_nodes:
@@ -302,20 +461,19 @@ def get_exposures() -> dict[str, Any]:
             # Expand to *all upstream models* before mapping to entities.
             # This ensures exposures that depend on mart/int models still mark
             # the underlying entity-bound models as "used".
-            if unique_id not in upstream_cache:
-                upstream_cache[unique_id] = _collect_upstream_model_ids(
-                    manifest, unique_id
+            upstream_models = upstream_cache.get(unique_id)
+            if upstream_models is None:
+                upstream_models = _upstream_model_ids(
+                    manifest, unique_id, upstream_cache
                 )
 
-            for upstream_model_id in upstream_cache[unique_id]:
-                entity_ids = _find_entities_for_model(upstream_model_id, data_model)
-                for entity_id in entity_ids:
-                    if entity_id not in entity_usage:
-                        entity_usage[entity_id] = []
-                    if exposure_name not in entity_usage[entity_id]:
-                        entity_usage[entity_id].append(exposure_name)
+            for upstream_model_id in upstream_models:
+                for entity_id in entities_by_model.get(upstream_model_id, ()):
+                    entity_usage.setdefault(entity_id, {})[exposure_name] = None
 
     return {
         "exposures": exposures_response,
-        "entityUsage": entity_usage,
+        "entityUsage": {
+            entity_id: list(names) for entity_id, names in entity_usage.items()
+        },
     }
@@ -5,12 +5,15 @@ Extracts table-level upstream lineage from dbt manifest.json and catalog.json fi
 Uses native manifest parsing (primary) with optional dbt-colibri support.
 """
 
-import json
+import logging
 import os
 from typing import Any, Optional
 from collections import deque
 from trellis_datamodel import config as cfg
 from trellis_datamodel.exceptions import DomainError, FileOperationError, NotFoundError
+from trellis_datamodel.utils import json_utils
+
+logger = logging.getLogger(__name__)
 
 try:
     from dbt_colibri import extract_lineage as colibri_extract_lineage
@@ -55,14 +58,14 @@ def extract_upstream_lineage(
 
     try:
         # Load manifest
-        with open(manifest_path, "r") as f:
-            manifest = json.load(f)
+        with open(manifest_path, "rb") as f:
+            manifest = json_utils.loads(f.read())
 
         # Load catalog if available (optional)
         catalog = None
         if catalog_path and os.path.exists(catalog_path):
-            with open(catalog_path, "r") as f:
-                catalog = json.load(f)
+            with open(catalog_path, "rb") as f:
+                catalog = json_utils.loads(f.read())
 
         # Verify model exists in manifest
         nodes = manifest.get("nodes", {})
@@ -133,17 +136,67 @@ def extract_source_systems_for_model(
                 source_systems.add(node["sourceName"])
         
         # Return sorted list for consistency
-        return sorted(list(source_systems))
+        return sorted(source_systems)
     except Exception as e:
         # Log warning but don't raise - return empty list gracefully
-        import logging
-        logger = logging.getLogger(__name__)
         logger.warning(
             f"Failed to extract source systems for model {model_unique_id}: {str(e)}"
         )
         return []
 
 
+def extract_source_systems_for_models(
+    manifest_path: str,
+    catalog_path: Optional[str],
+    model_unique_ids: list[str],
+) -> dict[str, list[str]]:
+    """
+    Extract upstream source system names for several models at once.
+
+    Equivalent to calling extract_source_systems_for_model for each model,
+    but manifest.json is read and parsed only once.
+
+    Args:
+        manifest_path: Path to dbt manifest.json file
+        catalog_path: Path to dbt catalog.json file (optional, unused for
+            source names but accepted for symmetry)
+        model_unique_ids: Unique IDs of the models to look up
+
+    Returns:
+        Mapping of each requested model ID to its sorted source-name values.
+        Models that are missing from the manifest, or every model if the
+        manifest cannot be read, map to an empty list.
+    """
+    results: dict[str, list[str]] = {model_id: [] for model_id in model_unique_ids}
+
+    try:
+        with open(manifest_path, "rb") as f:
+            manifest = json_utils.loads(f.read())
+    except Exception as e:
+        logger.warning(f"Failed to extract source systems: {str(e)}")
+        return results
+
+    nodes = manifest.get("nodes", {})
+    sources = manifest.get("sources", {})
+    for model_id in results:
+        if model_id not in nodes:
+            logger.warning(
+                f"Failed to extract source systems for model {model_id}: "
+                "model not found in manifest"
+            )
+            continue
+
+        lineage_data = _extract_lineage_from_manifest(manifest, model_id)
+        source_systems: set[str] = set()
+        for node_id in lineage_data["nodes"]:
+            source_name = sources.get(node_id, {}).get("source_name")
+            if source_name:
+                source_systems.add(source_name)
+        results[model_id] = sorted(source_systems)
+
+    return results
+
+
 def _extract_lineage_from_manifest(
     manifest: dict[str, Any],
     root_model_id: str,
@@ -54,6 +54,26 @@ def clean_test_files():
     business_events_path = os.path.join(_TEST_TEMP_DIR, "business_events.yml")
     if os.path.exists(business_events_path):
         os.remove(business_events_path)
+    from trellis_datamodel.services.business_events_service import (
+        clear_business_events_cache,
+    )
+
+    clear_business_events_cache()
+    from trellis_datamodel.services.config_service import clear_config_cache
+
+    clear_config_cache()
+    from trellis_datamodel.utils.path_validation import clear_path_exists_cache
+
+    clear_path_exists_cache()
+    from trellis_datamodel.utils import yaml_cache
+
+    yaml_cache.invalidate()
+    from trellis_datamodel.routes.data_model import clear_sources_cache
+
+    clear_sources_cache()
+    from trellis_datamodel.services.exposures import clear_manifest_cache
+
+    clear_manifest_cache()
 
     # Clean model yml files (recursively) to avoid cross-test leakage
     models_dir = os.path.join(_TEST_TEMP_DIR, "models", "3_core")
@@ -194,3 +214,16 @@ def test_client(mock_manifest):
 
     with TestClient(app) as client:
         yield client
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test once with each JSON backend json_utils can use."""
+    from trellis_datamodel.utils import json_utils
+
+    if request.param == "orjson":
+        if not json_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed (install the 'fast' extra)")
+    else:
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+    return request.param
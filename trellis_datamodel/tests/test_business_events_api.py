@@ -0,0 +1,287 @@
+"""Tests for business events API endpoints."""
+
+import os
+
+import pytest
+
+from trellis_datamodel import config as cfg
+
+
+@pytest.fixture
+def events_client(test_client, temp_dir, monkeypatch):
+    """Test client with the business events feature enabled."""
+    monkeypatch.setattr(cfg, "BUSINESS_EVENTS_ENABLED", True)
+    monkeypatch.setattr(
+        cfg, "BUSINESS_EVENTS_PATH", os.path.join(temp_dir, "business_events.yml")
+    )
+    return test_client
+
+
+class TestListEndpoints:
+    """Test GET /api/business-events and GET /api/processes."""
+
+    def test_returns_empty_list_without_file(self, events_client):
+        response = events_client.get("/api/business-events")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_returns_all_events(self, events_client):
+        for text in ("customer buys product", "customer returns product"):
+            response = events_client.post(
+                "/api/business-events", json={"text": text, "type": "discrete"}
+            )
+            assert response.status_code == 201
+
+        response = events_client.get("/api/business-events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert [event["text"] for event in body] == [
+            "customer buys product",
+            "customer returns product",
+        ]
+        assert body[0]["annotations"]["who"] == []
+
+    def test_returns_processes(self, events_client):
+        event_id = events_client.post(
+            "/api/business-events", json={"text": "order placed", "type": "evolving"}
+        ).json()["id"]
+        events_client.post(
+            "/api/processes",
+            json={
+                "name": "Order fulfillment",
+                "type": "evolving",
+                "domain": "Sales",
+                "event_ids": [event_id],
+            },
+        )
+
+        response = events_client.get("/api/processes")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body) == 1
+        assert body[0]["event_ids"] == [event_id]
+
+    def test_reflects_updates_after_cached_response(self, events_client):
+        event_id = events_client.post(
+            "/api/business-events",
+            json={"text": "order placed", "type": "discrete", "domain": "Sales"},
+        ).json()["id"]
+        assert events_client.get("/api/business-events").json()[0]["text"] == "order placed"
+        assert events_client.get("/api/business-events/domains").json() == ["Sales"]
+
+        events_client.put(
+            f"/api/business-events/{event_id}",
+            json={"text": "order submitted", "domain": "Finance"},
+        )
+
+        assert events_client.get("/api/business-events").json()[0]["text"] == "order submitted"
+        assert events_client.get("/api/business-events/domains").json() == ["Finance"]
+
+    def test_disabled_feature_returns_403(self, test_client, monkeypatch):
+        monkeypatch.setattr(cfg, "BUSINESS_EVENTS_ENABLED", False)
+
+        response = test_client.get("/api/business-events")
+
+        assert response.status_code == 403
+
+    def test_disabled_feature_rejects_before_body_validation(
+        self, test_client, monkeypatch
+    ):
+        monkeypatch.setattr(cfg, "BUSINESS_EVENTS_ENABLED", False)
+
+        response = test_client.post("/api/business-events", json={"type": "discrete"})
+
+        assert response.status_code == 403
+
+
+class TestUpdateEventEndpoint:
+    """Test PUT /api/business-events/{event_id}."""
+
+    def test_only_provided_fields_are_updated(self, events_client):
+        event = events_client.post(
+            "/api/business-events",
+            json={"text": "customer buys product", "type": "discrete", "domain": "Sales"},
+        ).json()
+
+        response = events_client.put(
+            f"/api/business-events/{event['id']}", json={"text": "customer orders product"}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["text"] == "customer orders product"
+        assert body["type"] == "discrete"
+        assert body["domain"] == "Sales"
+
+    def test_explicit_nulls_are_ignored(self, events_client):
+        event = events_client.post(
+            "/api/business-events",
+            json={"text": "customer buys product", "type": "discrete", "domain": "Sales"},
+        ).json()
+
+        response = events_client.put(
+            f"/api/business-events/{event['id']}",
+            json={"text": "customer orders product", "domain": None},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["domain"] == "Sales"
+
+    def test_accepts_annotations_as_dict(self, events_client):
+        event = events_client.post(
+            "/api/business-events", json={"text": "order placed", "type": "discrete"}
+        ).json()
+        annotations = {"who": [{"id": "entry_1", "text": "customer"}]}
+
+        response = events_client.put(
+            f"/api/business-events/{event['id']}", json={"annotations": annotations}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["annotations"]["who"][0]["text"] == "customer"
+
+
+class TestRequestDecoding:
+    """Test JSON body decoding through TrellisRoute."""
+
+    def test_malformed_json_returns_422(self, events_client):
+        response = events_client.post(
+            "/api/business-events",
+            content=b'{"text": "order placed", "type": ',
+            headers={"content-type": "application/json"},
+        )
+
+        assert response.status_code == 422
+
+    def test_missing_required_field_returns_422(self, events_client):
+        response = events_client.post("/api/business-events", json={"type": "discrete"})
+
+        assert response.status_code == 422
+
+
+class TestErrorTranslation:
+    """Test mapping of handler errors to HTTP status codes."""
+
+    def test_update_unknown_event_returns_404(self, events_client):
+        response = events_client.put(
+            "/api/business-events/missing", json={"text": "order placed"}
+        )
+
+        assert response.status_code == 404
+
+    def test_create_process_with_unknown_events_returns_404(self, events_client):
+        response = events_client.post(
+            "/api/processes",
+            json={
+                "name": "Order fulfillment",
+                "type": "evolving",
+                "domain": "Sales",
+                "event_ids": ["missing"],
+            },
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Events not found: missing"
+
+    def test_create_process_with_attached_event_returns_400(self, events_client):
+        event_id = events_client.post(
+            "/api/business-events", json={"text": "order placed", "type": "evolving"}
+        ).json()["id"]
+        payload = {
+            "name": "Order fulfillment",
+            "type": "evolving",
+            "domain": "Sales",
+            "event_ids": [event_id],
+        }
+        assert events_client.post("/api/processes", json=payload).status_code == 201
+
+        response = events_client.post("/api/processes", json=payload)
+
+        assert response.status_code == 400
+        assert "already attached" in response.json()["detail"]
+
+    def test_generate_from_unknown_process_returns_404(self, events_client):
+        response = events_client.post("/api/processes/proc_missing_001/generate-entities")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == (
+            "Business event process 'proc_missing_001' not found"
+        )
+
+    def test_invalid_event_type_returns_400(self, events_client):
+        response = events_client.post(
+            "/api/business-events", json={"text": "order placed", "type": "bogus"}
+        )
+
+        assert response.status_code == 400
+
+    def test_invalid_annotation_type_lists_valid_types(self, events_client):
+        event_id = events_client.post(
+            "/api/business-events", json={"text": "order placed", "type": "discrete"}
+        ).json()["id"]
+
+        response = events_client.post(
+            f"/api/business-events/{event_id}/annotations",
+            json={"annotation_type": "whom", "text": "customer"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == (
+            "Invalid annotation_type: 'whom'. Must be one of: "
+            "who, what, when, where, how, why, how_many"
+        )
+
+
+class TestBatchGenerateEntities:
+    """Test POST /api/business-events/generate-entities."""
+
+    def _create_event(self, client, text, who):
+        return client.post(
+            "/api/business-events",
+            json={
+                "text": text,
+                "type": "discrete",
+                "annotations": {
+                    "who": [{"id": f"{who}_entry", "text": who}],
+                    "how_many": [{"id": f"{who}_amount", "text": "amount"}],
+                },
+            },
+        ).json()["id"]
+
+    def test_returns_one_result_per_event_in_request_order(self, events_client):
+        first = self._create_event(events_client, "customer buys product", "customer")
+        second = self._create_event(events_client, "supplier ships part", "supplier")
+
+        response = events_client.post(
+            "/api/business-events/generate-entities",
+            json={"event_ids": [second, first]},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body) == 2
+        for result, expected in zip(body, ("supplier", "customer")):
+            assert result["errors"] == []
+            assert any(expected in entity["id"] for entity in result["entities"])
+
+    def test_unknown_events_return_404(self, events_client):
+        known = self._create_event(events_client, "customer buys product", "customer")
+
+        response = events_client.post(
+            "/api/business-events/generate-entities",
+            json={"event_ids": [known, "missing"]},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Events not found: missing"
+
+    def test_empty_event_ids_return_400(self, events_client):
+        response = events_client.post(
+            "/api/business-events/generate-entities", json={"event_ids": []}
+        )
+
+        assert response.status_code == 400
@@ -3,9 +3,11 @@
 import os
 import yaml
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from trellis_datamodel.services import business_events_service
+from trellis_datamodel.utils import yaml_io, yaml_sidecar
 from trellis_datamodel.models.business_event import (
     BusinessEvent,
     BusinessEventType,
@@ -66,6 +68,30 @@ class TestCreateEvent:
 
         assert event.derived_entities == []
 
+    def test_stores_provided_annotations_in_single_write(self, temp_dir, monkeypatch):
+        """Test that annotations passed to create_event are persisted in one save."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        writes = []
+        original_dump = business_events_service.yaml.safe_dump
+        monkeypatch.setattr(
+            business_events_service.yaml,
+            "safe_dump",
+            lambda *args, **kwargs: writes.append(1) or original_dump(*args, **kwargs),
+        )
+        annotations = BusinessEventAnnotations(
+            who=[AnnotationEntry(id="entry1", text="Customer")]
+        )
+
+        event = business_events_service.create_event(
+            "customer buys product", BusinessEventType.DISCRETE, annotations=annotations
+        )
+
+        assert len(writes) == 1
+        assert event.annotations.who[0].text == "Customer"
+        loaded = business_events_service.load_business_events()
+        assert loaded[0].annotations.who[0].text == "Customer"
+
     def test_strips_text_whitespace(self, temp_dir, monkeypatch):
         """Test that event text is stripped of leading/trailing whitespace."""
         events_path = os.path.join(temp_dir, "business_events.yml")
@@ -86,6 +112,26 @@ class TestCreateEvent:
         with pytest.raises(ValidationError, match="Event text is required"):
             business_events_service.create_event("   ", BusinessEventType.DISCRETE)
 
+    def test_concurrent_creates_keep_every_event(self, temp_dir, monkeypatch):
+        """Test that parallel creates (threadpool handlers) never lose writes."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            created = list(
+                pool.map(
+                    lambda i: business_events_service.create_event(
+                        f"event {i}", BusinessEventType.DISCRETE
+                    ),
+                    range(40),
+                )
+            )
+
+        business_events_service.clear_business_events_cache()
+        stored = business_events_service.load_business_events()
+        assert len({event.id for event in created}) == 40
+        assert {event.id for event in stored} == {event.id for event in created}
+
 
 class TestUpdateEvent:
     """Test update_event() function."""
@@ -193,6 +239,148 @@ class TestLoadAndSaveBusinessEvents:
         with pytest.raises(FileOperationError, match="Invalid business events file format"):
             business_events_service.load_business_events()
 
+    def test_load_reuses_cached_parse(self, temp_dir, monkeypatch):
+        """Test that an unchanged file is only parsed once."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        business_events_service.create_event("test event", BusinessEventType.DISCRETE)
+        os.remove(yaml_sidecar.sidecar_path(events_path))
+
+        calls = []
+        real_safe_load = yaml_io.safe_load
+        monkeypatch.setattr(
+            yaml_io,
+            "safe_load",
+            lambda stream: calls.append(1) or real_safe_load(stream),
+        )
+
+        first = business_events_service.load_business_events()
+        second = business_events_service.load_business_events()
+
+        assert len(calls) == 1
+        assert first[0] == second[0]
+        assert first[0] is not second[0]
+
+    def test_cold_load_reads_sidecar_instead_of_yaml(self, temp_dir, monkeypatch):
+        """Test that a fresh process reuses the JSON sidecar written on save."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        event = business_events_service.create_event("test event", BusinessEventType.DISCRETE)
+        business_events_service.clear_business_events_cache()
+
+        calls = []
+        monkeypatch.setattr(
+            yaml_io, "safe_load", lambda stream: calls.append(1)
+        )
+
+        loaded = business_events_service.load_business_events()
+
+        assert calls == []
+        assert loaded == [event]
+
+    def test_stale_sidecar_is_ignored(self, temp_dir, monkeypatch):
+        """Test that hand edits to the YAML file win over an outdated sidecar."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        business_events_service.create_event("test event", BusinessEventType.DISCRETE)
+        sidecar = yaml_sidecar.sidecar_path(events_path)
+        with open(sidecar, "rb") as f:
+            stale_sidecar = f.read()
+
+        with open(events_path) as f:
+            data = yaml.safe_load(f)
+        data["events"][0]["text"] = "edited by hand"
+        with open(events_path, "w") as f:
+            yaml.safe_dump(data, f)
+        with open(sidecar, "wb") as f:
+            f.write(stale_sidecar)
+        business_events_service.clear_business_events_cache()
+
+        loaded = business_events_service.load_business_events()
+
+        assert loaded[0].text == "edited by hand"
+
+    def test_hand_written_utf8_file_is_decoded(self, temp_dir, monkeypatch):
+        """Test that non-ASCII text in a hand-written file survives the parse."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        business_events_service.create_event("test event", BusinessEventType.DISCRETE)
+
+        with open(events_path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        data["events"][0]["text"] = "Kunde bestellt Würstchen – café"
+        with open(events_path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(data, f, allow_unicode=True)
+        business_events_service.clear_business_events_cache()
+
+        loaded = business_events_service.load_business_events()
+
+        assert loaded[0].text == "Kunde bestellt Würstchen – café"
+
+    def test_load_picks_up_external_changes(self, temp_dir, monkeypatch):
+        """Test that editing the file on disk invalidates the cached parse."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        event = business_events_service.create_event("test event", BusinessEventType.DISCRETE)
+        assert len(business_events_service.load_business_events()) == 1
+
+        with open(events_path) as f:
+            data = yaml.safe_load(f)
+        data["events"].append({**data["events"][0], "id": "evt_external_001"})
+        with open(events_path, "w") as f:
+            yaml.safe_dump(data, f)
+
+        events = business_events_service.load_business_events()
+
+        assert [e.id for e in events] == [event.id, "evt_external_001"]
+
+
+class TestGetEventById:
+    """Test get_event_by_id() indexed lookup."""
+
+    def test_returns_matching_event(self, temp_dir, monkeypatch):
+        """Test that the event with the given ID is returned."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        business_events_service.create_event("first event", BusinessEventType.DISCRETE)
+        second = business_events_service.create_event("second event", BusinessEventType.EVOLVING)
+
+        event = business_events_service.get_event_by_id(second.id)
+
+        assert event == second
+
+    def test_returns_none_for_unknown_id(self, temp_dir, monkeypatch):
+        """Test that an unknown ID returns None."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        business_events_service.create_event("first event", BusinessEventType.DISCRETE)
+
+        assert business_events_service.get_event_by_id("evt_missing_001") is None
+
+    def test_get_events_by_ids_omits_unknown_ids(self, temp_dir, monkeypatch):
+        """Test that batch lookup returns found events keyed by ID."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        first = business_events_service.create_event("first event", BusinessEventType.DISCRETE)
+        second = business_events_service.create_event("second event", BusinessEventType.EVOLVING)
+
+        events = business_events_service.get_events_by_ids(
+            [second.id, "evt_missing_001", first.id]
+        )
+
+        assert events == {second.id: second, first.id: first}
+
+    def test_index_follows_updates(self, temp_dir, monkeypatch):
+        """Test that the index is rebuilt after the file is saved."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        event = business_events_service.create_event("first event", BusinessEventType.DISCRETE)
+        assert business_events_service.get_event_by_id(event.id).text == "first event"
+
+        business_events_service.update_event(event.id, {"text": "renamed event"})
+
+        assert business_events_service.get_event_by_id(event.id).text == "renamed event"
+
 
 class TestDeleteEvent:
     """Test delete_event() function."""
@@ -219,10 +407,50 @@ class TestDeleteEvent:
         with pytest.raises(NotFoundError, match="not found"):
             business_events_service.delete_event("evt_20260101_999")
 
+    def test_removes_event_from_process_in_single_write(self, temp_dir, monkeypatch):
+        """Test that deleting a process member updates events and process in one write."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        monkeypatch.setattr(business_events_service, "_get_processes_path", lambda: events_path)
+
+        event1 = business_events_service.create_event("first event", BusinessEventType.DISCRETE)
+        event2 = business_events_service.create_event("second event", BusinessEventType.DISCRETE)
+        process = business_events_service.create_process(
+            "Test Process", BusinessEventType.DISCRETE, TEST_PROCESS_DOMAIN, [event1.id, event2.id]
+        )
+
+        writes = []
+        real_safe_dump = business_events_service.yaml.safe_dump
+        monkeypatch.setattr(
+            business_events_service.yaml,
+            "safe_dump",
+            lambda *args, **kwargs: writes.append(1) or real_safe_dump(*args, **kwargs),
+        )
+
+        business_events_service.delete_event(event1.id)
+
+        assert len(writes) == 1
+        updated_process = business_events_service.load_processes()[0]
+        assert updated_process.id == process.id
+        assert updated_process.event_ids == [event2.id]
+
 
 class TestCreateProcess:
     """Test create_process() function."""
 
+    def test_get_process_by_id_returns_matching_process(self, temp_dir, monkeypatch):
+        """Test that a created process can be looked up by ID."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        monkeypatch.setattr(business_events_service, "_get_processes_path", lambda: events_path)
+        event = business_events_service.create_event("event 1", BusinessEventType.DISCRETE)
+        process = business_events_service.create_process(
+            "Test Process", BusinessEventType.DISCRETE, TEST_PROCESS_DOMAIN, [event.id]
+        )
+
+        assert business_events_service.get_process_by_id(process.id) == process
+        assert business_events_service.get_process_by_id("proc_missing_001") is None
+
     def test_creates_process_with_auto_generated_id(self, temp_dir, monkeypatch):
         """Test that create_process generates ID in format proc_YYYYMMDD_NNN."""
         events_path = os.path.join(temp_dir, "business_events.yml")
@@ -900,3 +1128,96 @@ class TestSupersetRecompute:
 
         assert len(updated_process.annotations_superset.who) == 1
         assert updated_process.annotations_superset.who[0].text == "Customer A"
+
+
+class TestBatchedEventLinking:
+    """Test that linking events to processes writes the events section once."""
+
+    def test_create_process_links_all_events_in_one_write(self, temp_dir, monkeypatch):
+        """Test that create_process does one events write and one process write."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        monkeypatch.setattr(business_events_service, "_get_processes_path", lambda: events_path)
+
+        event_ids = [
+            business_events_service.create_event(f"event {i}", BusinessEventType.DISCRETE).id
+            for i in range(5)
+        ]
+
+        writes = []
+        real_safe_dump = business_events_service.yaml.safe_dump
+        monkeypatch.setattr(
+            business_events_service.yaml,
+            "safe_dump",
+            lambda *args, **kwargs: writes.append(1) or real_safe_dump(*args, **kwargs),
+        )
+
+        process = business_events_service.create_process(
+            "Test Process", BusinessEventType.DISCRETE, TEST_PROCESS_DOMAIN, event_ids
+        )
+
+        assert len(writes) == 2
+        events = business_events_service.load_business_events()
+        assert all(e.process_id == process.id for e in events)
+
+    def test_concurrent_process_and_event_writes_keep_both(self, temp_dir, monkeypatch):
+        """Test that batched process writes and event writes never overwrite each other."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        monkeypatch.setattr(business_events_service, "_get_processes_path", lambda: events_path)
+
+        event_ids = [
+            business_events_service.create_event(f"event {i}", BusinessEventType.EVOLVING).id
+            for i in range(10)
+        ]
+
+        def create_process(i):
+            return business_events_service.create_process(
+                f"Process {i}", BusinessEventType.EVOLVING, TEST_PROCESS_DOMAIN, [event_ids[i]]
+            )
+
+        def create_event(i):
+            return business_events_service.create_event(f"extra {i}", BusinessEventType.DISCRETE)
+
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            futures = [pool.submit(create_process, i) for i in range(10)]
+            futures += [pool.submit(create_event, i) for i in range(10)]
+            for future in futures:
+                future.result()
+
+        business_events_service.clear_business_events_cache()
+        events = business_events_service.load_business_events()
+        processes = business_events_service.load_processes()
+        assert len(events) == 20
+        assert len(processes) == 10
+        assert sum(1 for event in events if event.process_id) == 10
+
+    def test_attach_links_all_events_in_one_write(self, temp_dir, monkeypatch):
+        """Test that attaching several events writes the events section once."""
+        events_path = os.path.join(temp_dir, "business_events.yml")
+        monkeypatch.setattr(business_events_service, "_get_business_events_path", lambda: events_path)
+        monkeypatch.setattr(business_events_service, "_get_processes_path", lambda: events_path)
+
+        first = business_events_service.create_event("first", BusinessEventType.DISCRETE)
+        process = business_events_service.create_process(
+            "Test Process", BusinessEventType.DISCRETE, TEST_PROCESS_DOMAIN, [first.id]
+        )
+        new_ids = [
+            business_events_service.create_event(f"event {i}", BusinessEventType.DISCRETE).id
+            for i in range(3)
+        ]
+
+        writes = []
+        real_safe_dump = business_events_service.yaml.safe_dump
+        monkeypatch.setattr(
+            business_events_service.yaml,
+            "safe_dump",
+            lambda *args, **kwargs: writes.append(1) or real_safe_dump(*args, **kwargs),
+        )
+
+        updated = business_events_service.attach_events_to_process(process.id, new_ids)
+
+        assert len(writes) == 2
+        assert updated.event_ids == [first.id, *new_ids]
+        events = {e.id: e for e in business_events_service.load_business_events()}
+        assert all(events[eid].process_id == process.id for eid in new_ids)
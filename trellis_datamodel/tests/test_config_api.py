@@ -152,6 +152,13 @@ async def test_put_config_valid_update(client: AsyncClient, temp_config_dir):
     assert data["config"]["modeling_style"] == "dimensional_model"
     assert "file_info" in data
 
+    # Returned file info describes the file as written
+    from trellis_datamodel.services.config_service import load_config
+
+    _, saved_info = load_config(str(Path(temp_config_dir) / "trellis.yml"))
+    assert data["file_info"]["hash"] == saved_info["hash"]
+    assert data["file_info"]["mtime"] == saved_info["mtime"]
+
     # Check backup was created
     config_dir = Path(temp_config_dir)
     backup_path = config_dir / "trellis.yml.backup"
@@ -400,3 +407,82 @@ async def test_reload_config_missing_file(client: AsyncClient, temp_config_dir,
 
     assert "error" in data["detail"]
     assert "configuration_error" in data["detail"]["error"]
+
+
+def test_load_config_reuses_cached_parse(temp_config_dir, monkeypatch):
+    """Test that an unchanged trellis.yml is only parsed once."""
+    from trellis_datamodel.services import config_service
+    from trellis_datamodel.utils import yaml_io
+
+    config_path = str(Path(temp_config_dir) / "trellis.yml")
+    calls = []
+    real_safe_load = yaml_io.safe_load
+    monkeypatch.setattr(
+        yaml_io,
+        "safe_load",
+        lambda stream: calls.append(1) or real_safe_load(stream),
+    )
+
+    first, first_info = config_service.load_config(config_path)
+    first["framework"] = "mutated by caller"
+    second, second_info = config_service.load_config(config_path)
+
+    assert len(calls) == 1
+    assert second["framework"] == "dbt-core"
+    assert second_info == first_info
+
+
+def test_load_config_picks_up_external_changes(temp_config_dir):
+    """Test that editing trellis.yml on disk invalidates the cached config."""
+    from trellis_datamodel.services import config_service
+
+    config_path = Path(temp_config_dir) / "trellis.yml"
+    config, file_info = config_service.load_config(str(config_path))
+    assert config["modeling_style"] == "entity_model"
+
+    config_path.write_text(
+        config_path.read_text().replace(
+            "modeling_style: entity_model", "modeling_style: dimensional_model"
+        )
+    )
+
+    config, new_file_info = config_service.load_config(str(config_path))
+    assert config["modeling_style"] == "dimensional_model"
+    assert new_file_info["hash"] != file_info["hash"]
+
+
+def test_load_config_reads_sidecar_on_cold_cache(temp_config_dir, monkeypatch):
+    """Test that a fresh process reuses the JSON sidecar instead of the YAML."""
+    from trellis_datamodel.services import config_service
+    from trellis_datamodel.utils import yaml_io, yaml_sidecar
+
+    config_path = str(Path(temp_config_dir) / "trellis.yml")
+    expected, _ = config_service.load_config(config_path)
+    assert os.path.exists(yaml_sidecar.sidecar_path(config_path))
+    config_service.clear_config_cache()
+
+    calls = []
+    monkeypatch.setattr(yaml_io, "safe_load", lambda stream: calls.append(1))
+
+    config, _ = config_service.load_config(config_path)
+
+    assert calls == []
+    assert config == expected
+
+
+def test_save_config_drops_stale_sidecar(temp_config_dir):
+    """Test that saving the config never leaves the old JSON sidecar behind."""
+    from trellis_datamodel.services import config_service
+    from trellis_datamodel.utils import yaml_sidecar
+
+    config_path = str(Path(temp_config_dir) / "trellis.yml")
+    config, _ = config_service.load_config(config_path)
+    sidecar = yaml_sidecar.sidecar_path(config_path)
+    assert os.path.exists(sidecar)
+
+    updated = dict(config, dbt_model_paths=["3_core"])
+    config_service.save_config(updated, config_path)
+
+    assert not os.path.exists(sidecar)
+    reloaded, _ = config_service.load_config(config_path)
+    assert reloaded["dbt_model_paths"] == ["3_core"]
@@ -1,5 +1,6 @@
 """Tests for data model API endpoints."""
 
+import json
 import os
 import yaml
 import pytest
@@ -67,6 +68,95 @@ class TestGetDataModel:
         assert data["entities"] == []
         assert data["relationships"] == []
 
+    def test_reuses_parse_until_file_changes(
+        self, test_client, temp_data_model_path, monkeypatch
+    ):
+        from trellis_datamodel.utils import yaml_io
+
+        with open(temp_data_model_path, "w") as f:
+            yaml.dump({"version": 0.1, "entities": [{"id": "users", "label": "Users"}]}, f)
+
+        calls = []
+        real_safe_load = yaml_io.safe_load
+        monkeypatch.setattr(
+            yaml_io, "safe_load", lambda stream: calls.append(1) or real_safe_load(stream)
+        )
+
+        first = test_client.get("/api/data-model").json()
+        second = test_client.get("/api/data-model").json()
+        assert first == second
+        assert len(calls) == 1
+
+        with open(temp_data_model_path, "w") as f:
+            yaml.dump({"version": 0.1, "entities": [{"id": "orders", "label": "Orders"}]}, f)
+
+        third = test_client.get("/api/data-model").json()
+        assert [entity["id"] for entity in third["entities"]] == ["orders"]
+        assert len(calls) == 2
+
+    def test_merge_does_not_modify_cached_model(
+        self, test_client, temp_data_model_path, temp_canvas_layout_path
+    ):
+        from trellis_datamodel.utils import yaml_cache
+
+        with open(temp_data_model_path, "w") as f:
+            yaml.dump({"version": 0.1, "entities": [{"id": "users", "label": "Users"}]}, f)
+        with open(temp_canvas_layout_path, "w") as f:
+            yaml.dump({"entities": {"users": {"position": {"x": 5, "y": 6}}}}, f)
+
+        for _ in range(2):
+            data = test_client.get("/api/data-model").json()
+            assert data["entities"][0]["position"] == {"x": 5, "y": 6}
+
+        cached = yaml_cache.load_yaml_cached(temp_data_model_path, shared=True)
+        assert cached == {"version": 0.1, "entities": [{"id": "users", "label": "Users"}]}
+
+    def test_etag_revalidation(self, test_client, temp_data_model_path):
+        model_data = {
+            "version": 0.1,
+            "entities": [{"id": "users", "label": "Users"}],
+            "relationships": [],
+        }
+        assert test_client.post("/api/data-model", json=model_data).status_code == 200
+
+        first = test_client.get("/api/data-model")
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+
+        cached = test_client.get("/api/data-model", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        model_data["entities"].append({"id": "orders", "label": "Orders"})
+        assert test_client.post("/api/data-model", json=model_data).status_code == 200
+
+        fresh = test_client.get("/api/data-model", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] != etag
+        assert len(fresh.json()["entities"]) == 2
+
+    def test_etag_changes_on_save_with_same_size_and_mtime(
+        self, test_client, temp_data_model_path, temp_canvas_layout_path
+    ):
+        def save(x):
+            model_data = {
+                "version": 0.1,
+                "entities": [{"id": "users", "label": "Users", "position": {"x": x, "y": 0}}],
+                "relationships": [],
+            }
+            assert test_client.post("/api/data-model", json=model_data).status_code == 200
+
+        save(1)
+        pinned = os.stat(temp_canvas_layout_path).st_mtime_ns
+        etag = test_client.get("/api/data-model").headers["etag"]
+
+        save(2)
+        os.utime(temp_canvas_layout_path, ns=(pinned, pinned))
+
+        response = test_client.get("/api/data-model", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["entities"][0]["position"]["x"] == 2
+
 
 class TestSaveDataModel:
     """Tests for POST /api/data-model endpoint."""
@@ -145,6 +235,174 @@ class TestSaveDataModel:
         assert "old" not in layout["entities"]
         assert "new" in layout["entities"]
 
+    def test_saved_files_keep_key_order_and_unicode(
+        self, test_client, temp_data_model_path
+    ):
+        model_data = {
+            "version": 0.1,
+            "entities": [
+                {"id": "kunde", "label": "Kündigung", "description": "Größe"}
+            ],
+            "relationships": [],
+        }
+        response = test_client.post("/api/data-model", json=model_data)
+        assert response.status_code == 200
+
+        with open(temp_data_model_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        assert "Kündigung" in text
+        assert text.index("version") < text.index("entities") < text.index(
+            "relationships"
+        )
+        assert yaml.safe_load(text)["entities"][0]["description"] == "Größe"
+
+    def test_saved_files_keep_indented_list_layout(
+        self, test_client, temp_data_model_path, temp_canvas_layout_path
+    ):
+        model_data = {
+            "version": 0.1,
+            "entities": [
+                {
+                    "id": "orders",
+                    "label": "Orders",
+                    "description": None,
+                    "tags": ["sales", "core"],
+                    "position": {"x": 10, "y": 20},
+                }
+            ],
+            "relationships": [
+                {"source": "orders", "target": "customers", "type": "many_to_one"}
+            ],
+        }
+        response = test_client.post("/api/data-model", json=model_data)
+        assert response.status_code == 200
+
+        # Byte-for-byte what the round-trip emitter has always written, so
+        # saving never rewrites the layout of a user's committed files.
+        with open(temp_data_model_path, "r", encoding="utf-8") as f:
+            assert f.read() == (
+                "version: 0.1\n"
+                "entities:\n"
+                "  - id: orders\n"
+                "    label: Orders\n"
+                "    description:\n"
+                "    tags:\n"
+                "      - sales\n"
+                "      - core\n"
+                "relationships:\n"
+                "  - source: orders\n"
+                "    target: customers\n"
+                "    type: many_to_one\n"
+            )
+        with open(temp_canvas_layout_path, "r", encoding="utf-8") as f:
+            assert f.read() == (
+                "version: 0.1\n"
+                "entities:\n"
+                "  orders:\n"
+                "    position:\n"
+                "      x: 10\n"
+                "      y: 20\n"
+                "relationships: {}\n"
+                "source_colors: {}\n"
+            )
+
+    def test_cold_load_reads_sidecar_instead_of_yaml(
+        self, test_client, temp_data_model_path, temp_canvas_layout_path, monkeypatch
+    ):
+        from trellis_datamodel.utils import yaml_cache, yaml_io, yaml_sidecar
+
+        model_data = {
+            "version": 0.1,
+            "entities": [{"id": "users", "label": "Users", "position": {"x": 1, "y": 2}}],
+            "relationships": [],
+        }
+        assert test_client.post("/api/data-model", json=model_data).status_code == 200
+        # The first load parses the YAML and writes the sidecars from that parse
+        test_client.get("/api/data-model")
+        assert os.path.exists(yaml_sidecar.sidecar_path(temp_data_model_path))
+        assert os.path.exists(yaml_sidecar.sidecar_path(temp_canvas_layout_path))
+        yaml_cache.invalidate()
+
+        calls = []
+        monkeypatch.setattr(yaml_io, "safe_load", lambda stream: calls.append(1))
+
+        data = test_client.get("/api/data-model").json()
+        assert calls == []
+        assert data["entities"][0]["position"] == {"x": 1, "y": 2}
+
+    def test_save_within_mtime_resolution_never_serves_old_sidecar(
+        self, test_client, temp_data_model_path, temp_canvas_layout_path
+    ):
+        def save(x):
+            model_data = {
+                "version": 0.1,
+                "entities": [{"id": "users", "label": "Users", "position": {"x": x, "y": 0}}],
+                "relationships": [],
+            }
+            assert test_client.post("/api/data-model", json=model_data).status_code == 200
+
+        save(1)
+        pinned = os.stat(temp_canvas_layout_path).st_mtime_ns
+        # First GET parses the YAML and writes the sidecars
+        assert test_client.get("/api/data-model").json()["entities"][0]["position"]["x"] == 1
+
+        # Same size, same mtime: only the content tells the two saves apart
+        save(2)
+        os.utime(temp_canvas_layout_path, ns=(pinned, pinned))
+
+        data = test_client.get("/api/data-model").json()
+        assert data["entities"][0]["position"]["x"] == 2
+
+    def test_saves_reuse_module_yaml_handler(self, test_client, monkeypatch):
+        from trellis_datamodel.routes import data_model as data_model_routes
+
+        def fail():
+            raise AssertionError("YamlHandler constructed per save")
+
+        monkeypatch.setattr(data_model_routes, "YamlHandler", fail)
+        model_data = {
+            "version": 0.1,
+            "entities": [{"id": "users", "label": "Users"}],
+            "relationships": [],
+        }
+
+        for _ in range(2):
+            response = test_client.post("/api/data-model", json=model_data)
+            assert response.status_code == 200
+
+    def test_creates_missing_directories(self, test_client, temp_dir, monkeypatch):
+        from trellis_datamodel import config as cfg
+
+        model_path = os.path.join(temp_dir, "nested", "data_model.yml")
+        layout_path = os.path.join(temp_dir, "layout", "canvas_layout.yml")
+        monkeypatch.setattr(cfg, "DATA_MODEL_PATH", model_path)
+        monkeypatch.setattr(cfg, "CANVAS_LAYOUT_PATH", layout_path)
+
+        model_data = {
+            "version": 0.1,
+            "entities": [{"id": "users", "label": "Users"}],
+            "relationships": [],
+        }
+        response = test_client.post("/api/data-model", json=model_data)
+        assert response.status_code == 200
+        assert os.path.exists(model_path)
+        assert os.path.exists(layout_path)
+
+    def test_invalid_entity_type_leaves_files_untouched(
+        self, test_client, temp_data_model_path
+    ):
+        model_data = {
+            "version": 0.1,
+            "entities": [
+                {"id": "users", "label": "Users", "entity_type": "dimension"},
+                {"id": "orders", "label": "Orders", "entity_type": "bogus"},
+            ],
+            "relationships": [],
+        }
+        response = test_client.post("/api/data-model", json=model_data)
+        assert response.status_code == 422
+        assert not os.path.exists(temp_data_model_path)
+
     def test_validates_required_fields(self, test_client):
         # Missing required fields should fail validation
         response = test_client.post("/api/data-model", json={})
@@ -217,3 +475,158 @@ class TestSaveDataModel:
         # source_colors should be present but empty when not configured
         assert "source_colors" in data
         assert data["source_colors"] == {}
+
+
+class TestSourceSystems:
+    """Tests for lineage-derived source systems."""
+
+    @pytest.fixture
+    def lineage_manifest(self, mock_manifest, mock_manifest_data):
+        manifest = json.loads(json.dumps(mock_manifest_data))
+        manifest["nodes"]["model.project.orders"]["depends_on"] = {
+            "nodes": ["model.project.users", "source.project.shop.orders"]
+        }
+        manifest["nodes"]["model.project.users"]["depends_on"] = {
+            "nodes": ["source.project.crm.users"]
+        }
+        manifest["sources"] = {
+            "source.project.shop.orders": {"source_name": "shop"},
+            "source.project.crm.users": {"source_name": "crm"},
+        }
+        with open(mock_manifest, "w") as f:
+            json.dump(manifest, f)
+        return mock_manifest
+
+    @pytest.fixture
+    def model_file(self, temp_data_model_path):
+        with open(temp_data_model_path, "w") as f:
+            yaml.dump(
+                {
+                    "version": 0.1,
+                    "entities": [
+                        {"id": "orders", "label": "Orders", "dbt_model": "model.project.orders"},
+                        {
+                            "id": "users",
+                            "label": "Users",
+                            "dbt_model": "model.project.users",
+                            "additional_models": ["model.project.missing"],
+                        },
+                        {"id": "leads", "label": "Leads", "source_system": ["hubspot"]},
+                    ],
+                },
+                f,
+            )
+
+    def test_bound_entities_get_lineage_sources(
+        self, test_client, lineage_manifest, model_file
+    ):
+        response = test_client.get("/api/data-model")
+
+        assert response.status_code == 200
+        by_id = {entity["id"]: entity for entity in response.json()["entities"]}
+        assert by_id["orders"]["source_system"] == ["crm", "shop"]
+        assert by_id["users"]["source_system"] == ["crm"]
+        assert by_id["leads"]["source_system"] == ["hubspot"]
+
+    def test_suggestions_combine_mock_and_lineage_sources(
+        self, test_client, lineage_manifest, model_file
+    ):
+        response = test_client.get("/api/source-systems/suggestions")
+
+        assert response.status_code == 200
+        assert response.json() == {"suggestions": ["crm", "hubspot", "shop"]}
+
+    def test_lineage_is_reused_until_manifest_changes(
+        self, test_client, lineage_manifest, model_file, monkeypatch
+    ):
+        from trellis_datamodel.routes import data_model
+
+        data_model.clear_sources_cache()
+        calls = []
+        real_extract = data_model.extract_source_systems_for_models
+        monkeypatch.setattr(
+            data_model,
+            "extract_source_systems_for_models",
+            lambda *args: calls.append(sorted(args[-1])) or real_extract(*args),
+        )
+
+        test_client.get("/api/data-model")
+        test_client.get("/api/source-systems/suggestions")
+        assert calls == [
+            ["model.project.missing", "model.project.orders", "model.project.users"]
+        ]
+
+        with open(lineage_manifest) as f:
+            manifest = json.load(f)
+        manifest["sources"]["source.project.shop.orders"]["source_name"] = "webshop"
+        with open(lineage_manifest, "w") as f:
+            json.dump(manifest, f)
+
+        response = test_client.get("/api/data-model")
+        by_id = {entity["id"]: entity for entity in response.json()["entities"]}
+        assert by_id["orders"]["source_system"] == ["crm", "webshop"]
+        assert len(calls) == 2
+
+    def test_save_resolves_lineage_before_next_get(
+        self, test_client, lineage_manifest, monkeypatch
+    ):
+        from trellis_datamodel.routes import data_model
+
+        calls = []
+        real_extract = data_model.extract_source_systems_for_models
+        monkeypatch.setattr(
+            data_model,
+            "extract_source_systems_for_models",
+            lambda *args: calls.append(sorted(args[-1])) or real_extract(*args),
+        )
+
+        response = test_client.post(
+            "/api/data-model",
+            json={
+                "version": 0.1,
+                "entities": [
+                    {"id": "orders", "label": "Orders", "dbt_model": "model.project.orders"}
+                ],
+                "relationships": [],
+            },
+        )
+        assert response.status_code == 200
+        assert calls == [["model.project.orders"]]
+
+        entity = test_client.get("/api/data-model").json()["entities"][0]
+        assert entity["source_system"] == ["crm", "shop"]
+        assert len(calls) == 1
+
+
+class TestEntityTypeInference:
+    """Tests for entity type inference on GET /api/data-model."""
+
+    def _call(self, entities, monkeypatch):
+        from trellis_datamodel.routes import data_model
+
+        calls = []
+
+        class _Adapter:
+            def infer_entity_types(self):
+                calls.append(1)
+                return {"orders": "fact"}
+
+        monkeypatch.setattr(data_model, "get_adapter", lambda: _Adapter())
+        result = data_model._apply_entity_type_inference({"entities": entities})
+        return result["entities"], calls
+
+    def test_infers_unclassified_entities(self, monkeypatch):
+        entities, calls = self._call(
+            [{"id": "orders", "entity_type": "unclassified"}], monkeypatch
+        )
+
+        assert entities[0]["entity_type"] == "fact"
+        assert calls == [1]
+
+    def test_skips_adapter_when_all_entities_are_classified(self, monkeypatch):
+        entities, calls = self._call(
+            [{"id": "orders", "entity_type": "dimension"}], monkeypatch
+        )
+
+        assert entities[0]["entity_type"] == "dimension"
+        assert calls == []
@@ -1,5 +1,8 @@
 """Tests for entity type inference logic."""
 
+import json
+import os
+
 import pytest
 
 # TODO: Implement tests when config loading issues are resolved
@@ -69,3 +72,53 @@ class TestEntityTypeInference:
         """Test dimension prefixes checked before fact prefixes."""
         # "dim_test" should match as dimension, not fact
         assert True
+
+
+class TestInferenceCache:
+    """Test caching of infer_entity_types across adapter instances."""
+
+    @pytest.fixture
+    def adapter_factory(self, mock_manifest, temp_data_model_path, monkeypatch):
+        from trellis_datamodel.adapters import dbt_core
+        from trellis_datamodel.config import DimensionalModelingConfig
+
+        monkeypatch.setattr(
+            dbt_core.cfg,
+            "DIMENSIONAL_MODELING_CONFIG",
+            DimensionalModelingConfig(enabled=True),
+        )
+        dbt_core.DbtCoreAdapter.reset_inference_cache()
+        yield lambda: dbt_core.DbtCoreAdapter(
+            manifest_path=mock_manifest,
+            catalog_path="",
+            project_path=os.path.dirname(mock_manifest),
+            data_model_path=temp_data_model_path,
+            model_paths=[],
+        )
+        dbt_core.DbtCoreAdapter.reset_inference_cache()
+
+    def test_new_adapter_reuses_cached_inference(self, adapter_factory, monkeypatch):
+        from trellis_datamodel.adapters import dbt_core
+
+        first = adapter_factory().infer_entity_types()
+
+        def _fail(self):
+            raise AssertionError("manifest should not be rescanned")
+
+        monkeypatch.setattr(dbt_core.DbtCoreAdapter, "get_models", _fail)
+        assert adapter_factory().infer_entity_types() == first
+
+    def test_manifest_change_invalidates_cache(
+        self, adapter_factory, mock_manifest, mock_manifest_data
+    ):
+        assert "dim_customers" not in adapter_factory().infer_entity_types()
+
+        mock_manifest_data["nodes"]["model.project.dim_customers"] = {
+            **mock_manifest_data["nodes"]["model.project.users"],
+            "unique_id": "model.project.dim_customers",
+            "name": "dim_customers",
+        }
+        with open(mock_manifest, "w") as f:
+            json.dump(mock_manifest_data, f)
+
+        assert adapter_factory().infer_entity_types()["dim_customers"] == "dimension"
@@ -108,3 +108,246 @@ def test_exposures_api_returns_200_when_enabled(monkeypatch, tmp_path, test_clie
     data = response.json()
     assert "exposures" in data
     assert "entityUsage" in data
+
+
+def _service_project(tmp_path, monkeypatch, manifest_exposures=None):
+    """Write a small manifest and data model and point the service at them."""
+    import json
+
+    from trellis_datamodel.services import exposures as exposures_service
+
+    manifest = {
+        "nodes": {
+            "model.shop.stg_orders": {
+                "resource_type": "model",
+                "name": "stg_orders",
+                "depends_on": {"nodes": ["source.shop.raw.orders"]},
+            },
+            "model.shop.fct_orders": {
+                "resource_type": "model",
+                "name": "fct_orders",
+                "depends_on": {"nodes": ["model.shop.stg_orders"]},
+            },
+            "test.shop.not_null_orders": {
+                "resource_type": "test",
+                "name": "fct_orders",
+                "depends_on": {"nodes": ["model.shop.fct_orders"]},
+            },
+        },
+        "sources": {},
+        "exposures": manifest_exposures or {},
+    }
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest))
+
+    data_model_path = tmp_path / "data_model.yml"
+    data_model_path.write_text(
+        textwrap.dedent(
+            """
+            entities:
+              - id: orders
+                dbt_model: model.shop.stg_orders
+              - id: order_facts
+                dbt_model: model.shop.other
+                additional_models: [model.shop.fct_orders]
+            """
+        )
+    )
+
+    service_cfg = exposures_service.cfg
+    monkeypatch.setattr(service_cfg, "EXPOSURES_ENABLED", True)
+    monkeypatch.setattr(service_cfg, "MANIFEST_PATH", str(manifest_path))
+    monkeypatch.setattr(service_cfg, "DATA_MODEL_PATH", str(data_model_path))
+    monkeypatch.setattr(service_cfg, "DBT_PROJECT_PATH", str(tmp_path))
+    return exposures_service, manifest_path
+
+
+def test_exposure_marks_upstream_entities_as_used(monkeypatch, tmp_path):
+    exposures_service, _ = _service_project(
+        tmp_path,
+        monkeypatch,
+        {
+            "exposure.shop.dashboard": {
+                "name": "dashboard",
+                "type": "dashboard",
+                "owner": {"name": "Analytics"},
+                "depends_on": {"nodes": ["model.shop.fct_orders"]},
+            }
+        },
+    )
+
+    result = exposures_service.get_exposures()
+
+    assert [exposure["name"] for exposure in result["exposures"]] == ["dashboard"]
+    assert result["exposures"][0]["owner"] == {"name": "Analytics"}
+    assert result["entityUsage"] == {
+        "orders": ["dashboard"],
+        "order_facts": ["dashboard"],
+    }
+
+
+def test_manifest_parse_is_reused_until_file_changes(monkeypatch, tmp_path):
+    exposures_service, manifest_path = _service_project(tmp_path, monkeypatch)
+
+    first = exposures_service._load_manifest()
+    assert exposures_service._load_manifest() is first
+
+    manifest_path.write_text('{"nodes": {}, "sources": {}, "exposures": {}, "x": 1}')
+
+    second = exposures_service._load_manifest()
+    assert second is not first
+    assert second["nodes"] == {}
+
+
+def test_exposures_yml_refs_resolve_through_model_index(monkeypatch, tmp_path):
+    exposures_service, _ = _service_project(tmp_path, monkeypatch)
+    (tmp_path / "exposures.yml").write_text(
+        textwrap.dedent(
+            """
+            exposures:
+              - name: weekly_report
+                type: analysis
+                owner: Finance
+                depends_on:
+                  - ref('stg_orders')
+                  - ref('missing_model')
+            """
+        )
+    )
+
+    result = exposures_service.get_exposures()
+
+    assert result["exposures"][0]["owner"] == {"name": "Finance"}
+    assert result["entityUsage"] == {"orders": ["weekly_report"]}
+
+
+def test_resolve_model_ref_honours_versions():
+    from trellis_datamodel.services import exposures as exposures_service
+
+    entry = exposures_service._ManifestEntry(
+        {
+            "nodes": {
+                "test.shop.player": {"resource_type": "test", "name": "player"},
+                "model.shop.player.v1": {
+                    "resource_type": "model",
+                    "name": "player",
+                    "version": 1,
+                },
+                "model.shop.player.v2": {
+                    "resource_type": "model",
+                    "name": "player",
+                    "version": 2,
+                },
+            }
+        }
+    )
+    index = exposures_service._models_by_name(entry)
+
+    assert exposures_service._resolve_model_ref("ref('player')", index) == (
+        "model.shop.player.v1"
+    )
+    assert exposures_service._resolve_model_ref("ref('player', v=2)", index) == (
+        "model.shop.player.v2"
+    )
+    assert exposures_service._resolve_model_ref("ref('player', v=3)", index) is None
+    assert exposures_service._models_by_name(entry) is index
+
+
+def test_upstream_models_are_reused_across_requests(monkeypatch, tmp_path):
+    exposures_service, _ = _service_project(
+        tmp_path,
+        monkeypatch,
+        {
+            "exposure.shop.dashboard": {
+                "name": "dashboard",
+                "depends_on": {"nodes": ["model.shop.fct_orders"]},
+            }
+        },
+    )
+    calls = []
+    real_upstream = exposures_service._upstream_model_ids
+    monkeypatch.setattr(
+        exposures_service,
+        "_upstream_model_ids",
+        lambda manifest, uid, memo: calls.append(uid)
+        or real_upstream(manifest, uid, memo),
+    )
+
+    first = exposures_service.get_exposures()
+    second = exposures_service.get_exposures()
+
+    assert first == second
+    assert calls == ["model.shop.fct_orders"]
+
+
+def test_memoized_upstream_walk_matches_bfs():
+    from trellis_datamodel.services import exposures as exposures_service
+
+    def node(*deps):
+        return {"depends_on": {"nodes": list(deps)}}
+
+    manifest = {
+        "nodes": {
+            "model.p.mart": node("model.p.int_a", "model.p.int_b"),
+            "model.p.int_a": node("model.p.stg", "seed.p.lookup"),
+            "model.p.int_b": node("model.p.stg"),
+            "model.p.stg": node("source.p.raw.orders"),
+            "seed.p.lookup": node("model.p.ref_data"),
+            "model.p.ref_data": node(),
+            # A (malformed) cycle must not break the walk
+            "model.p.loop_a": node("model.p.loop_b"),
+            "model.p.loop_b": node("model.p.loop_a", "model.p.stg"),
+        }
+    }
+    memo: dict = {}
+
+    for unique_id in [*manifest["nodes"], "model.p.unknown", "source.p.raw.orders"]:
+        expected = exposures_service._collect_upstream_model_ids(manifest, unique_id)
+        result = exposures_service._upstream_model_ids(manifest, unique_id, memo)
+        assert result == expected
+
+    assert memo["model.p.mart"] == {
+        "model.p.mart",
+        "model.p.int_a",
+        "model.p.int_b",
+        "model.p.stg",
+        "model.p.ref_data",
+    }
+
+
+def test_exposures_yml_is_cached_in_memory_without_sidecar(monkeypatch, tmp_path):
+    from trellis_datamodel.utils import yaml_io, yaml_sidecar
+
+    exposures_service, _ = _service_project(tmp_path, monkeypatch)
+    exposures_path = tmp_path / "exposures.yml"
+    exposures_path.write_text(
+        "exposures:\n  - name: weekly_report\n    depends_on: [\"ref('stg_orders')\"]\n"
+    )
+
+    first = exposures_service.get_exposures()
+    # Nothing is written into the user's dbt project
+    assert not Path(yaml_sidecar.sidecar_path(str(exposures_path))).exists()
+
+    calls = []
+    monkeypatch.setattr(yaml_io, "safe_load", lambda stream: calls.append(1))
+
+    assert exposures_service.get_exposures() == first
+    assert calls == []
+
+
+def test_find_exposures_file_prefers_root_then_models(tmp_path):
+    from trellis_datamodel.services.exposures import _find_exposures_file
+    from trellis_datamodel.utils.path_validation import clear_path_exists_cache
+
+    assert _find_exposures_file(str(tmp_path)) is None
+
+    (tmp_path / "models").mkdir()
+    nested = tmp_path / "models" / "exposures.yml"
+    nested.write_text("exposures: []\n")
+    clear_path_exists_cache()
+    assert _find_exposures_file(str(tmp_path)) == str(nested)
+
+    root = tmp_path / "exposures.yml"
+    root.write_text("exposures: []\n")
+    clear_path_exists_cache()
+    assert _find_exposures_file(str(tmp_path)) == str(root)
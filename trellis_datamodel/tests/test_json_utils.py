@@ -0,0 +1,33 @@
+"""Tests for the JSON helpers, run against both available backends."""
+
+import pytest
+
+from trellis_datamodel.utils import json_utils
+
+
+def test_dumps_is_compact_utf8(json_backend):
+    payload = {"label": "Größe", "items": [1, 2.5, True, None], "nested": {}}
+
+    assert json_utils.dumps(payload) == (
+        '{"label":"Größe","items":[1,2.5,true,null],"nested":{}}'.encode("utf-8")
+    )
+
+
+def test_dumps_keeps_key_order(json_backend):
+    assert json_utils.dumps({"b": 1, "a": 2}) == b'{"b":1,"a":2}'
+
+
+@pytest.mark.parametrize("document", [b'{"a":[1,"x"]}', '{"a":[1,"x"]}'])
+def test_loads_accepts_bytes_and_str(json_backend, document):
+    assert json_utils.loads(document) == {"a": [1, "x"]}
+
+
+def test_loads_round_trips_dumps(json_backend):
+    payload = {"entities": [{"id": "orders", "position": {"x": -1.25, "y": 0}}]}
+
+    assert json_utils.loads(json_utils.dumps(payload)) == payload
+
+
+def test_invalid_document_raises_value_error(json_backend):
+    with pytest.raises(ValueError):
+        json_utils.loads(b"{not json")
@@ -28,3 +28,35 @@ def test_lineage_succeeds_when_enabled(monkeypatch, test_client, mock_manifest):
     assert "nodes" in data
     assert "edges" in data
     assert "metadata" in data
+
+
+def test_bulk_source_extraction_matches_single_model(tmp_path, mock_manifest_data):
+    import json
+    from trellis_datamodel.services.lineage import (
+        extract_source_systems_for_model,
+        extract_source_systems_for_models,
+    )
+
+    manifest = dict(mock_manifest_data)
+    manifest["nodes"]["model.project.orders"]["depends_on"] = {
+        "nodes": ["model.project.users", "source.project.shop.orders"]
+    }
+    manifest["nodes"]["model.project.users"]["depends_on"] = {
+        "nodes": ["source.project.crm.users"]
+    }
+    manifest["sources"] = {
+        "source.project.shop.orders": {"source_name": "shop"},
+        "source.project.crm.users": {"source_name": "crm"},
+    }
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest))
+    model_ids = ["model.project.orders", "model.project.users", "model.project.missing"]
+
+    bulk = extract_source_systems_for_models(str(manifest_path), None, model_ids)
+
+    assert bulk == {
+        model_id: extract_source_systems_for_model(str(manifest_path), None, model_id)
+        for model_id in model_ids
+    }
+    assert bulk["model.project.orders"] == ["crm", "shop"]
+    assert bulk["model.project.missing"] == []
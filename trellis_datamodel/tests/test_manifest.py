@@ -17,6 +17,36 @@ class TestGetConfigStatus:
         assert data["manifest_exists"] is True
         assert "dbt_project_path" in data
 
+    def test_reflects_config_changes_after_cached_response(
+        self, test_client, mock_manifest, monkeypatch
+    ):
+        assert test_client.get("/api/config-status").json()["error"] is None
+
+        import sys
+        config_module = sys.modules["trellis_datamodel.config"]
+        monkeypatch.setattr(config_module, "DBT_PROJECT_PATH", "")
+        data = test_client.get("/api/config-status").json()
+
+        assert data["dbt_project_path"] == ""
+        assert data["error"] == "dbt_project_path not set in config."
+
+    def test_existence_probes_are_reused_within_a_second(
+        self, test_client, temp_dir, monkeypatch
+    ):
+        from trellis_datamodel.utils import path_validation
+
+        now = [100.0]
+        monkeypatch.setattr(path_validation.time, "monotonic", lambda: now[0])
+        path = os.path.join(temp_dir, "late_manifest.json")
+        assert path_validation.path_exists_cached(path) is False
+
+        with open(path, "w") as f:
+            f.write("{}")
+
+        assert path_validation.path_exists_cached(path) is False
+        now[0] += 1
+        assert path_validation.path_exists_cached(path) is True
+
 
 class TestGetConfigInfo:
     """Tests for GET /api/config-info endpoint."""
@@ -47,6 +77,37 @@ class TestGetConfigInfo:
         data = response.json()
         assert data["bus_matrix_enabled"] is True
 
+    def test_resolves_model_paths(self, test_client, temp_dir, monkeypatch):
+        import sys
+        config_module = sys.modules["trellis_datamodel.config"]
+        monkeypatch.setattr(config_module, "DBT_PROJECT_PATH", temp_dir)
+        monkeypatch.setattr(
+            config_module, "DBT_MODEL_PATHS", ["3_core", "models/3_core", "./4_mart"]
+        )
+
+        first = test_client.get("/api/config-info").json()
+        second = test_client.get("/api/config-info").json()
+
+        expected = [
+            os.path.join(temp_dir, "models", "3_core"),
+            os.path.join(temp_dir, "models", "4_mart"),
+        ]
+        assert first["model_paths_resolved"] == expected
+        assert second["model_paths_resolved"] == expected
+
+    def test_guidance_is_exposed_under_both_keys(self, test_client, monkeypatch):
+        import sys
+        from trellis_datamodel.config import GuidanceConfig
+        config_module = sys.modules["trellis_datamodel.config"]
+        guidance = GuidanceConfig(min_description_length=25, disabled_guidance=["push"])
+        monkeypatch.setattr(config_module, "GUIDANCE_CONFIG", guidance)
+
+        data = test_client.get("/api/config-info").json()
+
+        assert data["guidance"] == data["entity_creation_guidance"]
+        assert data["guidance"]["min_description_length"] == 25
+        assert data["guidance"]["disabled_guidance"] == ["push"]
+
     def test_label_prefixes_reflect_entity_modeling(self, test_client, monkeypatch):
         import sys
         config_module = sys.modules["trellis_datamodel.config"]
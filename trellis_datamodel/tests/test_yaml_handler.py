@@ -36,6 +36,35 @@ class TestYamlHandlerFileOperations:
         handler.save_file(nested_path, data)
         assert os.path.exists(nested_path)
 
+    def test_save_into_existing_directory_skips_makedirs(self, temp_dir, monkeypatch):
+        handler = YamlHandler()
+        file_path = os.path.join(temp_dir, "test.yml")
+        monkeypatch.setattr(
+            os, "makedirs", lambda *args, **kwargs: pytest.fail("makedirs called")
+        )
+
+        handler.save_file(file_path, {"version": 2})
+
+        assert handler.load_file(file_path)["version"] == 2
+
+    def test_concurrent_saves_do_not_share_temp_files(self, temp_dir):
+        from concurrent.futures import ThreadPoolExecutor
+
+        file_path = os.path.join(temp_dir, "concurrent", "test.yml")
+
+        # A ruamel YAML instance is not thread-safe, so each save gets its own
+        # handler, as each request does.
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(
+                pool.map(
+                    lambda i: YamlHandler().save_file(file_path, {"version": i}),
+                    range(32),
+                )
+            )
+
+        assert YamlHandler().load_file(file_path)["version"] in range(32)
+        assert os.listdir(os.path.dirname(file_path)) == ["test.yml"]
+
 
 class TestYamlHandlerModelOperations:
     """Test model-level operations."""
@@ -0,0 +1,64 @@
+"""Tests for the JSON sidecar cache of parsed YAML files."""
+
+import os
+
+import pytest
+
+from trellis_datamodel.utils import yaml_io, yaml_sidecar
+
+
+def _load_twice(path, monkeypatch):
+    """Load a YAML file cold, then again with YAML parsing disabled if possible."""
+    cold = yaml_sidecar.load_yaml(str(path))
+    if os.path.exists(yaml_sidecar.sidecar_path(str(path))):
+        monkeypatch.setattr(
+            yaml_io, "safe_load", lambda stream: pytest.fail("YAML was parsed")
+        )
+    warm = yaml_sidecar.load_yaml(str(path))
+    return cold, warm
+
+
+def test_warm_sidecar_returns_cold_parse(json_backend, tmp_path, monkeypatch):
+    path = tmp_path / "model.yml"
+    path.write_text(
+        "version: 0.1\n"
+        "entities:\n"
+        "  - id: orders\n"
+        "    label: Größe\n"
+        "    description:\n"
+        "    weight: 1.5\n"
+        "    tags: [a, b]\n",
+        encoding="utf-8",
+    )
+
+    cold, warm = _load_twice(path, monkeypatch)
+
+    assert os.path.exists(yaml_sidecar.sidecar_path(str(path)))
+    assert warm == cold
+    assert warm["entities"][0]["label"] == "Größe"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "1: x\n",
+        "when: 2024-01-01\n",
+        "ratio: .nan\n",
+        "keys: !!set {a: null}\n",
+    ],
+)
+def test_documents_that_do_not_round_trip_get_no_sidecar(
+    json_backend, tmp_path, monkeypatch, text
+):
+    path = tmp_path / "odd.yml"
+    path.write_text(text)
+
+    cold, warm = _load_twice(path, monkeypatch)
+
+    assert not os.path.exists(yaml_sidecar.sidecar_path(str(path)))
+    assert repr(warm) == repr(cold)
+
+
+def test_round_trips_rejects_non_string_keys_in_nested_lists():
+    assert yaml_sidecar._round_trips({"a": [{"b": [1, "c", None, True]}]})
+    assert not yaml_sidecar._round_trips({"a": [{1: "x"}]})
@@ -0,0 +1,50 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed (the ``fast`` extra) and falls back to the
+standard library json module otherwise, so callers always get bytes back from
+``dumps``. Both backends give the same result for plain JSON data: dicts with
+str keys, lists, strings, finite numbers, booleans and None. Anything else
+(non-str keys, NaN, dates) is handled differently and must not be passed in.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact JSON bytes.
+
+    Args:
+        obj: JSON-compatible object (dicts, lists, strings, numbers, ...)
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
@@ -4,13 +4,44 @@ Path validation utilities for trellis.yml and dbt project paths.
 Centralizes validation logic to avoid duplication across routes and services.
 """
 
+import functools
 import os
+import time
 from pathlib import Path
 
 from trellis_datamodel import config as cfg
 from trellis_datamodel.exceptions import ConfigurationError, FileOperationError, ValidationError
 
 
+@functools.lru_cache(maxsize=32)
+def _exists_in_bucket(path: str, bucket: int) -> bool:
+    """Memoized os.path.exists; ``bucket`` is the current whole second."""
+    return os.path.exists(path)
+
+
+def path_exists_cached(path: str | None) -> bool:
+    """
+    Check whether a path exists, reusing the answer for up to one second.
+
+    Meant for status endpoints that are polled frequently, so a burst of
+    requests costs one stat() per path instead of one per request.
+
+    Args:
+        path: Path to check; empty values are reported as missing
+
+    Returns:
+        True if the path existed when last probed within the current second
+    """
+    if not path:
+        return False
+    return _exists_in_bucket(path, int(time.monotonic()))
+
+
+def clear_path_exists_cache() -> None:
+    """Forget all cached existence probes."""
+    _exists_in_bucket.cache_clear()
+
+
 def validate_dbt_project_path() -> str:
     """
     Validate that dbt_project_path is configured and exists.
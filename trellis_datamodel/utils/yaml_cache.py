@@ -0,0 +1,81 @@
+"""
+In-process cache of parsed YAML files.
+
+Files such as data_model.yml and canvas_layout.yml are read on every GET but
+only change when they are saved. Parsed contents are kept per path and
+validated against the file's (st_mtime_ns, st_size) signature, so edits made
+outside the server are still picked up. Misses go through the file's JSON
+sidecar (see yaml_sidecar) unless the caller opts out, so a restarted server
+does not re-parse the same YAML. Callers get a deep copy and may mutate it
+freely, unless they ask for the shared, read-only instance.
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from trellis_datamodel.utils import yaml_io, yaml_sidecar
+
+_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_MAX_ENTRIES = 100
+
+
+def load_yaml_cached(path: str, shared: bool = False, sidecar: bool = True) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Args:
+        path: Path to the YAML file
+        shared: Return the cached document itself instead of a deep copy.
+            Only for callers that never mutate the result (or copy exactly
+            the parts they change).
+        sidecar: Read and write the file's JSON sidecar on a miss. Pass False
+            for files in third-party projects (e.g. a dbt project's
+            exposures.yml), which should not get hidden files written next
+            to them; those are only cached in memory.
+
+    Returns:
+        Parsed document, deep-copied unless ``shared`` (None for an empty file)
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _CACHE_LOCK:
+        cached = _CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            _CACHE.move_to_end(path)
+            return cached[1] if shared else copy.deepcopy(cached[1])
+
+    if sidecar:
+        data = yaml_sidecar.load_yaml(path, signature)
+    else:
+        with open(path, "rb") as f:
+            data = yaml_io.safe_load(f.read())
+
+    with _CACHE_LOCK:
+        _CACHE[path] = (signature, data)
+        _CACHE.move_to_end(path)
+        while len(_CACHE) > _CACHE_MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+    return data if shared else copy.deepcopy(data)
+
+
+def invalidate(path: Optional[str] = None) -> None:
+    """
+    Drop the cached parse of one file, or of all files when omitted.
+
+    Args:
+        path: Path to forget; clears the whole cache if None
+    """
+    with _CACHE_LOCK:
+        if path is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(path, None)
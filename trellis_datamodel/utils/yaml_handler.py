@@ -4,6 +4,7 @@ Preserves comments, formatting, and structure while allowing updates.
 """
 
 import os
+import threading
 from typing import Dict, List, Optional, Any
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
@@ -51,13 +52,17 @@ class YamlHandler:
             file_path: Path to the YAML file
             data: YAML data to save
         """
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-        # Write atomically using a temp file
-        temp_path = f"{file_path}.tmp"
+        # Write atomically using a temp file. The name is unique per thread so
+        # concurrent saves of the same file never share (and clobber) a temp file.
+        temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
         try:
-            with open(temp_path, "w") as f:
+            try:
+                f = open(temp_path, "w")
+            except FileNotFoundError:
+                # The directory almost always exists; only create it on demand
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                f = open(temp_path, "w")
+            with f:
                 self.yaml.dump(data, f)
             os.replace(temp_path, file_path)
         except Exception as e:
@@ -0,0 +1,33 @@
+"""
+Fast PyYAML helpers for plain (non round-trip) YAML files.
+
+Uses the LibYAML-backed C loader when PyYAML was built with it and falls
+back to the pure-Python implementation otherwise. Writing and round-trip
+editing of dbt schema files is handled by YamlHandler (ruamel.yaml) instead.
+"""
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader
+
+    LIBYAML_AVAILABLE = False
+
+
+def safe_load(stream: Any) -> Any:
+    """
+    Parse YAML with the fastest available safe loader.
+
+    Args:
+        stream: YAML string, bytes, or open file
+
+    Returns:
+        Parsed Python object
+    """
+    return yaml.load(stream, Loader=SafeLoader)
@@ -0,0 +1,155 @@
+"""
+JSON sidecar caches for YAML files.
+
+Parsing YAML is far slower than decoding JSON, so a parsed YAML document can
+be stored next to its source as ``.<name>.cache.json``. The sidecar records the
+(st_mtime_ns, st_size) signature of the YAML file it was built from and is
+only used while that signature still matches, so hand edits to the YAML file
+are always picked up. Sidecars are best-effort: failures to read or write them
+are ignored and callers fall back to parsing the YAML.
+"""
+
+import logging
+import math
+import os
+from typing import Any, Optional, Tuple
+
+from trellis_datamodel.utils import json_utils, yaml_io
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = ".cache.json"
+
+
+def sidecar_path(path: str) -> str:
+    """Return the sidecar location for a YAML file (a hidden file beside it)."""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}{SIDECAR_SUFFIX}")
+
+
+def read_sidecar(path: str, signature: Tuple[int, int]) -> Optional[Any]:
+    """
+    Return the cached parse of a YAML file if its sidecar is current.
+
+    Args:
+        path: Path to the YAML source file
+        signature: Current (st_mtime_ns, st_size) of the YAML file
+
+    Returns:
+        Parsed document, or None if there is no usable sidecar
+    """
+    try:
+        with open(sidecar_path(path), "rb") as f:
+            payload = json_utils.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(payload, dict) or payload.get("source") != list(signature):
+        return None
+    return payload.get("data")
+
+
+def _round_trips(data: Any) -> bool:
+    """
+    Return True if ``data`` decodes from JSON exactly as it is now.
+
+    YAML allows non-string keys, dates, sets and non-finite floats, which JSON
+    encoders either reject or silently convert (``{1: 'x'}`` would come back
+    as ``{'1': 'x'}``). Such documents get no sidecar, so a load never depends
+    on whether the sidecar was used.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if value is None or isinstance(value, (str, bool, int)):
+            continue
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return False
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    return False
+                stack.append(item)
+        else:
+            return False
+    return True
+
+
+def write_sidecar(path: str, signature: Tuple[int, int], data: Any) -> None:
+    """
+    Store the parsed contents of a YAML file in its sidecar.
+
+    The sidecar is written to a temporary file and renamed into place so
+    concurrent readers never see a partial document.
+
+    Args:
+        path: Path to the YAML source file
+        signature: (st_mtime_ns, st_size) of the YAML file ``data`` came from
+        data: Parsed document; skipped unless it survives JSON unchanged
+    """
+    if not _round_trips(data):
+        return
+
+    target = sidecar_path(path)
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    try:
+        encoded = json_utils.dumps({"source": list(signature), "data": data})
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_path, target)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write YAML sidecar cache {target}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def remove_sidecar(path: str) -> None:
+    """
+    Delete the sidecar of a YAML file, if there is one.
+
+    Writers that do not refresh the sidecar must call this after replacing
+    the YAML file. A rewrite that keeps the size and lands within the
+    filesystem's mtime resolution would otherwise still match the old
+    sidecar's signature.
+    """
+    try:
+        os.remove(sidecar_path(path))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug(f"Could not remove YAML sidecar cache for {path}: {e}")
+
+
+def load_yaml(path: str, signature: Optional[Tuple[int, int]] = None) -> Any:
+    """
+    Parse a YAML file, preferring its sidecar and refreshing it on a miss.
+
+    Args:
+        path: Path to the YAML file
+        signature: (st_mtime_ns, st_size) of the file if the caller already
+            has it; otherwise the file is stat'ed here
+
+    Returns:
+        Parsed document (None for an empty file)
+
+    Raises:
+        OSError: If the YAML file cannot be read.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    if signature is None:
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+    data = read_sidecar(path, signature)
+    if data is None:
+        # Parse raw bytes read in one call: the (C) reader detects and decodes
+        # UTF-8 itself, without a text wrapper or chunked Python-level reads.
+        with open(path, "rb") as f:
+            data = yaml_io.safe_load(f.read())
+        write_sidecar(path, signature, data)
+    return data